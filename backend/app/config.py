@@ -8,7 +8,9 @@ Supports a runtime-settable API key that takes precedence over the .env value.
 from pathlib import Path
 from typing import Optional
 
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from sqlalchemy.engine import make_url
 
 
 # ---------------------------------------------------------------------------
@@ -41,6 +43,10 @@ def get_api_key() -> Optional[str]:
     return settings.GROQ_API_KEY
 
 
+# Values accepted for PASSWORD_HASH_ALGORITHM (see services.security).
+PASSWORD_HASH_ALGORITHMS = ("pbkdf2_sha256", "scrypt")
+
+
 # ---------------------------------------------------------------------------
 # Settings loaded from environment / .env
 # ---------------------------------------------------------------------------
@@ -51,7 +57,53 @@ class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite:///./data/skillsync.db"
     SKILLS_CSV_PATH: str = "./data/skills_data.csv"
     SCRAPE_ON_STARTUP: bool = True
-    SCRAPE_INTERVAL_HOURS: int = 24
+    SCRAPE_INTERVAL_HOURS: int = 24  # 0 disables the periodic scheduler
+    SCRAPE_JITTER_MINUTES: int = 30  # +/- random offset applied to each interval
+    SCRAPE_LEASE_TTL_MINUTES: int = 120  # a crashed worker's lease expires after this
+    SCRAPE_MAX_RETRIES: int = 2  # retries per page on network errors / 429 / 5xx
+    SCRAPE_RETRY_BACKOFF_SECONDS: float = 1.0  # wait before retry n is n times this (none in replay)
+    SCRAPE_HTTP_MODE: str = "live"  # live | record | replay
+    SCRAPE_FIXTURE_DIR: str = "./data/scrape_fixtures"
+    SCRAPE_REPLAY_LATENCY_MS: int = 0  # injected per-request delay in replay mode
+    SCRAPE_REPLAY_ERROR_RATE: float = 0.0  # fraction of replayed requests that fail
+    JOB_GENERATION_POLL_SECONDS: float = 5.0  # how stale a worker's view of the latest scrape may be
+    JOB_RESPONSE_CACHE_SIZE: int = 256  # rendered /api/jobs responses kept per worker
+    JOB_READ_MODEL: bool = False  # serve listings from an in-memory columnar snapshot
+    SQLITE_JOURNAL_MODE: str = "WAL"  # WAL lets readers run alongside a scrape's writes
+    SQLITE_SYNCHRONOUS: str = "NORMAL"  # fsync at checkpoints only (safe under WAL)
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024  # bytes of the file read through mmap; 0 disables
+    SQLITE_CACHE_SIZE_KB: int = 64 * 1024  # page cache per connection
+    SQLITE_TEMP_STORE: str = "MEMORY"  # temp tables / sort spills: DEFAULT | FILE | MEMORY
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000  # wait this long for a lock before "database is locked"
+    DB_POOL_SIZE: int = 5  # persistent connections per engine
+    DB_MAX_OVERFLOW: int = 10  # extra connections allowed under load
+    DB_POOL_TIMEOUT: float = 30.0  # seconds to wait for a free connection
+    DB_READ_POOL_SIZE: int = 10  # persistent connections of the read-only engine
+    SLOW_QUERY_MS: float = 100.0  # log statements slower than this
+    QUERY_REPEAT_THRESHOLD: int = 5  # same-shape statements per request flagged as N+1; 0 disables
+    # How long a verified token's user is reused; 0 disables.  Other workers
+    # only see a user's changes (role, deletion, profile) once this expires.
+    USER_CACHE_TTL_SECONDS: float = 5.0
+    USER_CACHE_SIZE: int = 10_000  # tokens cached per worker
+    PASSWORD_HASH_ALGORITHM: str = "pbkdf2_sha256"  # pbkdf2_sha256 | scrypt, for new and rehashed passwords
+    PASSWORD_PBKDF2_ITERATIONS: int = 100_000  # CPU cost per login; older hashes are upgraded on login
+    PASSWORD_SCRYPT_N: int = 2 ** 14  # scrypt CPU/memory cost (power of two)
+    PASSWORD_SCRYPT_R: int = 8
+    PASSWORD_SCRYPT_P: int = 1
+    PASSWORD_HASH_WORKERS: int = 4  # threads hashing passwords in parallel
+    PASSWORD_HASH_MAX_PENDING: int = 64  # running + queued hashes before logins get 503
+    LOGIN_THROTTLE_ENABLED: bool = True
+    LOGIN_THROTTLE_BACKEND: str = "memory"  # memory (per worker) | database (shared by all workers)
+    LOGIN_THROTTLE_WINDOW_SECONDS: float = 900.0  # sliding window for counting failed logins
+    LOGIN_MAX_FAILURES_PER_EMAIL: int = 5  # failures in the window before the account is locked out
+    LOGIN_MAX_FAILURES_PER_IP: int = 20  # failures in the window before the client IP is locked out
+    LOGIN_LOCKOUT_SECONDS: float = 60.0  # first lockout; doubles with each repeat
+    LOGIN_LOCKOUT_MAX_SECONDS: float = 3600.0
+    LOGIN_THROTTLE_MAX_KEYS: int = 100_000  # emails + IPs tracked per worker (memory backend)
+    LLM_MODEL: str = "meta-llama/llama-4-scout-17b-16e-instruct"
+    LLM_API_BASE: Optional[str] = None  # Groq-compatible endpoint; None uses Groq's default
+    LLM_TIMEOUT_SECONDS: float = 60.0
+    LLM_MAX_CONNECTIONS: int = 10  # pooled HTTPS connections to the LLM API per worker
     JWT_SECRET_KEY: str = "skillsync_secret_key_for_development_purposes_only"
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440  # 24 hours
@@ -62,6 +114,36 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
+    @field_validator("PASSWORD_HASH_ALGORITHM")
+    @classmethod
+    def _known_hash_algorithm(cls, value: str) -> str:
+        if value not in PASSWORD_HASH_ALGORITHMS:
+            raise ValueError(f"must be one of {', '.join(PASSWORD_HASH_ALGORITHMS)}")
+        return value
+
+    @field_validator("PASSWORD_SCRYPT_N")
+    @classmethod
+    def _scrypt_cost(cls, value: int) -> int:
+        if value <= 1 or value & (value - 1):
+            raise ValueError("must be a power of two greater than 1")
+        return value
+
+    @field_validator("DATABASE_URL")
+    @classmethod
+    def _not_in_memory(cls, value: str) -> str:
+        """
+        The sync, async and read-only engines each open their own
+        connections, so an in-memory SQLite database would be a different,
+        empty database for each of them.
+        """
+        url = make_url(value)
+        database = url.database or ""
+        if url.get_backend_name() == "sqlite" and (
+            database in ("", ":memory:") or url.query.get("mode") == "memory" or "mode=memory" in database
+        ):
+            raise ValueError("in-memory SQLite is not supported; use a file, e.g. sqlite:///./data/test.db")
+        return value
+
 
 # Singleton instance — import `settings` wherever needed.
 settings = Settings()
@@ -1,16 +1,101 @@
 """
-Database engine, session factory, and FastAPI dependency.
+Database engines, session factories, and FastAPI dependencies.
 
 Uses SQLAlchemy with SQLite. The ``create_tables`` helper is called once
 during application startup to ensure every model table exists.
+
+Two access paths share the same database:
+  * ``engine`` / ``SessionLocal`` / ``get_db`` — synchronous, for sync route
+    handlers, background scrapes and scripts;
+  * ``async_engine`` / ``AsyncSessionLocal`` / ``get_async_db`` — asyncio
+    (aiosqlite), for ``async def`` route handlers, so queries never block
+    the event loop;
+  * ``async_read_engine`` / ``AsyncReadSessionLocal`` / ``get_async_read_db``
+    — a separate, read-only asyncio pool for GET routes, so listing traffic
+    never waits for a connection held by a write.
+
+Every SQLite connection gets the ``SQLITE_*`` performance profile (WAL
+journal, relaxed fsync, mmap, page cache, in-memory temp store, busy
+timeout) from a ``connect`` event.  Under WAL a scrape's write transaction
+no longer blocks readers.
+
+Every engine also reports each executed statement to
+``app.services.query_stats`` for per-request query counts, the slow-query
+log and N+1 detection.
 """
 
-from typing import Generator
+import time
+from typing import Any, AsyncGenerator, Dict, Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from app.config import settings
+from app.services import query_stats
+from app.services.job_search import ensure_search_index
+
+# ---------------------------------------------------------------------------
+# SQLite performance profile & pooling
+# ---------------------------------------------------------------------------
+def _sqlite_pragmas(read_only: bool = False) -> Dict[str, Any]:
+    """PRAGMAs applied to every new SQLite connection, in order."""
+    pragmas: Dict[str, Any] = {}
+    if not read_only:
+        # The journal mode is stored in the database file; writers set it.
+        pragmas["journal_mode"] = settings.SQLITE_JOURNAL_MODE
+    pragmas.update(
+        synchronous=settings.SQLITE_SYNCHRONOUS,
+        mmap_size=int(settings.SQLITE_MMAP_SIZE),
+        cache_size=-int(settings.SQLITE_CACHE_SIZE_KB),  # negative = KiB, not pages
+        temp_store=settings.SQLITE_TEMP_STORE,
+        busy_timeout=int(settings.SQLITE_BUSY_TIMEOUT_MS),
+    )
+    if read_only:
+        pragmas["query_only"] = "ON"
+    return pragmas
+
+
+def _apply_sqlite_profile(target: Engine, read_only: bool = False) -> None:
+    """Run the SQLite PRAGMAs on each connection ``target`` opens."""
+    if target.dialect.name != "sqlite":
+        return
+    pragmas = _sqlite_pragmas(read_only)
+
+    @event.listens_for(target, "connect")
+    def _set_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def _instrument_queries(target: Engine) -> None:
+    """Time every statement ``target`` executes and report it to ``query_stats``."""
+
+    @event.listens_for(target, "before_cursor_execute")
+    def _before(conn: Any, cursor: Any, statement: str, parameters: Any,
+                context: Any, executemany: bool) -> None:
+        context._query_started = time.perf_counter()
+
+    @event.listens_for(target, "after_cursor_execute")
+    def _after(conn: Any, cursor: Any, statement: str, parameters: Any,
+               context: Any, executemany: bool) -> None:
+        elapsed_ms = (time.perf_counter() - context._query_started) * 1000
+        query_stats.record(statement, parameters, executemany, elapsed_ms)
+
+
+def _pool_args(pool_size: int) -> Dict[str, Any]:
+    """Queue-pool sizing.  ``DATABASE_URL`` is never in-memory (see ``Settings``)."""
+    return {
+        "pool_size": pool_size,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    }
+
 
 # ---------------------------------------------------------------------------
 # Engine & session
@@ -19,7 +104,10 @@ engine = create_engine(
     settings.DATABASE_URL,
     connect_args={"check_same_thread": False},  # required for SQLite
     echo=False,
+    **_pool_args(settings.DB_POOL_SIZE),
 )
+_apply_sqlite_profile(engine)
+_instrument_queries(engine)
 
 SessionLocal = sessionmaker(autocommit=False
                             , autoflush=False
@@ -27,6 +115,51 @@ SessionLocal = sessionmaker(autocommit=False
                             # we are creating session for about engine
                             )
 
+# Sync drivers and their asyncio counterparts.
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+}
+
+
+def async_database_url(url: str) -> str:
+    """Return ``url`` with its driver swapped for an asyncio one."""
+    parsed = make_url(url)
+    driver = _ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+async_engine = create_async_engine(
+    async_database_url(settings.DATABASE_URL),
+    echo=False,
+    **_pool_args(settings.DB_POOL_SIZE),
+)
+_apply_sqlite_profile(async_engine.sync_engine)
+_instrument_queries(async_engine.sync_engine)
+
+async_read_engine = create_async_engine(
+    async_database_url(settings.DATABASE_URL),
+    echo=False,
+    **_pool_args(settings.DB_READ_POOL_SIZE),
+)
+_apply_sqlite_profile(async_read_engine.sync_engine, read_only=True)
+_instrument_queries(async_read_engine.sync_engine)
+
+# expire_on_commit=False: attributes stay readable after commit without an
+# implicit (and, under asyncio, forbidden) lazy refresh.
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+AsyncReadSessionLocal = async_sessionmaker(
+    bind=async_read_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 Base = declarative_base()
 
 
@@ -36,6 +169,32 @@ Base = declarative_base()
 def create_tables() -> None:
     """Create all tables that don't yet exist in the database."""
     Base.metadata.create_all(bind=engine)
+    _upgrade_existing_tables()
+    ensure_search_index(engine)
+
+
+def _upgrade_existing_tables() -> None:
+    """
+    Add nullable columns and indexes introduced after a table was first created.
+
+    ``create_all`` never alters existing tables, so databases created by an
+    older version would otherwise lack new columns and indexes.
+    """
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {col["name"] for col in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                col_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(
+                    f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {col_type}'
+                ))
+            for index in table.indexes:
+                index.create(bind=conn, checkfirst=True)
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -45,3 +204,15 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency that provides an asyncio database session per request."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency for GET routes: a session on the read-only pool."""
+    async with AsyncReadSessionLocal() as db:
+        yield db
@@ -1,8 +1,9 @@
 """
 SkillSync API — FastAPI application entry-point.
 
-Sets up CORS, includes all routers, creates DB tables on startup, and
-optionally triggers an initial background scrape.
+Sets up CORS and per-request query instrumentation, includes all routers,
+creates DB tables on startup, and starts the periodic background scrape
+scheduler.
 """
 
 import logging
@@ -11,12 +12,16 @@ from typing import AsyncIterator
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from app.config import settings
 from app.database import SessionLocal, create_tables
-from app.routes import auth, jobs, resume,profile, settings as settings_routes, skills 
-from app.services.job_scraper import scrape_and_store_jobs
+from app.routes import analytics, auth, jobs, metrics, resume,profile, settings as settings_routes, skills 
+from app.services import job_snapshot, llm_client, metrics as metrics_service, query_stats
+from app.services.job_cache import current_generation
+from app.services.job_facets import backfill_facet_counts
+from app.services.scrape_scheduler import start_scheduler, stop_scheduler
+from app.services.user_skills import backfill_user_skills
 
 # ---------------------------------------------------------------------------
 # Logging configuration
@@ -37,35 +42,33 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     Application lifespan hook.
 
     On startup:
-      1. Create database tables (if they don't exist).
-      2. Optionally trigger an initial scrape (controlled by SCRAPE_ON_STARTUP).
+      1. Create database tables (if they don't exist), and fill
+         ``user_skills`` and ``job_facet_counts`` from existing rows on
+         first run.
+      2. Load the in-memory job read model, when JOB_READ_MODEL is set.
+      3. Start the periodic scrape scheduler (SCRAPE_INTERVAL_HOURS).  The
+         first run happens immediately when SCRAPE_ON_STARTUP is set and the
+         jobs table is empty.
+
+    On shutdown the scheduler is stopped and the pooled LLM connections are
+    closed.
     """
     logger.info("SkillSync API starting up …")
     create_tables()
+    with SessionLocal() as db:
+        backfill_user_skills(db)
+        backfill_facet_counts(db)
     logger.info("Database tables verified.")
 
-    # if settings.SCRAPE_ON_STARTUP:
-    #     # Check whether we already have jobs — only scrape if the DB is empty
-    #     db = SessionLocal()
-    #     try:
-    #         from app.models import Job
-
-    #         job_count = db.query(Job).count()
-    #         if job_count == 0:
-    #             logger.info("No jobs in database — running initial scrape …")
-    #             scrape_and_store_jobs(db)
-    #         else:
-    #             logger.info(
-    #                 "Database already contains %d jobs — skipping startup scrape.",
-    #                 job_count,
-    #             )
-    #     except Exception as exc:
-    #         logger.error("Startup scrape failed: %s", exc)
-    #     finally:
-    #         db.close()
+    if job_snapshot.enabled():
+        job_snapshot.refresh_in_background(current_generation())
+
+    scheduler_task = start_scheduler()
 
     yield  # application is running
 
+    await stop_scheduler(scheduler_task)
+    llm_client.close()
     logger.info("SkillSync API shutting down.")
 
 
@@ -98,6 +101,33 @@ app.add_middleware(
 )
 
 
+# ---------------------------------------------------------------------------
+# Query instrumentation
+# ---------------------------------------------------------------------------
+@app.middleware("http")
+async def instrument_queries(request: Request, call_next) -> Response:
+    """
+    Count the SQL statements a request runs and the time spent in them.
+
+    The totals are returned in ``X-DB-Queries`` and ``Server-Timing``
+    headers and added to the per-route statistics of ``/api/metrics``.
+    """
+    stats, token = query_stats.begin()
+    try:
+        response = await call_next(request)
+    finally:
+        query_stats.end(token)
+
+    route = getattr(request.scope.get("route"), "path", "<unmatched>")
+    request_line = f"{request.method} {route}"
+    repeated = query_stats.report_repeats(stats, request_line)
+    metrics_service.observe_request(request_line, stats.count, stats.total_ms, repeated)
+
+    response.headers["X-DB-Queries"] = str(stats.count)
+    response.headers["Server-Timing"] = f"db;dur={stats.total_ms:.2f}"
+    return response
+
+
 # ---------------------------------------------------------------------------
 # Routers
 # ---------------------------------------------------------------------------
@@ -107,6 +137,8 @@ app.include_router(jobs.router)
 app.include_router(skills.router)
 app.include_router(profile.router)
 app.include_router(settings_routes.router)
+app.include_router(metrics.router)
+app.include_router(analytics.router)
 
 
 # ---------------------------------------------------------------------------
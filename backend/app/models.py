@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import List, Optional
 
 
-from sqlalchemy import Column, DateTime, Integer, String, Text ,Float,JSON,ForeignKey
+from sqlalchemy import Column, DateTime, Index, Integer, String, Table, Text ,Float,JSON,ForeignKey
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -29,6 +29,37 @@ class Job(Base):  # type: ignore[misc]
     experience: str = Column(String(100), nullable=False, default="Fresher")
     link: str = Column(Text, nullable=False, default="")
     scraped_at: datetime = Column(DateTime, server_default=func.now(), nullable=False)
+    # Shared by near-duplicate postings of the same opening (see job_dedupe).
+    cluster_id: Optional[str] = Column(String(16), nullable=True, index=True)
+    # Skill keyword ids (see skills_db.keyword_catalog) and the catalog version they refer to.
+    keyword_ids: Optional[list] = Column(JSON, nullable=True)
+    keyword_catalog: Optional[str] = Column(String(12), nullable=True)
+
+    # Access paths for GET /api/jobs: every listing is ordered by
+    # (scraped_at DESC, id DESC), optionally after equality filters.  SQLite
+    # appends the rowid to each index, so these also cover the id tie-break.
+    __table_args__ = (
+        Index("ix_jobs_scraped_at", "scraped_at"),
+        Index("ix_jobs_category_scraped_at", "category", "scraped_at"),
+        Index("ix_jobs_category_experience_scraped_at", "category", "experience", "scraped_at"),
+        Index("ix_jobs_experience_scraped_at", "experience", "scraped_at"),
+        Index("ix_jobs_platform_scraped_at", "platform", "scraped_at"),
+    )
+
+
+class StagedJob(Base):  # type: ignore[misc]
+    """
+    A job written by the scrape in progress.  The run's rows are copied into
+    ``jobs`` in the transaction that publishes it, so readers never see a
+    partial run.
+    """
+
+    # Same columns as ``jobs``, without its listing indexes.
+    __table__ = Table(
+        "jobs_staging",
+        Base.metadata,
+        *(column._copy() for column in Job.__table__.columns),
+    )
     
 
 class ScrapeStatus(Base):  # type: ignore[misc]
@@ -43,6 +74,62 @@ class ScrapeStatus(Base):  # type: ignore[misc]
     status: str = Column(String(20), nullable=False, default="running")  # running | completed | failed
     error_message: Optional[str] = Column(Text, nullable=True)
 
+
+class ScrapePageMetric(Base):  # type: ignore[misc]
+    """Per-page telemetry recorded during a scraping run."""
+
+    __tablename__ = "scrape_page_metrics"
+
+    id: int = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    scrape_id: int = Column(Integer, ForeignKey("scrape_status.id"), nullable=False, index=True)
+    platform: str = Column(String(50), nullable=False)
+    page: int = Column(Integer, nullable=False)
+    url: str = Column(Text, nullable=False, default="")
+    status_code: Optional[int] = Column(Integer, nullable=True)  # None = no response
+    retries: int = Column(Integer, nullable=False, default=0)
+    latency_ms: float = Column(Float, nullable=False, default=0)
+    bytes: int = Column(Integer, nullable=False, default=0)
+    parse_ms: float = Column(Float, nullable=False, default=0)
+    cards_found: int = Column(Integer, nullable=False, default=0)
+    rows_written: int = Column(Integer, nullable=False, default=0)
+    write_ms: float = Column(Float, nullable=False, default=0)
+    error: Optional[str] = Column(Text, nullable=True)
+
+
+class ScrapeLease(Base):  # type: ignore[misc]
+    """Shared schedule + lease row that elects one worker to run periodic scrapes."""
+
+    __tablename__ = "scrape_lease"
+
+    name: str = Column(String(50), primary_key=True)
+    holder: Optional[str] = Column(String(255), nullable=True)
+    expires_at: Optional[datetime] = Column(DateTime, nullable=True)
+    next_run_at: datetime = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+class JobFacetCount(Base):  # type: ignore[misc]
+    """Job count per (category, platform, experience), rebuilt after each scrape."""
+
+    __tablename__ = "job_facet_counts"
+
+    id: int = Column(Integer, primary_key=True, autoincrement=True)
+    category: str = Column(String(100), nullable=False)
+    platform: str = Column(String(50), nullable=False)
+    experience: str = Column(String(100), nullable=False)
+    job_count: int = Column(Integer, nullable=False, default=0)
+
+
+class LoginThrottleState(Base):  # type: ignore[misc]
+    """Recent failed logins of one email or client IP, when throttling is shared via the DB."""
+
+    __tablename__ = "login_throttle"
+
+    key: str = Column(String(80), primary_key=True)
+    failures: list = Column(JSON, nullable=False, default=list)  # epoch seconds, oldest first
+    strikes: int = Column(Integer, nullable=False, default=0)
+    locked_until: float = Column(Float, nullable=False, default=0.0)
+    updated_at: float = Column(Float, nullable=False, index=True)
+
+
 class UserProfile(Base):
     """Represents the profile info of a user"""
 
@@ -65,6 +152,49 @@ class UserProfile(Base):
     )
 
 
+class Skill(Base):  # type: ignore[misc]
+    """A distinct skill appearing on any user's profile."""
+
+    __tablename__ = "skills"
+
+    id: int = Column(Integer, primary_key=True, autoincrement=True)
+    name: str = Column(String(255), nullable=False, unique=True, index=True)  # normalised (preprocess_text)
+    display_name: str = Column(String(255), nullable=False)  # first spelling seen
+
+
+class UserSkill(Base):  # type: ignore[misc]
+    """One skill on one user's profile — the normalised form of ``UserProfile.skill_matrix``."""
+
+    __tablename__ = "user_skills"
+
+    user_id: int = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    skill_id: int = Column(Integer, ForeignKey("skills.id"), primary_key=True)
+
+    __table_args__ = (
+        # Per-skill lookups ("who has Docker?"); per-user ones use the primary key.
+        Index("ix_user_skills_skill_user", "skill_id", "user_id"),
+    )
+
+
+class AnalysisRecord(Base):  # type: ignore[misc]
+    """One resume analysis run by a signed-in user, kept for their history."""
+
+    __tablename__ = "analysis_records"
+
+    id: int = Column(Integer, primary_key=True, autoincrement=True)
+    # SQLite index entries end with the rowid, so this index also yields a
+    # user's records in id (= chronological) order without a sort.
+    user_id: int = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    created_at: datetime = Column(DateTime, server_default=func.now(), nullable=False)
+    source: str = Column(String(20), nullable=False)  # "resume", "linkedin" or "role"
+    role: str = Column(String(255), nullable=False)
+    score: float = Column(Float, nullable=False)
+    # Keyword ids (see skills_db.keyword_catalog) and the catalog version they refer to.
+    catalog_version: str = Column(String(12), nullable=False)
+    matched_ids: list = Column(JSON, nullable=False, default=list)
+    missing_ids: list = Column(JSON, nullable=False, default=list)
+
+
 # User Authentication Models & Schemas
 
 class User(Base):  # type: ignore[misc]
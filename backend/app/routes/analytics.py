@@ -0,0 +1,101 @@
+"""
+Admin skill analytics for SkillSync.
+
+GET /api/analytics/skills             -> Most common skills and how many users list each
+GET /api/analytics/skills/cohort      -> Count users having all of some skills and none of others
+GET /api/analytics/roles/{role}/gaps  -> Per-skill coverage of a role's keywords across users
+
+All aggregates run in SQL over the normalised ``user_skills`` table.
+"""
+
+import logging
+from typing import List, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func as sa_func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_async_read_db
+from app.models import UserSkill
+from app.schema import (
+    RoleSkillGap,
+    RoleSkillGapsResponse,
+    SkillCohortResponse,
+    SkillCountsResponse,
+    SkillUserCount,
+)
+from app.services.resume_parser import preprocess_text
+from app.services.skills_db import keyword_catalog
+from app.services.user_skills import cohort_size, role_skill_gaps, skill_user_counts
+
+from .auth import require_admin
+
+logger = logging.getLogger(__name__)
+router = APIRouter(
+    prefix="/api/analytics",
+    tags=["Analytics"],
+    dependencies=[Depends(require_admin)],
+)
+
+
+@router.get("/skills", response_model=SkillCountsResponse)
+async def top_skills(
+    limit: int = Query(50, ge=1, le=500, description="Number of skills to return"),
+    prefix: str = Query("", description="Only skills whose name starts with this"),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> SkillCountsResponse:
+    """Skills ordered by how many users list them."""
+    rows = await db.run_sync(skill_user_counts, limit, prefix)
+    users_with_skills = (await db.execute(
+        select(sa_func.count(sa_func.distinct(UserSkill.user_id)))
+    )).scalar_one()
+    return SkillCountsResponse(
+        users_with_skills=users_with_skills,
+        skills=[SkillUserCount(skill=skill, users=users) for skill, users in rows],
+    )
+
+
+@router.get("/skills/cohort", response_model=SkillCohortResponse)
+async def skill_cohort(
+    has: List[str] = Query([], description="Skills every counted user lists (repeatable)"),
+    lacks: List[str] = Query([], description="Skills no counted user lists (repeatable)"),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> SkillCohortResponse:
+    """e.g. ``?has=docker`` — how many users list Docker; ``?has=python&lacks=sql``."""
+    users, unknown = await db.run_sync(cohort_size, has, lacks)
+    return SkillCohortResponse(users=users, has=has, lacks=lacks, unknown_skills=unknown)
+
+
+@router.get("/roles/{role}/gaps", response_model=RoleSkillGapsResponse)
+async def role_gaps(
+    role: str,
+    cohort: Literal["target_role", "all"] = Query(
+        "target_role",
+        description="target_role: users whose profile targets this role; all: every user",
+    ),
+    limit: int = Query(50, ge=1, le=500, description="Number of skills to return"),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> RoleSkillGapsResponse:
+    """
+    For each skill / ATS keyword of ``role`` (from the skills CSV), how many
+    users in the cohort list it and how many lack it — most-missing first.
+    """
+    try:
+        catalog = keyword_catalog()
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=500, detail=str(exc))
+
+    keyword_ids = catalog.role_keywords.get(role.strip().lower())
+    if not keyword_ids:
+        raise HTTPException(status_code=404, detail=f"Unknown role: {role}")
+    required = {preprocess_text(catalog.keywords[i]): catalog.keywords[i] for i in keyword_ids}
+
+    size, gaps = await db.run_sync(
+        role_skill_gaps, required, role.strip() if cohort == "target_role" else None
+    )
+    return RoleSkillGapsResponse(
+        role=role,
+        cohort=cohort,
+        cohort_size=size,
+        skills=[RoleSkillGap(skill=s, have=h, missing=m) for s, h, m in gaps[:limit]],
+    )
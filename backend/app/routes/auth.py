@@ -1,45 +1,61 @@
 """
 Authentication routes for SkillSync.
 
-POST /api/auth/signup -> Register a new user
-POST /api/auth/login  -> Verify credentials and return JWT token
-GET  /api/auth/me     -> Retrieve the current user's profile
+POST /api/auth/signup       -> Register a new user
+POST /api/auth/login        -> Verify credentials and return JWT token
+GET  /api/auth/me           -> Retrieve the current user's profile
+GET  /api/auth/users        -> Cursor-paginated, filterable user listing (admins)
+GET  /api/auth/users/export -> Stream every matching user as NDJSON or CSV (admins)
 """
 
+import base64
+import csv
+import io
+import json
 import logging
-from sqlalchemy.orm import Session
-from fastapi import APIRouter, Depends, HTTPException, status
+import math
+from datetime import datetime
+from typing import Iterator, Literal, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
-from app.database import get_db
+from app.database import SessionLocal, get_async_db, get_async_read_db, get_db
 from app.schema import (
     UserCreate,
     UserLogin,
     UserResponse,
+    UserPageResponse,
     TokenResponse,
 )
 
 from app.models import User , UserProfile
 
+from app.services import login_throttle, user_cache
+from app.services.fast_json import USER_COLUMNS, USER_FIELDS, dumps, rows_to_dicts
 from app.services.security import (
-    hash_password,
-    verify_password,
+    HashingBusyError,
+    hash_password_async,
+    needs_rehash,
+    verify_password_async,
     create_access_token,
     decode_access_token,
 )
+from app.services.user_cache import UserSnapshot
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 
 security_scheme = HTTPBearer()
+optional_security_scheme = HTTPBearer(auto_error=False)
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
-    db: Session = Depends(get_db),
-) -> User:
-    """Dependency that extracts the JWT from the Authorization header and returns the User."""
-    token = credentials.credentials
+def _verify_token(token: str) -> Tuple[str, Optional[float]]:
+    """Validate the bearer token; return the email it was issued for and its expiry."""
     payload = decode_access_token(token)
     if not payload:
         raise HTTPException(
@@ -53,17 +69,89 @@ def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Session token format is invalid.",
         )
-    user = db.query(User).filter(User.email == email).first()
+    return email, payload.get("exp")
+
+
+def _cached_user(token: str, exp: Optional[float], user: Optional[User], load_marker: int) -> UserSnapshot:
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authenticated user account no longer exists.",
         )
-    return user
+    snapshot = UserSnapshot.from_user(user)
+    user_cache.put(token, exp, snapshot, load_marker)
+    return snapshot
+
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
+    db: Session = Depends(get_db),
+) -> UserSnapshot:
+    """
+    Dependency that extracts the JWT from the Authorization header and
+    returns the user, with profile, as a read-only ``UserSnapshot``.
+
+    Served from ``user_cache`` when the token was seen recently, otherwise
+    one joined user + profile query.  Routes that modify the user write to
+    it by id.
+    """
+    token = credentials.credentials
+    cached = user_cache.get(token)
+    if cached is not None:
+        return cached
+
+    email, exp = _verify_token(token)
+    load_marker = user_cache.begin_load()
+    user = (
+        db.query(User).options(joinedload(User.profile)).filter(User.email == email).first()
+    )
+    return _cached_user(token, exp, user, load_marker)
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> UserSnapshot:
+    """Async variant of ``get_current_user`` for ``async def`` routes."""
+    token = credentials.credentials
+    cached = user_cache.get(token)
+    if cached is not None:
+        return cached
+
+    email, exp = _verify_token(token)
+    load_marker = user_cache.begin_load()
+    result = await db.execute(
+        select(User).options(joinedload(User.profile)).where(User.email == email)
+    )
+    return _cached_user(token, exp, result.scalar_one_or_none(), load_marker)
+
+
+async def get_optional_user_async(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security_scheme),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> Optional[UserSnapshot]:
+    """
+    ``get_current_user_async`` for routes that also serve anonymous callers:
+    None without a bearer token, or when the token is no longer valid.
+    """
+    if credentials is None:
+        return None
+    try:
+        return await get_current_user_async(credentials, db)
+    except HTTPException:
+        return None
+
+
+def _hashing_unavailable() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many sign-ins in progress. Please try again shortly.",
+        headers={"Retry-After": "1"},
+    )
 
 
 @router.post("/signup", response_model=TokenResponse)
-async def signup(body: UserCreate, db: Session = Depends(get_db)) -> TokenResponse:
+async def signup(body: UserCreate, db: AsyncSession = Depends(get_async_db)) -> TokenResponse:
     """Create a new user account and return the initial JWT access token."""
     email = body.email.strip().lower()
     full_name = body.full_name.strip()
@@ -86,7 +174,9 @@ async def signup(body: UserCreate, db: Session = Depends(get_db)) -> TokenRespon
         )
         
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == email).first()
+    existing_user = (
+        await db.execute(select(User.id).where(User.email == email))
+    ).first()
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -94,7 +184,10 @@ async def signup(body: UserCreate, db: Session = Depends(get_db)) -> TokenRespon
         )
         
     # Hash password and store user
-    hashed = hash_password(password)
+    try:
+        hashed = await hash_password_async(password)
+    except HashingBusyError:
+        raise _hashing_unavailable()
     new_user = User(
         email=email,
         hashed_password=hashed,
@@ -102,8 +195,8 @@ async def signup(body: UserCreate, db: Session = Depends(get_db)) -> TokenRespon
         profile= UserProfile()
     )
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
     
     # Generate token
     token = create_access_token(data={"sub": new_user.email})
@@ -116,18 +209,52 @@ async def signup(body: UserCreate, db: Session = Depends(get_db)) -> TokenRespon
 
 
 @router.post("/login", response_model=TokenResponse)
-async def login(body: UserLogin, db: Session = Depends(get_db)) -> TokenResponse:
-    """Authenticate credentials and return a signed JWT token."""
+async def login(
+    request: Request, body: UserLogin, db: AsyncSession = Depends(get_async_db)
+) -> TokenResponse:
+    """
+    Authenticate credentials and return a signed JWT token.
+
+    Repeated failures lock out the email and the client IP for a while
+    (see ``login_throttle``); locked-out attempts get 429 before any
+    password hashing.
+    """
     email = body.email.strip().lower()
     password = body.password
-    
-    user = db.query(User).filter(User.email == email).first()
-    if not user or not verify_password(password, user.hashed_password):
+    client_ip = request.client.host if request.client else None
+
+    retry_after = await db.run_sync(login_throttle.check, email, client_ip)
+    if retry_after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many failed login attempts. Please try again later.",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+    user = (
+        await db.execute(select(User).where(User.email == email))
+    ).scalar_one_or_none()
+    try:
+        valid = bool(user) and await verify_password_async(password, user.hashed_password)
+    except HashingBusyError:
+        raise _hashing_unavailable()
+    if not valid:
+        await db.run_sync(login_throttle.record_failure, email, client_ip)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password.",
         )
-        
+    await db.run_sync(login_throttle.record_success, email)
+
+    if needs_rehash(user.hashed_password):
+        # Upgrade a hash stored with older parameters while the plain
+        # password is at hand.  Best effort: skipped when the pool is busy.
+        try:
+            user.hashed_password = await hash_password_async(password)
+            await db.commit()
+        except HashingBusyError:
+            pass
+
     token = create_access_token(data={"sub": user.email})
     
     return TokenResponse(
@@ -138,37 +265,38 @@ async def login(body: UserLogin, db: Session = Depends(get_db)) -> TokenResponse
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_me(current_user: User = Depends(get_current_user)) -> UserResponse:
+async def get_me(current_user: UserSnapshot = Depends(get_current_user_async)) -> UserResponse:
     """Return the currently logged-in user's profile details."""
     return UserResponse.model_validate(current_user)
 
 
 @router.get("/is_admin")
-def isAdmin(current_user:User = Depends(get_current_user))-> bool:
+def isAdmin(current_user:UserSnapshot = Depends(get_current_user))-> bool:
     """Checks if the current user is admin or not"""
 
     isAdminCheck= "admin" in current_user.role
     return isAdminCheck
 
 @router.get("/is_user")
-def isUser(current_user:User = Depends(get_current_user))-> bool:
+def isUser(current_user:UserSnapshot = Depends(get_current_user))-> bool:
     """Checks if the current user is admin or not"""
     isUserCheck= "user" in current_user.role
     return isUserCheck
 
 
+def _users_response(db: Session, role: str) -> Response:
+    """All users with ``role`` as JSON, rendered straight from column tuples."""
+    rows = db.execute(select(*USER_COLUMNS).where(User.role == role).order_by(User.id))
+    return Response(dumps(rows_to_dicts(USER_FIELDS, rows)), media_type="application/json")
+
+
 @router.get("/get_all_users", response_model=list[UserResponse])
 def get_all_users(isAdmin:bool= Depends(isAdmin),db: Session=Depends(get_db)) ->list[UserResponse]:
 
     if(isAdmin):
 
         #command to fetch all the users
-        allUsers = list(db.query(User).filter(User.role == "user"))
-
-        if(len(allUsers)==0):
-            return []
-        else:
-            return allUsers
+        return _users_response(db, "user")
         
 
 @router.get("/get_all_admins", response_model=list[UserResponse])
@@ -176,12 +304,138 @@ def get_all_admind(isAdmin:bool= Depends(isAdmin),db: Session=Depends(get_db)) -
 
     if(isAdmin):
 
-        #command to fetch all the users
-        allAdmins = list(db.query(User).filter(User.role == "admin"))
+        #command to fetch all the admins
+        return _users_response(db, "admin")
+
+
+# ---------------------------------------------------------------------------
+# Admin user listing & export
+# ---------------------------------------------------------------------------
+EXPORT_BATCH_SIZE = 1000
+
+
+async def require_admin(
+    current_user: UserSnapshot = Depends(get_current_user_async),
+) -> UserSnapshot:
+    """Dependency that rejects non-admin users with 403."""
+    if "admin" not in current_user.role:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required.",
+        )
+    return current_user
 
-        if(len(allAdmins)==0):
-            return []
+
+def _encode_user_cursor(user_id: int) -> str:
+    """Opaque cursor pointing just past a user in id order."""
+    return base64.urlsafe_b64encode(json.dumps([user_id]).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_user_cursor(cursor: str) -> int:
+    """Inverse of ``_encode_user_cursor``; raises 400 on anything malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        (user_id,) = json.loads(base64.urlsafe_b64decode(padded))
+        return int(user_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor.")
+
+
+def _user_filters(
+    role: Optional[str],
+    created_after: Optional[datetime],
+    created_before: Optional[datetime],
+    email_prefix: Optional[str],
+) -> list:
+    """WHERE conditions shared by the listing and the export."""
+    conditions = []
+    if role:
+        conditions.append(User.role == role)
+    if created_after:
+        conditions.append(User.created_at >= created_after)
+    if created_before:
+        conditions.append(User.created_at < created_before)
+    if email_prefix:
+        # Emails are stored lowercased.  A range (rather than LIKE, which
+        # SQLite only optimises on NOCASE columns) uses the email index.
+        prefix = email_prefix.strip().lower()
+        conditions += [User.email >= prefix, User.email < prefix + "\uffff"]
+    return conditions
+
+
+@router.get("/users", response_model=UserPageResponse, dependencies=[Depends(require_admin)])
+async def list_users(
+    role: Optional[str] = Query(None, description="Only users with this role, e.g. 'user' or 'admin'"),
+    created_after: Optional[datetime] = Query(None, description="Created at or after this time"),
+    created_before: Optional[datetime] = Query(None, description="Created before this time"),
+    email_prefix: Optional[str] = Query(None, description="Email starts with (case-insensitive)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(100, ge=1, le=1000, description="Users per page"),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> Response:
+    """
+    List users in id order, one keyset page at a time.
+
+    Pass the returned ``next_cursor`` back as ``cursor`` for the next page;
+    it is null on the last page.
+    """
+    conditions = _user_filters(role, created_after, created_before, email_prefix)
+    if cursor:
+        conditions.append(User.id > _decode_user_cursor(cursor))
+
+    rows = (await db.execute(
+        select(*USER_COLUMNS).where(*conditions).order_by(User.id).limit(limit + 1)
+    )).all()
+    next_cursor = _encode_user_cursor(rows[limit - 1].id) if len(rows) > limit else None
+    payload = {"users": rows_to_dicts(USER_FIELDS, rows[:limit]), "next_cursor": next_cursor}
+    return Response(dumps(payload), media_type="application/json")
+
+
+def _export_users(conditions: list, fmt: str) -> Iterator[bytes]:
+    """
+    Yield the matching users in batches, from a session of its own.
+
+    ``yield_per`` streams rows from the database cursor instead of loading
+    the full result, so memory use does not depend on the number of users.
+    """
+    with SessionLocal() as db:
+        result = db.execute(
+            select(*USER_COLUMNS)
+            .where(*conditions)
+            .order_by(User.id)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        if fmt == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(USER_FIELDS)
+            for batch in result.partitions():
+                writer.writerows(
+                    (r.id, r.email, r.full_name, r.created_at.isoformat(), r.role) for r in batch
+                )
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+            if buffer.tell():
+                yield buffer.getvalue().encode("utf-8")
         else:
-            return allAdmins
+            for batch in result.partitions():
+                yield b"".join(dumps(row) + b"\n" for row in rows_to_dicts(USER_FIELDS, batch))
+
 
-    
\ No newline at end of file
+@router.get("/users/export", dependencies=[Depends(require_admin)])
+def export_users(
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="ndjson (one JSON object per line) or csv"),
+    role: Optional[str] = Query(None),
+    created_after: Optional[datetime] = Query(None),
+    created_before: Optional[datetime] = Query(None),
+    email_prefix: Optional[str] = Query(None),
+) -> StreamingResponse:
+    """Stream every matching user, in id order, as NDJSON or CSV."""
+    conditions = _user_filters(role, created_after, created_before, email_prefix)
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        _export_users(conditions, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="users.{format}"'},
+    )
@@ -1,80 +1,477 @@
 """
 Job listing routes.
 
-GET  /api/jobs         — paginated, filterable job list
+GET  /api/jobs         — filterable job list (offset or cursor pagination)
+GET  /api/jobs/facets  — counts per category, platform and experience
+GET  /api/jobs/recommended — jobs ranked by overlap with the user's skills
 POST /api/jobs/refresh — trigger background re-scrape
-GET  /api/jobs/status  — latest scrape status
+GET  /api/jobs/status  — latest scrape status and next scheduled run
+GET  /api/jobs/status/trends   — per-platform scrape metrics across recent runs
+GET  /api/jobs/status/{run_id} — status and per-page telemetry of one run
 """
 
+import base64
+import hashlib
+import json
 import logging
 import math
+from datetime import datetime
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
-from sqlalchemy import func as sa_func
-from sqlalchemy.orm import Session
-from typing import Optional
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
+from pydantic import BaseModel
+from sqlalchemy import case, false, func as sa_func, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query as OrmQuery, Session
+from typing import List, Literal, Optional, Tuple, Union
 
-from app.database import get_db, SessionLocal
+from app.database import get_async_db, get_async_read_db
 
-from app.models import Job, ScrapeStatus
+from app.models import Job, ScrapePageMetric, ScrapeStatus
 
-from app.schema import JobListResponse, JobResponse, ScrapeStatusResponse
+from app.schema import (
+    FacetValue,
+    JobFacetsResponse,
+    JobListResponse,
+    JobRecommendationResponse,
+    ScrapePageMetricResponse,
+    ScrapeRunResponse,
+    ScrapeSourceMetrics,
+    ScrapeStatusResponse,
+    ScrapeTrendPoint,
+    ScrapeTrendsResponse,
+)
 
-from app.services.job_scraper import scrape_and_store_jobs
+from app.services import fast_json, job_cache, job_snapshot
+from app.services.job_facets import collapsed_counts, grouped_rows, rollup, summary_rows
+from app.services.job_recommender import recommend
+from app.services.job_search import (
+    build_match_query,
+    contains_clause,
+    fts_available,
+    fts_order_by,
+    jobs_fts,
+)
+from app.services.scrape_scheduler import (
+    ensure_lease_row,
+    get_next_scheduled_run,
+    run_leased_scrape,
+    try_acquire_lease,
+)
+from app.services.skills_db import keyword_catalog
+from app.services.user_cache import UserSnapshot
+
+from .auth import get_current_user_async
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["Jobs"])
 
 
+# ---------------------------------------------------------------------------
+# HTTP caching — listings only change when a scrape run completes
+# ---------------------------------------------------------------------------
+def _cached_listing(request: Request, generation: int) -> Tuple[str, Optional[Response]]:
+    """
+    Return the ETag for this request and, if possible, a ready response:
+    304 when the client already has it, or the cached rendered body.
+    """
+    etag = job_cache.make_etag(generation, request.url.path, request.query_params.multi_items())
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if job_cache.etag_matches(request.headers.get("if-none-match"), etag):
+        return etag, Response(status_code=304, headers=headers)
+    body = job_cache.get_response(generation, etag)
+    if body is not None:
+        return etag, Response(body, media_type="application/json", headers=headers)
+    return etag, None
+
+
+def _render_listing(generation: int, etag: str, payload: Union[BaseModel, dict]) -> Response:
+    """
+    Serialize ``payload`` once, cache the body and return it with its ETag.
+
+    Plain dicts (already shaped like the response model) go straight to
+    orjson without another validation pass.
+    """
+    if isinstance(payload, BaseModel):
+        body = payload.model_dump_json().encode("utf-8")
+    else:
+        body = fast_json.dumps(payload)
+    job_cache.put_response(generation, etag, body)
+    return Response(
+        body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
+
+
 # ---------------------------------------------------------------------------
 # GET /api/jobs
 # ---------------------------------------------------------------------------
+def _listing_payload(
+    jobs: List[dict],
+    total: Optional[int],
+    page: int,
+    per_page: int,
+    next_cursor: Optional[str],
+) -> dict:
+    """A ``JobListResponse``-shaped dict around already-serializable job dicts."""
+    return {
+        "jobs": jobs,
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "total_pages": max(1, math.ceil(total / per_page)) if total is not None else None,
+        "next_cursor": next_cursor,
+    }
+
+
+def _encode_cursor(scraped_at: datetime, job_id: int) -> str:
+    """Opaque cursor pointing just past a job in (scraped_at, id) order."""
+    raw = json.dumps([scraped_at.isoformat(), job_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Inverse of ``_encode_cursor``; raises 400 on anything malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        scraped_at, job_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(scraped_at), int(job_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor.")
+
+
+def _filtered_jobs_query(
+    db: Session,
+    category: Optional[str],
+    experience: Optional[str],
+    search: Optional[str],
+    search_mode: str,
+    platform: Optional[str],
+    match: str,
+    collapse: bool,
+) -> Tuple[OrmQuery, bool]:
+    """
+    Build the filtered ``Job`` query shared by the listing endpoints.
+
+    Returns the query and whether it is joined to the full-text index.
+    """
+    query = db.query(Job)
+
+    for column, value in (
+        (Job.category, category),
+        (Job.experience, experience),
+        (Job.platform, platform),
+    ):
+        if not value:
+            continue
+        if match == "exact":
+            query = query.filter(column == value)
+        else:
+            query = query.filter(contains_clause(column, value))
+
+    full_text = False
+    if search and search_mode == "fts" and fts_available(db.get_bind()):
+        match_query = build_match_query(search)
+        if match_query is None:
+            query = query.filter(false())
+        else:
+            query = query.join(jobs_fts, jobs_fts.c.rowid == Job.id).filter(
+                text("jobs_fts MATCH :match_query").bindparams(match_query=match_query)
+            )
+            full_text = True
+    elif search:
+        query = query.filter(
+            contains_clause(Job.title, search) | contains_clause(Job.company, search)
+        )
+    if collapse:
+        # Keep the first-scraped *matching* row of each cluster, so a cluster
+        # whose first row fails a filter is still shown; unclustered rows
+        # stand alone.
+        ranked = (
+            query
+            .filter(Job.cluster_id.isnot(None))
+            .with_entities(
+                Job.id.label("id"),
+                sa_func.row_number()
+                .over(partition_by=Job.cluster_id, order_by=Job.id)
+                .label("cluster_rank"),
+            )
+            .subquery()
+        )
+        representatives = select(ranked.c.id).where(ranked.c.cluster_rank == 1)
+        query = query.filter(Job.cluster_id.is_(None) | Job.id.in_(representatives))
+
+    return query, full_text
+
+
+def _snapshot_listing(
+    snapshot: job_snapshot.JobSnapshot,
+    filters: dict,
+    match: str,
+    search: Optional[str],
+    collapse: bool,
+    use_cursor: bool,
+    after: Optional[Tuple[datetime, int]],
+    page: int,
+    per_page: int,
+) -> dict:
+    """Answer a listing request from the in-memory read model."""
+    positions = snapshot.search(filters, match, search, collapse)
+    total = len(positions)
+    next_cursor: Optional[str] = None
+    if use_cursor:
+        if after is not None:
+            positions = snapshot.seek(positions, after)
+        window = positions[:per_page]
+        if len(positions) > per_page:
+            last = snapshot.rows(window[-1:])[0]
+            next_cursor = _encode_cursor(last["scraped_at"], last["id"])
+        page = 1
+    else:
+        window = positions[(page - 1) * per_page:page * per_page]
+
+    return _listing_payload(snapshot.rows(window), total, page, per_page, next_cursor)
+
+
+def _sql_listing(
+    db: Session,
+    category: Optional[str],
+    experience: Optional[str],
+    search: Optional[str],
+    search_mode: str,
+    platform: Optional[str],
+    match: str,
+    collapse: bool,
+    generation: int,
+    use_cursor: bool,
+    after: Optional[Tuple[datetime, int]],
+    include_total: bool,
+    page: int,
+    per_page: int,
+) -> dict:
+    """
+    Answer a listing request from SQLite (run through ``AsyncSession.run_sync``).
+
+    Rows are fetched as plain column tuples, not ``Job`` instances.
+    """
+    query, full_text = _filtered_jobs_query(
+        db, category, experience, search, search_mode, platform, match, collapse
+    )
+
+    # --- Count (cached until the next scrape completes) -------------------
+    filters = (category, experience, platform, search, search_mode if search else None, collapse)
+    count_key = filters + (match,) if any(filters) else job_cache.UNFILTERED
+    total: Optional[int] = job_cache.get_count(generation, count_key)
+    if total is None and (include_total or (full_text and not use_cursor)):
+        total = query.count()
+        job_cache.put_count(generation, count_key, total)
+
+    # --- Paginate ---------------------------------------------------------
+    query = query.with_entities(*fast_json.JOB_COLUMNS)
+    next_cursor: Optional[str] = None
+    if use_cursor:
+        if after:
+            query = query.filter(tuple_(Job.scraped_at, Job.id) < tuple_(*after))
+        rows = (
+            query
+            .order_by(Job.scraped_at.desc(), Job.id.desc())
+            .limit(per_page + 1)
+            .all()
+        )
+        jobs = rows[:per_page]
+        if len(rows) > per_page:
+            next_cursor = _encode_cursor(jobs[-1].scraped_at, jobs[-1].id)
+        page = 1
+    else:
+        if full_text:
+            query = query.order_by(fts_order_by(total))
+        else:
+            query = query.order_by(Job.scraped_at.desc(), Job.id.desc())
+        jobs = (
+            query
+            .offset((page - 1) * per_page)
+            .limit(per_page)
+            .all()
+        )
+
+    return _listing_payload(
+        fast_json.rows_to_dicts(fast_json.JOB_FIELDS, jobs), total, page, per_page, next_cursor
+    )
+
+
 @router.get("/jobs", response_model=JobListResponse)
 async def list_jobs(
+    request: Request,
     category: Optional[str] = Query(None, description="Filter by job category"),
     experience: Optional[str] = Query(None, description="Filter by experience level"),
     search: Optional[str] = Query(None, description="Search in title and company"),
+    search_mode: Literal["contains", "fts"] = Query(
+        "contains",
+        description=(
+            "'contains' substring-matches title and company; 'fts' uses the "
+            "full-text index over title, company, location and category with "
+            "prefix matching and relevance ordering (newest-first for very broad queries)"
+        ),
+    ),
     platform: Optional[str] = Query(None, description="Filter by platform"),
-    page: int = Query(1, ge=1, description="Page number"),
+    match: Literal["contains", "exact"] = Query(
+        "contains",
+        description=(
+            "How category / experience / platform filters match: 'contains' is a "
+            "case-insensitive substring match, 'exact' an indexed equality match"
+        ),
+    ),
+    collapse: bool = Query(False, description="Show one listing per near-duplicate cluster"),
+    pagination: Literal["offset", "cursor"] = Query(
+        "offset",
+        description=(
+            "'offset' pages by number; 'cursor' pages newest-first by keyset, "
+            "following next_cursor, so every page costs the same"
+        ),
+    ),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (implies cursor pagination)"),
+    include_total: bool = Query(
+        True,
+        description="Count matching jobs; when false, total is only returned if already cached",
+    ),
+    page: int = Query(1, ge=1, description="Page number (offset pagination)"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db),
-) -> JobListResponse:
-    """Return a paginated, optionally filtered list of scraped jobs."""
-    query = db.query(Job)
+    db: AsyncSession = Depends(get_async_read_db),
+) -> Response:
+    """
+    Return a paginated, optionally filtered list of scraped jobs.
 
-    # --- Filters ----------------------------------------------------------
-    if category:
-        query = query.filter(Job.category.ilike(f"%{category}%"))
-    if experience:
-        query = query.filter(Job.experience.ilike(f"%{experience}%"))
-    if platform:
-        query = query.filter(Job.platform.ilike(f"%{platform}%"))
-    if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            (Job.title.ilike(search_term)) | (Job.company.ilike(search_term))
-        )
+    Responses carry an ETag tied to the latest completed scrape, so repeat
+    requests are answered from cache (or with 304) until the next scrape.
+    """
+    generation = await db.run_sync(job_cache.current_generation)
+    etag, cached = _cached_listing(request, generation)
+    if cached is not None:
+        return cached
 
-    # --- Count & paginate -------------------------------------------------
-    total: int = query.count()
-    total_pages: int = max(1, math.ceil(total / per_page))
+    use_cursor = pagination == "cursor" or cursor is not None
+    after = _decode_cursor(cursor) if cursor else None
 
-    jobs = (
-        query
-        .order_by(Job.scraped_at.desc())
-        .offset((page - 1) * per_page)
-        .limit(per_page)
-        .all()
-    )
+    snapshot = None if search and search_mode == "fts" else job_snapshot.current(generation)
+    if snapshot is not None:
+        return _render_listing(generation, etag, _snapshot_listing(
+            snapshot,
+            {"category": category, "experience": experience, "platform": platform},
+            match, search, collapse, use_cursor, after, page, per_page,
+        ))
+
+    return _render_listing(generation, etag, await db.run_sync(
+        _sql_listing,
+        category, experience, search, search_mode, platform, match, collapse,
+        generation, use_cursor, after, include_total, page, per_page,
+    ))
 
-    return JobListResponse(
-        jobs=[JobResponse.model_validate(j) for j in jobs],
+
+# ---------------------------------------------------------------------------
+# GET /api/jobs/facets
+# ---------------------------------------------------------------------------
+@router.get("/jobs/facets", response_model=JobFacetsResponse)
+async def job_facets(
+    request: Request,
+    category: Optional[str] = Query(None, description="Active category filter"),
+    experience: Optional[str] = Query(None, description="Active experience filter"),
+    platform: Optional[str] = Query(None, description="Active platform filter"),
+    match: Literal["contains", "exact"] = Query("contains", description="How the filters match"),
+    search: Optional[str] = Query(None, description="Active search text"),
+    search_mode: Literal["contains", "fts"] = Query("contains", description="How search matches"),
+    collapse: bool = Query(False, description="Count one listing per near-duplicate cluster"),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> Response:
+    """
+    Return job counts per category, platform and experience level.
+
+    Each facet's counts honour every active filter except its own.  Without
+    a search or collapse they come from the per-scrape summary table; with a
+    search, from one grouped query over the matching jobs; with collapse,
+    from one distinct-cluster count per facet.  Cached and ETag-tagged like
+    ``GET /api/jobs``.
+    """
+    generation = await db.run_sync(job_cache.current_generation)
+    etag, cached = _cached_listing(request, generation)
+    if cached is not None:
+        return cached
+
+    active = {"category": category, "platform": platform, "experience": experience}
+    if collapse:
+        total, facets = await db.run_sync(lambda sync_db: collapsed_counts(
+            lambda f: _filtered_jobs_query(
+                sync_db, f["category"], f["experience"], search, search_mode, f["platform"], match, False
+            )[0],
+            active,
+        ))
+    else:
+        if search:
+            rows = await db.run_sync(lambda sync_db: grouped_rows(_filtered_jobs_query(
+                sync_db, None, None, search, search_mode, None, match, False
+            )[0]))
+        else:
+            rows = await db.run_sync(summary_rows)
+        total, facets = rollup(rows, active, match)
+    return _render_listing(generation, etag, JobFacetsResponse(
         total=total,
-        page=page,
-        per_page=per_page,
-        total_pages=total_pages,
-    )
+        **{
+            field: [FacetValue(value=value, count=count) for value, count in values]
+            for field, values in facets.items()
+        },
+    ))
+
+
+# ---------------------------------------------------------------------------
+# GET /api/jobs/recommended
+# ---------------------------------------------------------------------------
+@router.get("/jobs/recommended", response_model=JobRecommendationResponse)
+async def recommended_jobs(
+    limit: int = Query(20, ge=1, le=100, description="Number of jobs to return"),
+    current_user: UserSnapshot = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> Response:
+    """
+    Rank current job listings by overlap with the skills on the user's profile
+    (as saved from their analysed resume).
+
+    Rendered straight from column tuples with orjson, like ``GET /api/jobs``.
+    """
+    profile = current_user.profile
+    skills = (profile.skill_matrix or []) if profile else []
+    if not skills:
+        raise HTTPException(
+            status_code=404,
+            detail="No skills on your profile yet. Analyse a resume or add skills first.",
+        )
+
+    try:
+        ranked, skills_used = await db.run_sync(
+            lambda sync_db: recommend(sync_db, skills, job_cache.current_generation(sync_db), limit)
+        )
+    except (FileNotFoundError, RuntimeError) as exc:
+        raise HTTPException(status_code=500, detail=str(exc))
+
+    catalog = keyword_catalog()
+    rows = (
+        await db.execute(
+            select(*fast_json.JOB_COLUMNS).where(Job.id.in_([r[0] for r in ranked]))
+        )
+    ).all()
+    jobs = {job["id"]: job for job in fast_json.rows_to_dicts(fast_json.JOB_FIELDS, rows)}
+    payload = {
+        "jobs": [
+            {
+                **jobs[job_id],
+                "score": score,
+                "matched_skills": [catalog.keywords[k] for k in matched],
+            }
+            for job_id, score, matched in ranked
+            if job_id in jobs
+        ],
+        "skills_used": skills_used,
+    }
+    return Response(fast_json.dumps(payload), media_type="application/json")
 
 
 # ---------------------------------------------------------------------------
@@ -82,34 +479,31 @@ async def list_jobs(
 # ---------------------------------------------------------------------------
 
 def _background_scrape() -> None:
-    """Run the scraper in a background thread with its own DB session."""
-    db = SessionLocal()
+    """Run the scraper in a background thread under the lease taken by the route."""
     try:
-        scrape_and_store_jobs(db)
+        run_leased_scrape()
     except Exception as exc:
         logger.exception("Background scrape failed: %s", exc)
-    finally:
-        db.close()
+
+
+def _claim_lease(db: Session) -> bool:
+    ensure_lease_row(db)
+    return try_acquire_lease(db, datetime.utcnow(), due_only=False)
 
 
 @router.post("/jobs/refresh")
 async def refresh_jobs(
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> dict:
     """
     Trigger a background re-scrape of job listings from all platforms.
 
     Returns immediately with a confirmation; the actual scraping happens
-    in the background.
+    in the background.  The scrape takes the scheduler's lease, so it never
+    overlaps a scrape by this or another worker.
     """
-    # Prevent multiple concurrent scrapes
-    running = (
-        db.query(ScrapeStatus)
-        .filter(ScrapeStatus.status == "running")
-        .first()
-    )
-    if running:
+    if not await db.run_sync(_claim_lease):
         raise HTTPException(
             status_code=409,
             detail="A scraping job is already running. Please wait for it to complete.",
@@ -123,25 +517,134 @@ async def refresh_jobs(
 # GET /api/jobs/status — latest scrape status
 # ---------------------------------------------------------------------------
 @router.get("/jobs/status", response_model=ScrapeStatusResponse)
-async def scrape_status(db: Session = Depends(get_db)) -> ScrapeStatusResponse:
-    """Return the latest scrape-run status."""
+async def scrape_status(request: Request, db: AsyncSession = Depends(get_async_read_db)) -> Response:
+    """
+    Return the latest scrape-run status and the next scheduled run time.
+
+    The status changes when a run *starts*, not just when one completes, so
+    it is not cached by scrape generation; its ETag is a hash of the body,
+    which still lets polling clients receive 304 instead of the payload.
+    """
     latest = (
-        db.query(ScrapeStatus)
-        .order_by(ScrapeStatus.id.desc())
-        .first()
-    )
+        await db.execute(select(ScrapeStatus).order_by(ScrapeStatus.id.desc()).limit(1))
+    ).scalar_one_or_none()
+    next_run = await db.run_sync(get_next_scheduled_run)
 
     if not latest:
-        return ScrapeStatusResponse(
+        payload = ScrapeStatusResponse(
             last_updated=None,
             job_count=0,
             status="never_run",
             is_running=False,
+            next_scheduled_run=next_run,
+        )
+    else:
+        payload = ScrapeStatusResponse(
+            last_updated=latest.completed_at or latest.started_at,
+            job_count=latest.job_count,
+            status=latest.status,
+            is_running=latest.status == "running",
+            next_scheduled_run=next_run,
+        )
+
+    body = payload.model_dump_json().encode("utf-8")
+    etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if job_cache.etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+# ---------------------------------------------------------------------------
+# Scrape telemetry
+# ---------------------------------------------------------------------------
+def _source_metrics_columns() -> list:
+    """Aggregate columns over ``ScrapePageMetric`` rows, one set per platform."""
+    m = ScrapePageMetric
+    return [
+        m.platform.label("platform"),
+        sa_func.count(m.id).label("pages"),
+        sa_func.sum(
+            case((sa_func.coalesce(m.status_code, 0) != 200, 1), else_=0)
+        ).label("failed_pages"),
+        sa_func.sum(m.retries).label("retries"),
+        sa_func.avg(m.latency_ms).label("avg_latency_ms"),
+        sa_func.sum(m.latency_ms).label("total_latency_ms"),
+        sa_func.sum(m.bytes).label("bytes"),
+        sa_func.sum(m.parse_ms).label("parse_ms"),
+        sa_func.sum(m.cards_found).label("cards_found"),
+        sa_func.sum(m.rows_written).label("rows_written"),
+        sa_func.sum(m.write_ms).label("write_ms"),
+    ]
+
+
+@router.get("/jobs/status/trends", response_model=ScrapeTrendsResponse)
+async def scrape_trends(
+    runs: int = Query(20, ge=1, le=500, description="Number of recent runs"),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> ScrapeTrendsResponse:
+    """
+    Return per-platform metrics for the most recent runs, oldest first, so a
+    board that got slower or stopped yielding cards stands out.
+    """
+    recent_ids = (
+        select(ScrapeStatus.id)
+        .order_by(ScrapeStatus.id.desc())
+        .limit(runs)
+        .subquery()
+    )
+    rows = (
+        await db.execute(
+            select(
+                ScrapeStatus.id.label("run_id"),
+                ScrapeStatus.started_at,
+                ScrapeStatus.status,
+                *_source_metrics_columns(),
+            )
+            .join(ScrapePageMetric, ScrapePageMetric.scrape_id == ScrapeStatus.id)
+            .where(ScrapeStatus.id.in_(recent_ids.select()))
+            .group_by(ScrapeStatus.id, ScrapePageMetric.platform)
+            .order_by(ScrapeStatus.id, ScrapePageMetric.platform)
         )
+    ).all()
+    return ScrapeTrendsResponse(
+        runs=runs,
+        points=[ScrapeTrendPoint.model_validate(row._asdict()) for row in rows],
+    )
+
 
-    return ScrapeStatusResponse(
-        last_updated=latest.completed_at or latest.started_at,
-        job_count=latest.job_count,
-        status=latest.status,
-        is_running=latest.status == "running",
+@router.get("/jobs/status/{run_id}", response_model=ScrapeRunResponse)
+async def scrape_run_detail(
+    run_id: int,
+    db: AsyncSession = Depends(get_async_read_db),
+) -> ScrapeRunResponse:
+    """Return one scrape run with per-platform totals and per-page telemetry."""
+    run = await db.get(ScrapeStatus, run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail=f"Scrape run {run_id} not found.")
+
+    sources = (
+        await db.execute(
+            select(*_source_metrics_columns())
+            .where(ScrapePageMetric.scrape_id == run_id)
+            .group_by(ScrapePageMetric.platform)
+            .order_by(ScrapePageMetric.platform)
+        )
+    ).all()
+    pages = (
+        await db.execute(
+            select(ScrapePageMetric)
+            .where(ScrapePageMetric.scrape_id == run_id)
+            .order_by(ScrapePageMetric.id)
+        )
+    ).scalars().all()
+    return ScrapeRunResponse(
+        id=run.id,
+        started_at=run.started_at,
+        completed_at=run.completed_at,
+        status=run.status,
+        job_count=run.job_count,
+        error_message=run.error_message,
+        sources=[ScrapeSourceMetrics.model_validate(row._asdict()) for row in sources],
+        pages=[ScrapePageMetricResponse.model_validate(p) for p in pages],
     )
@@ -0,0 +1,32 @@
+"""
+Operational metrics for SkillSync.
+
+GET /api/metrics -> Per-worker counters and per-route query statistics (admins only)
+"""
+
+import logging
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.services import metrics, user_cache
+
+from .auth import isAdmin
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/api", tags=["Metrics"])
+
+
+@router.get("/metrics")
+def get_metrics(is_admin: bool = Depends(isAdmin)) -> dict:
+    """
+    Return this worker's counters (``db.queries``, ``db.time_ms``,
+    ``db.slow_queries``, ``db.repeated_query_requests``, …), per route the
+    number of requests with their query counts and database time, and the
+    size and hit rate of the token → user cache.
+    """
+    if not is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required.",
+        )
+    return {**metrics.snapshot(), "user_cache": user_cache.stats()}
@@ -5,28 +5,94 @@ Profile page routing.
 GET  /api/profile         — all the info to be showed on profile
 POST /api/profile/personalInfo/update — update user info
 GET  /api/profile/skilltag  — update skills tag
+PATCH /api/user_profile   — update any subset of profile fields, returns the profile
+GET  /api/user_profile/analyses — the user's past analyses, newest first
+
+Reads come from the cached user snapshot (one joined user + profile query
+on a cache miss).  Writes are single ``UPDATE … WHERE user_id = ?``
+statements; they never load the rows first.
 """
 
 
 import logging 
+from typing import Any, Dict, Optional
+
 from fastapi import APIRouter ,Depends ,HTTPException,Query
-from app.database import get_db,SessionLocal
-from sqlalchemy.orm import Session
-from app.models import UserProfile 
+from app.database import get_async_db, get_async_read_db
+from sqlalchemy import Row, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import User, UserProfile 
 
-from app.schema import ProfileInfoChange,ProfileResponse,ProfileSkillsMatrixChange
+from app.schema import AnalysisHistoryResponse,ProfileInfoChange,ProfilePatch,ProfileResponse,ProfileSkillsMatrixChange
+from app.services import analysis_history, user_cache
+from app.services.user_skills import sync_user_skills
 
-from .auth import get_current_user
+from .auth import get_current_user_async
 
 logger =logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api",tags=["UserProfile"])
 
 
+_PROFILE_COLUMNS = (
+    UserProfile.user_id,
+    UserProfile.target_role,
+    UserProfile.location,
+    UserProfile.description,
+    UserProfile.github,
+    UserProfile.linkedin,
+    UserProfile.portfolio,
+    UserProfile.match_score,
+    UserProfile.resume_analysed,
+    UserProfile.skill_matrix,
+)
+
+
+async def _update_profile(db: AsyncSession, user_id: int, updates: Dict[str, Any]) -> Optional[Row]:
+    """
+    Apply ``updates`` (``full_name`` goes to ``users``, everything else to
+    ``user_profile``) with one UPDATE per table, mirror a new
+    ``skill_matrix`` into ``user_skills``, then commit.
+
+    Returns the profile row as it is after the update, or None if the user
+    has no profile (nothing is written then).
+    """
+    profile_values = {k: v for k, v in updates.items() if k != "full_name"}
+    if profile_values:
+        profile = (await db.execute(
+            update(UserProfile)
+            .where(UserProfile.user_id == user_id)
+            .values(**profile_values)
+            .returning(*_PROFILE_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )).first()
+    else:
+        profile = (await db.execute(
+            select(*_PROFILE_COLUMNS).where(UserProfile.user_id == user_id)
+        )).first()
+    if profile is None:
+        await db.rollback()
+        return None
+
+    if "skill_matrix" in updates:
+        await db.run_sync(sync_user_skills, user_id, updates["skill_matrix"])
+    if "full_name" in updates:
+        await db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(full_name=updates["full_name"])
+            .execution_options(synchronize_session=False)
+        )
+    await db.commit()
+    # Bulk UPDATEs bypass the ORM flush events that keep the cache fresh.
+    user_cache.invalidate_user(user_id)
+    return profile
+
+
 #GET /api/userprofile
 
 @router.get("/user_profile",response_model=ProfileResponse)
-async def fetch_userProfile(currentUser =Depends(get_current_user))-> ProfileResponse:
+async def fetch_userProfile(currentUser =Depends(get_current_user_async))-> ProfileResponse:
     """fetch all the info of user for user profile section"""
     try:
         profile=currentUser.profile
@@ -56,36 +122,28 @@ async def fetch_userProfile(currentUser =Depends(get_current_user))-> ProfileRes
     
 @router.post("/user_profile/personalInfo/update",response_model=bool)
 async def changeProfileInfo(body:ProfileInfoChange ,
-                            db :Session = Depends(get_db),
-                            currentUser = Depends(get_current_user)
+                            db :AsyncSession = Depends(get_async_db),
+                            currentUser = Depends(get_current_user_async)
                             )-> bool:
     try:
-        user_profile= db.query(UserProfile).filter(UserProfile.user_id==currentUser.id).first()
-        if user_profile is None:
+        updates = body.model_dump(exclude_unset=True,mode="json")
+        if not updates:
+            return True
+
+        if await _update_profile(db, currentUser.id, updates) is None:
             raise HTTPException(
                 status_code=404,
                 detail="Profile not found."
             )
-        
-        updates = body.model_dump(exclude_unset=True,mode="json")
-
-        for field, value in updates.items():
-            if field == "full_name":
-                currentUser.full_name = value
-            else:
-                setattr(user_profile, field, value)
-        
-        db.commit()
 
         return True
 
-
+    except HTTPException:
+        raise
     except Exception as exc:
-        db.rollback()
+        await db.rollback()
         logger.exception("Failed to update User Profile")
         raise HTTPException(status_code=500,detail=f"failed to update user Profile :{exc}")
-    finally:
-        db.close()
 
 
 
@@ -93,32 +151,80 @@ async def changeProfileInfo(body:ProfileInfoChange ,
 
 @router.post("/user_profile/skill_set/update",response_model=bool)
 async def updateSkillSet(body:ProfileSkillsMatrixChange,
-                         db:Session = Depends(get_db),
-                         current_user= Depends(get_current_user)
+                         db:AsyncSession = Depends(get_async_db),
+                         current_user= Depends(get_current_user_async)
                          )-> bool :
     print("updating user profile")
 
     try:
-        user_profile =db.query(UserProfile).filter(UserProfile.user_id==current_user.id).first()
-
-        if(user_profile is None):
-            raise HTTPException(status_code=404,detail=f"User doesn't exist with user id :{current_user.id}")
-        
         updates=body.model_dump(exclude_unset=True,mode="json")
 
-        user_profile.skill_matrix=updates.skill_matrix
-
-        db.commit()
+        if await _update_profile(db, current_user.id, {"skill_matrix": updates["skill_matrix"]}) is None:
+            raise HTTPException(status_code=404,detail=f"User doesn't exist with user id :{current_user.id}")
 
         return True
-    
+
+    except HTTPException:
+        raise
     except Exception as esc:
+        await db.rollback()
         logger.exception("Failed to update skill set")
         raise HTTPException(status_code=500,detail=f"error occured while updating skill set ,{esc}")
-    
-    finally:
-        db.close()
-    
+
+
+#PATCH /api/user_profile
+
+@router.patch("/user_profile",response_model=ProfileResponse)
+async def patchUserProfile(body:ProfilePatch,
+                           db:AsyncSession = Depends(get_async_db),
+                           current_user= Depends(get_current_user_async)
+                           )-> ProfileResponse:
+    """
+    Update only the fields present in the body and return the updated
+    profile, in one UPDATE per touched table.
+    """
+    updates=body.model_dump(exclude_unset=True,mode="json")
+    try:
+        profile = await _update_profile(db, current_user.id, updates)
+    except Exception as exc:
+        await db.rollback()
+        logger.exception("Failed to patch user profile")
+        raise HTTPException(status_code=500,detail=f"failed to update user Profile :{exc}")
+
+    if profile is None:
+        raise HTTPException(status_code=404,detail="Profile not found.")
+
+    return ProfileResponse(
+        **profile._mapping,
+        full_name=updates.get("full_name", current_user.full_name),
+        email=current_user.email,
+    )
+
+
+
+#GET /api/user_profile/analyses
+
+@router.get("/user_profile/analyses",response_model=AnalysisHistoryResponse)
+async def analysisHistory(limit:int = Query(50,ge=1,le=200),
+                          before:Optional[int] = Query(None,description="Return analyses older than this id"),
+                          db:AsyncSession = Depends(get_async_read_db),
+                          current_user= Depends(get_current_user_async)
+                          )-> AnalysisHistoryResponse:
+    """
+    The user's stored analyses, newest first, one indexed range read per
+    page; ``match_score`` and ``resume_analysed`` come from the profile,
+    where they are kept up to date as analyses are recorded.
+    """
+    analyses, next_before = await db.run_sync(
+        analysis_history.user_history, current_user.id, limit, before
+    )
+    profile = current_user.profile
+    return AnalysisHistoryResponse(
+        match_score=(profile.match_score if profile else None) or 0,
+        resume_analysed=(profile.resume_analysed if profile else None) or 0,
+        analyses=analyses,
+        next_before=next_before,
+    )
 
 
 
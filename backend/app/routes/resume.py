@@ -4,20 +4,28 @@ Resume analysis routes.
 POST /api/analyze          — auto-detect best role from uploaded PDF
 POST /api/analyze/feedback — generate AI feedback for a resume + role
 POST /api/analyze/role     — analyse resume against a specific role
+
+When the caller sends a valid bearer token, every analysis is also added to
+their history (see ``analysis_history``) and their profile stats.
 """
 
 import logging
 import re
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database import get_async_db
 from app.schema import AnalysisResponse, FeedbackRequest, FeedbackResponse, RoleAnalysisRequest, RoleScore
 
-from app.services import ai_feedback, resume_parser, skills_db
+from app.services import ai_feedback, analysis_history, resume_parser, skills_db, user_cache
 
 from app.services.gap_analyzer import evaluate_resume
+from app.services.user_cache import UserSnapshot
+
+from .auth import get_optional_user_async
 
 logger = logging.getLogger(__name__)
 
@@ -27,11 +35,36 @@ class LinkedinAnalysisRequest(BaseModel):
     url: str
 
 
+async def _record_analysis(
+    db: AsyncSession, user: Optional[UserSnapshot], source: str, result: AnalysisResponse
+) -> None:
+    """Add ``result`` to the signed-in user's history; never fails the analysis."""
+    if user is None:
+        return
+    try:
+        await db.run_sync(
+            analysis_history.record_analysis,
+            user.id, source, result.best_role, result.score,
+            result.matched_skills, result.missing_skills,
+        )
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        logger.exception("Failed to record analysis for user %s", user.id)
+        return
+    # The profile stats were changed with a bulk UPDATE.
+    user_cache.invalidate_user(user.id)
+
+
 # ---------------------------------------------------------------------------
 # POST /api/analyze — upload PDF, auto-detect best role
 # ---------------------------------------------------------------------------
 @router.post("/analyze", response_model=AnalysisResponse)
-async def analyze_resume(file: UploadFile = File(...)) -> AnalysisResponse:
+async def analyze_resume(
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[UserSnapshot] = Depends(get_optional_user_async),
+) -> AnalysisResponse:
     """
     Upload a resume file (PDF, DOCX, DOC, or TXT). The server extracts text, 
     scores against every role in the skills database, and returns the best match.
@@ -75,7 +108,7 @@ async def analyze_resume(file: UploadFile = File(...)) -> AnalysisResponse:
             detail="Could not determine a suitable role. The skills database may be empty.",
         )
 
-    return AnalysisResponse(
+    response = AnalysisResponse(
         best_role=result["best_role"],
         score=result["score"],
         matched_skills=result["matched_keywords"],
@@ -86,13 +119,19 @@ async def analyze_resume(file: UploadFile = File(...)) -> AnalysisResponse:
         ],
         resume_text=resume_text[:3000],  # truncated for feedback use
     )
+    await _record_analysis(db, current_user, "resume", response)
+    return response
 
 
 # ---------------------------------------------------------------------------
 # POST /api/analyze/linkedin — analyze LinkedIn profile URL
 # ---------------------------------------------------------------------------
 @router.post("/analyze/linkedin", response_model=AnalysisResponse)
-async def analyze_linkedin_profile(body: LinkedinAnalysisRequest) -> AnalysisResponse:
+async def analyze_linkedin_profile(
+    body: LinkedinAnalysisRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[UserSnapshot] = Depends(get_optional_user_async),
+) -> AnalysisResponse:
     """
     Simulate LinkedIn profile URL analysis by generating a baseline profile matching 
     the user's name, with an inline explanation of LinkedIn's scraper blocks.
@@ -158,7 +197,7 @@ async def analyze_linkedin_profile(body: LinkedinAnalysisRequest) -> AnalysisRes
             detail="Could not determine a suitable role for this profile.",
         )
 
-    return AnalysisResponse(
+    response = AnalysisResponse(
         best_role=result["best_role"],
         score=result["score"],
         matched_skills=result["matched_keywords"],
@@ -169,6 +208,8 @@ async def analyze_linkedin_profile(body: LinkedinAnalysisRequest) -> AnalysisRes
         ],
         resume_text=resume_text,
     )
+    await _record_analysis(db, current_user, "linkedin", response)
+    return response
 
 
 # ---------------------------------------------------------------------------
@@ -209,7 +250,11 @@ async def get_feedback(body: FeedbackRequest) -> FeedbackResponse:
 # POST /api/analyze/role — analyse resume against a specific role
 # ---------------------------------------------------------------------------
 @router.post("/analyze/role", response_model=AnalysisResponse)
-async def analyze_for_role(body: RoleAnalysisRequest) -> AnalysisResponse:
+async def analyze_for_role(
+    body: RoleAnalysisRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[UserSnapshot] = Depends(get_optional_user_async),
+) -> AnalysisResponse:
     """
     Analyse the given resume text against a specific, manually-selected role.
     Also returns scores for all roles so the UI can display comparisons.
@@ -249,7 +294,7 @@ async def analyze_for_role(body: RoleAnalysisRequest) -> AnalysisResponse:
             for s in full_result["all_roles_scores"]
         ]
 
-    return AnalysisResponse(
+    response = AnalysisResponse(
         best_role=report["role"],
         score=report["score"],
         matched_skills=report["matched_keywords"],
@@ -257,3 +302,5 @@ async def analyze_for_role(body: RoleAnalysisRequest) -> AnalysisResponse:
         all_roles_scores=all_roles_scores,
         resume_text=body.resume_text[:3000],
     )
+    await _record_analysis(db, current_user, "role", response)
+    return response
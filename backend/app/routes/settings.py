@@ -11,6 +11,7 @@ from fastapi import APIRouter, HTTPException
 
 from app.config import get_api_key, set_runtime_api_key
 from app.schema import ApiKeyRequest, ApiKeyStatusResponse
+from app.services import llm_client
 
 logger = logging.getLogger(__name__)
 
@@ -31,14 +32,8 @@ async def set_api_key(body: ApiKeyRequest) -> dict:
 
     # --- Validate by making a lightweight Groq call ---------------------------
     try:
-        from langchain_groq import ChatGroq
-
-        llm = ChatGroq(
-            model="meta-llama/llama-4-scout-17b-16e-instruct",
-            temperature=0,
-            max_retries=1,
-            api_key=key,
-        )
+        # Not cached: only an accepted key should occupy a cache slot.
+        llm = llm_client.chat_model(key, temperature=0, max_retries=1, cache=False)
         response = llm.invoke("Say 'ok' in one word.")
         # If we get here the key is valid
         content = response.content if hasattr(response, "content") else str(response)
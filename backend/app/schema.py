@@ -1,6 +1,6 @@
 """Pydantic request / response schemas for SkillSync."""
 
-from pydantic import BaseModel, ConfigDict, Field ,AnyUrl , EmailStr
+from pydantic import BaseModel, ConfigDict, Field ,AnyUrl , EmailStr, field_validator
 
 from datetime import datetime
 from typing import List,Optional
@@ -23,6 +23,7 @@ class JobResponse(BaseModel):
     experience: str
     link: AnyUrl
     scraped_at: datetime
+    cluster_id: Optional[str] = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -31,10 +32,41 @@ class JobListResponse(BaseModel):
     """Paginated list of jobs."""
 
     jobs: List[JobResponse]
-    total: int
+    total: Optional[int]
     page: int
     per_page: int
-    total_pages: int
+    total_pages: Optional[int]
+    next_cursor: Optional[str] = None
+
+
+class RecommendedJob(JobResponse):
+    """A job ranked for a user, with the skills it matched."""
+
+    score: float
+    matched_skills: List[str]
+
+
+class JobRecommendationResponse(BaseModel):
+    """Jobs ranked by skill overlap with the current user's profile."""
+
+    jobs: List[RecommendedJob]
+    skills_used: List[str]
+
+
+class FacetValue(BaseModel):
+    """Number of jobs carrying one value of a facet."""
+
+    value: str
+    count: int
+
+
+class JobFacetsResponse(BaseModel):
+    """Filter-chip counts per category, platform and experience level."""
+
+    total: int
+    category: List[FacetValue]
+    platform: List[FacetValue]
+    experience: List[FacetValue]
 
 
 class RoleScore(BaseModel):
@@ -102,10 +134,120 @@ class ScrapeStatusResponse(BaseModel):
     job_count: int = 0
     status: str = "unknown"
     is_running: bool = False
+    next_scheduled_run: Optional[datetime] = None
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class ScrapePageMetricResponse(BaseModel):
+    """Telemetry for one page requested during a scrape run."""
+
+    platform: str
+    page: int
+    url: str
+    status_code: Optional[int] = None
+    retries: int
+    latency_ms: float
+    bytes: int
+    parse_ms: float
+    cards_found: int
+    rows_written: int
+    write_ms: float
+    error: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ScrapeSourceMetrics(BaseModel):
+    """Per-platform totals for a scrape run."""
+
+    platform: str
+    pages: int
+    failed_pages: int
+    retries: int
+    avg_latency_ms: float
+    total_latency_ms: float
+    bytes: int
+    parse_ms: float
+    cards_found: int
+    rows_written: int
+    write_ms: float
+
+
+class ScrapeRunResponse(BaseModel):
+    """Detailed status and telemetry for a single scrape run."""
+
+    id: int
+    started_at: datetime
+    completed_at: Optional[datetime] = None
+    status: str
+    job_count: int
+    error_message: Optional[str] = None
+    sources: List[ScrapeSourceMetrics]
+    pages: List[ScrapePageMetricResponse]
+
+
+class ScrapeTrendPoint(ScrapeSourceMetrics):
+    """Per-platform totals for one run, as a point in a trend series."""
+
+    run_id: int
+    started_at: datetime
+    status: str
+
+
+class ScrapeTrendsResponse(BaseModel):
+    """Per-platform metrics across recent scrape runs, oldest first."""
+
+    runs: int
+    points: List[ScrapeTrendPoint]
+
+
+
+# for admin skill analytics endpoints
+
+class SkillUserCount(BaseModel):
+    """Number of users listing one skill."""
+
+    skill: str
+    users: int
+
+
+class SkillCountsResponse(BaseModel):
+    """Most common skills across user profiles."""
+
+    users_with_skills: int
+    skills: List[SkillUserCount]
+
+
+class SkillCohortResponse(BaseModel):
+    """Size of the cohort having all of ``has`` and none of ``lacks``."""
+
+    users: int
+    has: List[str]
+    lacks: List[str]
+    unknown_skills: List[str] = Field(
+        default_factory=list,
+        description="Requested skills no user lists (the count is 0 when any are present)",
+    )
+
+
+class RoleSkillGap(BaseModel):
+    """How many users of a cohort have / lack one of a role's skills."""
+
+    skill: str
+    have: int
+    missing: int
+
+
+class RoleSkillGapsResponse(BaseModel):
+    """Per-skill coverage of a role's keywords across a cohort of users."""
+
+    role: str
+    cohort: str
+    cohort_size: int
+    skills: List[RoleSkillGap]
+
+
 
 # for user creation and authentication endpoints
 
@@ -136,6 +278,13 @@ class UserResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class UserPageResponse(BaseModel):
+    """One page of an admin user listing."""
+
+    users: List[UserResponse]
+    next_cursor: Optional[str] = None
+
+
 class TokenResponse(BaseModel):
     """Response containing JWT access token and user info."""
 
@@ -182,6 +331,20 @@ class ProfileInfoChange(BaseModel):
     linkedin: Optional[AnyUrl] = None
     portfolio: Optional[AnyUrl] = None
 
+    @field_validator("*")
+    @classmethod
+    def _not_null(cls, value):
+        """Fields may be left out, but not sent as null: the columns are required."""
+        if value is None:
+            raise ValueError("may be omitted but not null")
+        return value
+
+
+class ProfilePatch(ProfileInfoChange):
+    """Partial profile update: only the fields that are sent are changed."""
+
+    skill_matrix: Optional[List[str]] = None
+
 
 class ProfileSkillsMatrixChange(BaseModel):
     """Request to replace the user's skill matrix."""
@@ -191,4 +354,33 @@ class ProfileSkillsMatrixChange(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class AnalysisHistoryPoint(BaseModel):
+    """One past analysis of the user's resume."""
+
+    id: int
+    created_at: datetime
+    source: str
+    role: str
+    score: float
+    matched_count: int
+    missing_count: int
+    matched_skills: Optional[List[str]] = Field(
+        default=None,
+        description="Null when the skills CSV changed since this analysis",
+    )
+    missing_skills: Optional[List[str]] = None
+
+
+class AnalysisHistoryResponse(BaseModel):
+    """A user's analyses, newest first, with the running profile stats."""
+
+    match_score: float
+    resume_analysed: int
+    analyses: List[AnalysisHistoryPoint]
+    next_before: Optional[int] = Field(
+        default=None,
+        description="Pass as ``before`` to fetch the next (older) page",
+    )
+
+
 
@@ -5,9 +5,11 @@ Generates structured career-coach advice using the configured LLM.
 """
 
 import logging
+import time
 from typing import List, Optional
 
 from app.config import get_api_key
+from app.services import llm_client, metrics
 
 logger = logging.getLogger(__name__)
 
@@ -38,20 +40,7 @@ def resume_feedback(
         )
 
     try:
-        from langchain_groq import ChatGroq
-    except ImportError:
-        return (
-            "⚠️ **langchain-groq is not installed.**\n\n"
-            "Install it with `pip install langchain-groq` to enable AI feedback."
-        )
-
-    try:
-        llm = ChatGroq(
-            model="meta-llama/llama-4-scout-17b-16e-instruct",
-            temperature=0.2,
-            max_retries=2,
-            api_key=api_key,
-        )
+        llm = llm_client.chat_model(api_key, temperature=0.2)
 
         # Structured career-coach prompt (inspired by the improved Home.py version)
         missing_str = ", ".join(missing_skills) if missing_skills else "None identified"
@@ -70,7 +59,10 @@ def resume_feedback(
             "Format the output clearly with Markdown headings and bullet points."
         )
 
+        started = time.perf_counter()
         response = llm.invoke(prompt)
+        metrics.increment("llm.calls")
+        metrics.increment("llm.ms", (time.perf_counter() - started) * 1000)
 
         # langchain response objects expose `.content` on AIMessage
         feedback_text: str = (
@@ -78,6 +70,11 @@ def resume_feedback(
         )
         return feedback_text.strip()
 
+    except ImportError:
+        return (
+            "⚠️ **langchain-groq is not installed.**\n\n"
+            "Install it with `pip install langchain-groq` to enable AI feedback."
+        )
     except Exception as exc:
         logger.exception("AI feedback generation failed")
         return (
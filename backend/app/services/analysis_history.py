@@ -0,0 +1,107 @@
+"""
+Per-user history of resume analyses.
+
+Each analysis a signed-in user runs is stored as one compact
+``analysis_records`` row: the role, the score, and the matched / missing
+skills as keyword ids of the skills CSV catalog (``skills_db.keyword_catalog``)
+together with the catalog version they refer to.
+
+The profile's ``match_score`` (mean score over all analyses) and
+``resume_analysed`` (number of analyses) are updated from each new record in
+the same UPDATE, so neither the profile page nor the history endpoint ever
+re-runs an analysis or aggregates the whole history.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import func as sa_func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models import AnalysisRecord, UserProfile
+from app.services.skills_db import keyword_catalog
+
+logger = logging.getLogger(__name__)
+
+
+def record_analysis(
+    db: Session,
+    user_id: int,
+    source: str,
+    role: str,
+    score: float,
+    matched_skills: List[str],
+    missing_skills: List[str],
+) -> None:
+    """
+    Store one analysis for ``user_id`` and fold its score into the user's
+    profile stats.  The caller commits.
+    """
+    catalog = keyword_catalog()
+    db.execute(
+        insert(AnalysisRecord).values(
+            user_id=user_id,
+            source=source,
+            role=role,
+            score=score,
+            catalog_version=catalog.version,
+            matched_ids=catalog.lookup(matched_skills),
+            missing_ids=catalog.lookup(missing_skills),
+        )
+    )
+
+    # Running mean: every right-hand side below sees the row's old values.
+    runs = sa_func.coalesce(UserProfile.resume_analysed, 0)
+    db.execute(
+        update(UserProfile)
+        .where(UserProfile.user_id == user_id)
+        .values(
+            match_score=(sa_func.coalesce(UserProfile.match_score, 0) * runs + score) / (runs + 1),
+            resume_analysed=runs + 1,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def user_history(
+    db: Session, user_id: int, limit: int, before: Optional[int] = None
+) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """
+    Return up to ``limit`` of the user's analyses, newest first, starting
+    below id ``before``, plus the ``before`` value of the next page (None on
+    the last page).
+
+    Skill names are resolved from the current keyword catalog; records made
+    against an older catalog only report their counts.
+    """
+    query = select(
+        AnalysisRecord.id,
+        AnalysisRecord.created_at,
+        AnalysisRecord.source,
+        AnalysisRecord.role,
+        AnalysisRecord.score,
+        AnalysisRecord.catalog_version,
+        AnalysisRecord.matched_ids,
+        AnalysisRecord.missing_ids,
+    ).where(AnalysisRecord.user_id == user_id)
+    if before is not None:
+        query = query.where(AnalysisRecord.id < before)
+    rows = db.execute(query.order_by(AnalysisRecord.id.desc()).limit(limit + 1)).all()
+
+    catalog = keyword_catalog()
+    points: List[Dict[str, Any]] = []
+    for row in rows[:limit]:
+        current = row.catalog_version == catalog.version
+        points.append({
+            "id": row.id,
+            "created_at": row.created_at,
+            "source": row.source,
+            "role": row.role,
+            "score": row.score,
+            "matched_count": len(row.matched_ids),
+            "missing_count": len(row.missing_ids),
+            "matched_skills": [catalog.keywords[i] for i in row.matched_ids] if current else None,
+            "missing_skills": [catalog.keywords[i] for i in row.missing_ids] if current else None,
+        })
+    next_before = points[-1]["id"] if len(rows) > limit else None
+    return points, next_before
@@ -0,0 +1,38 @@
+"""
+Direct row-to-JSON rendering for list responses.
+
+Building a Pydantic model per ORM row and letting FastAPI validate the
+response model again costs far more than the query for large pages.  List
+endpoints instead select plain column tuples, zip them into dicts in the
+response schema's field order, and serialize once with orjson.
+
+The output matches the Pydantic schemas for data the app writes itself:
+naive datetimes render identically, and stored links are emitted verbatim
+rather than re-normalised as ``AnyUrl``.
+"""
+
+from typing import Any, Dict, Iterable, List, Sequence
+
+import orjson
+
+from app.models import Job, User
+
+# Same order as the fields of schema.JobResponse / schema.UserResponse.
+JOB_COLUMNS = (
+    Job.id, Job.platform, Job.title, Job.company, Job.location, Job.category,
+    Job.salary, Job.experience, Job.link, Job.scraped_at, Job.cluster_id,
+)
+JOB_FIELDS = tuple(column.key for column in JOB_COLUMNS)
+
+USER_COLUMNS = (User.id, User.email, User.full_name, User.created_at, User.role)
+USER_FIELDS = tuple(column.key for column in USER_COLUMNS)
+
+
+def rows_to_dicts(fields: Sequence[str], rows: Iterable[Sequence[Any]]) -> List[Dict[str, Any]]:
+    """Zip column tuples into dicts keyed by ``fields``."""
+    return [dict(zip(fields, row)) for row in rows]
+
+
+def dumps(payload: Any) -> bytes:
+    """Serialize plain dicts / lists / datetimes to JSON bytes."""
+    return orjson.dumps(payload)
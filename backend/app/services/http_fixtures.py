@@ -0,0 +1,180 @@
+"""
+Record / replay HTTP fixtures for the job scraper.
+
+In ``record`` mode every response fetched during a scrape is saved to the
+fixture directory.  In ``replay`` mode the scraper's ``requests.Session`` is
+served from those files by a local transport adapter, optionally with
+injected latency and failures, so scrapes can be benchmarked and
+regression-tested without touching the live job boards.
+
+Each fixture is a pair of files named after a hash of the request:
+``<key>.json`` (URL, status, headers, encoding) and ``<key>.body`` (raw bytes).
+"""
+
+import hashlib
+import json
+import logging
+import random
+import time
+from pathlib import Path
+from typing import Optional
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+HTTP_MODES = ("live", "record", "replay")
+
+# Headers that describe the wire encoding rather than the stored (decoded) body.
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def fixture_key(method: str, url: str) -> str:
+    """Return the file stem used to store a request's fixture."""
+    return hashlib.sha1(f"{method.upper()} {url}".encode("utf-8")).hexdigest()
+
+
+class RecordingAdapter(HTTPAdapter):
+    """HTTP adapter that performs real requests and saves every response."""
+
+    def __init__(self, fixture_dir: Path, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.fixture_dir = fixture_dir
+        self.fixture_dir.mkdir(parents=True, exist_ok=True)
+
+    def send(self, request, **kwargs) -> requests.Response:  # type: ignore[override]
+        response = super().send(request, **kwargs)
+        key = fixture_key(request.method, request.url)
+        meta = {
+            "method": request.method,
+            "url": request.url,
+            "status_code": response.status_code,
+            "reason": response.reason,
+            "encoding": response.encoding,
+            "headers": {
+                k: v
+                for k, v in response.headers.items()
+                if k.lower() not in _DROPPED_HEADERS
+            },
+        }
+        (self.fixture_dir / f"{key}.body").write_bytes(response.content)
+        (self.fixture_dir / f"{key}.json").write_text(
+            json.dumps(meta, indent=2), encoding="utf-8"
+        )
+        logger.debug("Recorded fixture %s for %s", key, request.url)
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Transport adapter that serves responses from recorded fixtures.
+
+    Requests with no fixture get a 404.  ``latency_ms`` is slept before every
+    response and ``error_rate`` of requests fail, alternating between a
+    connection error and a 503, to exercise the scraper's retry path.
+    """
+
+    def __init__(
+        self,
+        fixture_dir: Path,
+        latency_ms: int = 0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ) -> None:
+        super().__init__()
+        self.fixture_dir = fixture_dir
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+
+    def send(self, request, **kwargs) -> requests.Response:  # type: ignore[override]
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            if self._random.random() < 0.5:
+                raise requests.ConnectionError(f"Injected replay failure for {request.url}")
+            return self._build_response(request, 503, b"", {}, "Service Unavailable")
+
+        key = fixture_key(request.method, request.url)
+        meta_path = self.fixture_dir / f"{key}.json"
+        if not meta_path.exists():
+            logger.warning("No fixture recorded for %s %s", request.method, request.url)
+            return self._build_response(request, 404, b"", {}, "Not Found")
+
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        body = (self.fixture_dir / f"{key}.body").read_bytes()
+        return self._build_response(
+            request,
+            meta["status_code"],
+            body,
+            meta.get("headers", {}),
+            meta.get("reason", ""),
+            meta.get("encoding"),
+        )
+
+    @staticmethod
+    def _build_response(
+        request,
+        status_code: int,
+        body: bytes,
+        headers: dict,
+        reason: str,
+        encoding: Optional[str] = None,
+    ) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status_code
+        response.reason = reason
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = body
+        response.encoding = encoding
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def create_scrape_session(
+    mode: Optional[str] = None,
+    fixture_dir: Optional[str] = None,
+    latency_ms: Optional[int] = None,
+    error_rate: Optional[float] = None,
+    seed: Optional[int] = None,
+) -> requests.Session:
+    """
+    Build the HTTP session used by the scraper.
+
+    Arguments default to the ``SCRAPE_HTTP_MODE`` / ``SCRAPE_FIXTURE_DIR`` /
+    ``SCRAPE_REPLAY_*`` settings.
+
+    Raises:
+        ValueError: If ``mode`` is not one of ``live``, ``record``, ``replay``.
+    """
+    mode = (mode or settings.SCRAPE_HTTP_MODE).lower()
+    if mode not in HTTP_MODES:
+        raise ValueError(f"Unknown scrape HTTP mode '{mode}'. Use one of {HTTP_MODES}.")
+
+    session = requests.Session()
+    if mode == "live":
+        return session
+
+    path = Path(fixture_dir or settings.SCRAPE_FIXTURE_DIR)
+    if mode == "record":
+        adapter: BaseAdapter = RecordingAdapter(path)
+    else:
+        adapter = ReplayAdapter(
+            path,
+            latency_ms=settings.SCRAPE_REPLAY_LATENCY_MS if latency_ms is None else latency_ms,
+            error_rate=settings.SCRAPE_REPLAY_ERROR_RATE if error_rate is None else error_rate,
+            seed=seed,
+        )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    logger.info("Scraper HTTP mode: %s (fixtures in %s)", mode, path)
+    return session
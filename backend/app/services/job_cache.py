@@ -0,0 +1,163 @@
+"""
+Per-scrape caches for job listing data.
+
+Job rows only change when a scrape run completes, so derived values such as
+listing totals and whole rendered responses can be computed once and reused
+until the next run.  Cached values are keyed on the *scrape generation* —
+the id of the latest completed ``ScrapeStatus``.
+
+The generation itself is cached in-process: the worker that runs a scrape
+publishes the new generation directly, and every worker re-reads it from the
+database at most once per ``JOB_GENERATION_POLL_SECONDS``, so scrapes run by
+another worker are picked up within that window.  Between polls, requests
+can be answered (or rejected with 304) without touching the database.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, Optional, Tuple
+
+from sqlalchemy import func as sa_func
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import ScrapeStatus
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on distinct filter combinations whose totals are remembered.
+MAX_CACHED_COUNTS = 1024
+
+UNFILTERED = ("all",)
+
+_lock = threading.Lock()
+_generation: int = 0
+_generation_checked_at: float = float("-inf")
+_counts: Dict[Hashable, int] = {}
+_responses: "OrderedDict[str, bytes]" = OrderedDict()
+
+
+# ---------------------------------------------------------------------------
+# Scrape generation
+# ---------------------------------------------------------------------------
+def _latest_completed_id(db: Session) -> int:
+    latest = (
+        db.query(sa_func.max(ScrapeStatus.id))
+        .filter(ScrapeStatus.status == "completed")
+        .scalar()
+    )
+    return latest or 0
+
+
+def current_generation(db: Optional[Session] = None) -> int:
+    """
+    Return the id of the latest completed scrape run (0 if none).
+
+    Served from memory unless the last database check is older than
+    ``JOB_GENERATION_POLL_SECONDS``; ``db`` is only used for that check.
+    """
+    global _generation_checked_at
+    now = time.monotonic()
+    with _lock:
+        if now - _generation_checked_at < settings.JOB_GENERATION_POLL_SECONDS:
+            return _generation
+
+    if db is not None:
+        latest = _latest_completed_id(db)
+    else:
+        with SessionLocal() as own_db:
+            latest = _latest_completed_id(own_db)
+
+    with _lock:
+        # Never move backwards past a generation published meanwhile.
+        _sync(max(latest, _generation))
+        _generation_checked_at = now
+        return _generation
+
+
+def _sync(generation: int) -> None:
+    """Drop cached values belonging to an older generation (caller holds the lock)."""
+    global _generation
+    if generation != _generation:
+        _counts.clear()
+        _responses.clear()
+        _generation = generation
+
+
+def publish_scrape(generation: int, job_count: Optional[int]) -> None:
+    """
+    Called when a scrape run completes: start a new generation and prime
+    the unfiltered total with the run's job count, when known.
+    """
+    global _generation_checked_at
+    with _lock:
+        _sync(generation)
+        _generation_checked_at = time.monotonic()
+        if job_count is not None:
+            _counts[UNFILTERED] = job_count
+    logger.info("Job cache advanced to scrape generation %d.", generation)
+
+
+# ---------------------------------------------------------------------------
+# Listing totals
+# ---------------------------------------------------------------------------
+def get_count(generation: int, key: Hashable) -> Optional[int]:
+    """Return a cached total for ``key`` in ``generation``, if present."""
+    with _lock:
+        if generation != _generation:
+            return None
+        return _counts.get(key)
+
+
+def put_count(generation: int, key: Hashable, total: int) -> None:
+    """Remember a total for ``key`` until the next scrape completes."""
+    with _lock:
+        if generation != _generation:
+            return
+        if len(_counts) >= MAX_CACHED_COUNTS:
+            _counts.pop(next(iter(_counts)))
+        _counts[key] = total
+
+
+# ---------------------------------------------------------------------------
+# Rendered responses
+# ---------------------------------------------------------------------------
+def make_etag(generation: int, path: str, params: Iterable[Tuple[str, str]]) -> str:
+    """ETag for ``path`` with query ``params`` (order-insensitive) in ``generation``."""
+    canonical = path + "?" + "&".join(f"{k}={v}" for k, v in sorted(params))
+    digest = hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+    return f'"g{generation}-{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an ``If-None-Match`` header value covers ``etag``."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def get_response(generation: int, etag: str) -> Optional[bytes]:
+    """Return a rendered response body for ``etag``, if cached."""
+    with _lock:
+        if generation != _generation:
+            return None
+        body = _responses.get(etag)
+        if body is not None:
+            _responses.move_to_end(etag)
+        return body
+
+
+def put_response(generation: int, etag: str, body: bytes) -> None:
+    """Cache a rendered body, evicting the least recently used beyond the limit."""
+    with _lock:
+        if generation != _generation or settings.JOB_RESPONSE_CACHE_SIZE <= 0:
+            return
+        _responses[etag] = body
+        _responses.move_to_end(etag)
+        while len(_responses) > settings.JOB_RESPONSE_CACHE_SIZE:
+            _responses.popitem(last=False)
@@ -0,0 +1,135 @@
+"""
+Near-duplicate job detection with MinHash + LSH.
+
+The same opening is often posted on several boards with slightly different
+titles ("Python Developer - Fresher" vs "Python Developer").  Each job gets a
+MinHash signature over word shingles of its normalised title (unigrams and
+bigrams) plus its company and location tokens; signatures are split into LSH
+bands so that a new job is only compared against the few earlier jobs sharing
+a band bucket.
+Linking a whole scrape therefore costs roughly linear time instead of
+pairwise comparison.
+
+Every job is assigned a ``cluster_id``: jobs judged near-duplicates share the
+id of the first job seen in their cluster.
+"""
+
+import hashlib
+import string
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+# Words that vary between postings of the same opening.
+_NOISE_WORDS = {
+    "fresher", "freshers", "hiring", "urgent", "urgently", "job", "jobs",
+    "opening", "openings", "vacancy", "vacancies", "position", "role",
+    "required", "wanted", "immediate", "joiner", "joiners", "walkin", "walk",
+    "in", "for", "the", "a", "an", "at", "of", "pvt", "ltd", "private",
+    "limited", "inc", "llp",
+}
+_PUNCT_TABLE = str.maketrans({c: " " for c in string.punctuation})
+
+# 16 bands of 8 rows: near-certain candidates above ~0.8 similarity, while
+# pairs that merely share a common word or city (~0.4) rarely collide.
+NUM_PERM = 128
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+# Minimum estimated Jaccard similarity for two jobs to be linked.
+SIMILARITY_THRESHOLD = 0.7
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_rng = np.random.default_rng(1)
+_PERM_A = _rng.integers(1, _MERSENNE_PRIME, size=NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.integers(0, _MERSENNE_PRIME, size=NUM_PERM, dtype=np.uint64)
+
+
+def normalize(text: str) -> str:
+    """Lowercase, strip punctuation and noise words, collapse whitespace."""
+    words = (text or "").lower().translate(_PUNCT_TABLE).split()
+    return " ".join(w for w in words if w not in _NOISE_WORDS)
+
+
+def job_key(job: Dict[str, Any]) -> str:
+    """Return the normalised text a job's signature is computed from."""
+    return " | ".join(
+        normalize(job.get(field, "")) for field in ("title", "company", "location")
+    )
+
+
+def job_shingles(job: Dict[str, Any]) -> set[str]:
+    """
+    Return the shingle set of a job.
+
+    Title words and word bigrams carry most of the weight, so "Python
+    Developer" and "Java Developer" at the same company stay apart while
+    decorated re-posts of the same title collapse together.
+    """
+    title = normalize(job.get("title", "")).split()
+    result = set(title)
+    result.update(f"{a} {b}" for a, b in zip(title, title[1:]))
+    result.update(f"c:{w}" for w in normalize(job.get("company", "")).split())
+    result.update(f"l:{w}" for w in normalize(job.get("location", "")).split())
+    return result or {""}
+
+
+def minhash(shingle_set: Iterable[str]) -> np.ndarray:
+    """Return the ``NUM_PERM``-value MinHash signature of a shingle set."""
+    hashes = np.fromiter(
+        (zlib.crc32(s.encode("utf-8")) for s in shingle_set), dtype=np.uint64
+    )
+    # Universal hashing (a*x + b) mod p, applied to every shingle per permutation.
+    permuted = (np.outer(_PERM_A, hashes) + _PERM_B[:, None]) % _MERSENNE_PRIME
+    return (permuted & _MAX_HASH).min(axis=1)
+
+
+def cluster_id_for(key: str) -> str:
+    """Stable cluster id derived from the first job of a cluster."""
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+class NearDuplicateIndex:
+    """Incremental LSH index that assigns cluster ids to jobs as they stream by."""
+
+    def __init__(self, threshold: float = SIMILARITY_THRESHOLD) -> None:
+        self.threshold = threshold
+        self._buckets: Dict[Tuple[int, bytes], List[int]] = {}
+        self._signatures: List[np.ndarray] = []
+        self._cluster_ids: List[str] = []
+
+    def assign(self, job: Dict[str, Any]) -> str:
+        """Return the cluster id for ``job``, starting a new cluster if needed."""
+        key = job_key(job)
+        signature = minhash(job_shingles(job))
+        band_keys = [
+            (band, signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND].tobytes())
+            for band in range(BANDS)
+        ]
+
+        best, best_score = -1, self.threshold
+        candidates = {i for bk in band_keys for i in self._buckets.get(bk, ())}
+        for i in candidates:
+            score = float(np.mean(self._signatures[i] == signature))
+            if score >= best_score:
+                best, best_score = i, score
+
+        if best >= 0:
+            return self._cluster_ids[best]
+
+        # New cluster representative.
+        idx = len(self._signatures)
+        self._signatures.append(signature)
+        self._cluster_ids.append(cluster_id_for(key))
+        for bk in band_keys:
+            self._buckets.setdefault(bk, []).append(idx)
+        return self._cluster_ids[idx]
+
+
+def cluster_jobs(jobs: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Pipeline stage: attach a near-duplicate ``cluster_id`` to each job."""
+    index = NearDuplicateIndex()
+    for job in jobs:
+        job["cluster_id"] = index.assign(job)
+        yield job
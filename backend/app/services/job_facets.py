@@ -0,0 +1,152 @@
+"""
+Facet counts for the job filter chips.
+
+After every scrape, ``job_facet_counts`` is rebuilt with one row per
+(category, platform, experience) combination — a few hundred rows however
+large ``jobs`` grows.  Per-facet counts, with or without active filters, are
+rolled up from those rows in Python.  A text search, which the summary
+cannot express, falls back to the same grouped query run directly against
+``jobs``.
+
+With near-duplicate clusters collapsed, a count is the number of distinct
+clusters (plus unclustered jobs) among the matching rows.  Those do not add
+up across groups, so each facet is counted by a query of its own.
+
+Counts are disjunctive: the counts for one facet ignore that facet's own
+filter, so the chips of a selected category still show how many jobs the
+other categories would give.
+"""
+
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import case, delete, func as sa_func, insert, select
+from sqlalchemy.orm import Query, Session
+
+from app.models import Job, JobFacetCount
+from app.services.job_search import contains_text
+
+logger = logging.getLogger(__name__)
+
+FACET_FIELDS = ("category", "platform", "experience")
+
+# (category, platform, experience, count)
+FacetRow = Tuple[str, str, str, int]
+
+
+def refresh_facet_counts(db: Session) -> None:
+    """Rebuild ``job_facet_counts`` from ``jobs``.  The caller commits."""
+    db.execute(delete(JobFacetCount))
+    db.execute(
+        insert(JobFacetCount).from_select(
+            ["category", "platform", "experience", "job_count"],
+            select(Job.category, Job.platform, Job.experience, sa_func.count(Job.id))
+            .group_by(Job.category, Job.platform, Job.experience),
+        )
+    )
+
+
+def backfill_facet_counts(db: Session) -> None:
+    """
+    Build ``job_facet_counts`` at startup for jobs written before the table
+    existed.  Does nothing once it has rows (or there are no jobs).
+    """
+    if db.query(JobFacetCount.id).first() or not db.query(Job.id).first():
+        return
+    logger.info("Facet summary is empty — rebuilding it.")
+    refresh_facet_counts(db)
+    db.commit()
+
+
+def summary_rows(db: Session) -> List[FacetRow]:
+    """
+    Return the precomputed facet rows.  Read-only: while the summary is
+    empty they are grouped from ``jobs`` directly.
+    """
+    rows = db.query(
+        JobFacetCount.category,
+        JobFacetCount.platform,
+        JobFacetCount.experience,
+        JobFacetCount.job_count,
+    ).all()
+    if not rows:
+        return grouped_rows(db.query(Job))
+    return [tuple(r) for r in rows]
+
+
+def grouped_rows(query: Query) -> List[FacetRow]:
+    """Run the facet GROUP BY over an already-filtered ``Job`` query."""
+    rows = (
+        query
+        .with_entities(Job.category, Job.platform, Job.experience, sa_func.count(Job.id))
+        .group_by(Job.category, Job.platform, Job.experience)
+        .all()
+    )
+    return [tuple(r) for r in rows]
+
+
+def _matches(value: Optional[str], wanted: Optional[str], match: str) -> bool:
+    if not wanted:
+        return True
+    if match == "exact":
+        return value == wanted
+    return contains_text(value, wanted)
+
+
+def rollup(
+    rows: Iterable[FacetRow],
+    filters: Dict[str, Optional[str]],
+    match: str = "contains",
+) -> Tuple[int, Dict[str, List[Tuple[str, int]]]]:
+    """
+    Roll grouped rows up into per-facet counts under ``filters``.
+
+    Returns the number of jobs matching every filter, and for each facet a
+    list of ``(value, count)`` pairs, largest first.
+    """
+    rows: Sequence[FacetRow] = list(rows)
+    hits = [
+        tuple(_matches(row[i], filters.get(field), match) for i, field in enumerate(FACET_FIELDS))
+        for row in rows
+    ]
+
+    total = sum(row[3] for row, hit in zip(rows, hits) if all(hit))
+    facets: Dict[str, List[Tuple[str, int]]] = {}
+    for i, field in enumerate(FACET_FIELDS):
+        counts: Dict[str, int] = {}
+        for row, hit in zip(rows, hits):
+            # Apply every filter except this facet's own.
+            if all(h for j, h in enumerate(hit) if j != i) and row[i]:
+                counts[row[i]] = counts.get(row[i], 0) + row[3]
+        facets[field] = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))
+    return total, facets
+
+
+def collapsed_counts(
+    filtered: Callable[[Dict[str, Optional[str]]], Query],
+    filters: Dict[str, Optional[str]],
+) -> Tuple[int, Dict[str, List[Tuple[str, int]]]]:
+    """
+    ``rollup``-shaped counts with each near-duplicate cluster counted once.
+
+    ``filtered`` builds the filtered ``Job`` query for a dict of facet
+    filters (plus whatever search the caller applies).  Each facet is
+    counted under every filter except its own, as in ``rollup``.
+    """
+    listings = (
+        sa_func.count(sa_func.distinct(Job.cluster_id))
+        + sa_func.coalesce(sa_func.sum(case((Job.cluster_id.is_(None), 1), else_=0)), 0)
+    )
+    total = filtered(filters).with_entities(listings).scalar() or 0
+    facets: Dict[str, List[Tuple[str, int]]] = {}
+    for field in FACET_FIELDS:
+        column = getattr(Job, field)
+        rows = (
+            filtered({**filters, field: None})
+            .with_entities(column, listings)
+            .group_by(column)
+            .all()
+        )
+        counts = [(value, count) for value, count in rows if value and count]
+        facets[field] = sorted(counts, key=lambda kv: (-kv[1], kv[0]))
+    return total, facets
@@ -0,0 +1,177 @@
+"""
+Skill-overlap job recommendations.
+
+At scrape time every job is tagged with keyword ids from the skills
+catalog: the skills and ATS keywords of its category's role, plus any
+catalog keyword appearing in its title.  At request time the current jobs
+are held as a sparse job × keyword matrix (CSR arrays), and a user's skills
+become a 0/1 keyword vector, so scoring every job is one gather plus one
+segmented sum — a sparse dot product — followed by a partial sort.
+
+Scores are overlap / sqrt(number of job keywords): a job is not rewarded
+just for carrying a long keyword list.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import Job
+from app.services.resume_parser import preprocess_text
+from app.services.skills_db import KeywordCatalog, keyword_catalog
+
+logger = logging.getLogger(__name__)
+
+# Longest keyword phrase looked up in job titles ("power bi", "rest apis", ...).
+MAX_TITLE_NGRAM = 3
+
+
+def job_keyword_ids(catalog: KeywordCatalog, title: str, category: str) -> List[int]:
+    """Keyword ids for a job: its category's role keywords plus title keywords."""
+    ids = set(catalog.role_keywords.get((category or "").lower(), ()))
+    words = preprocess_text(title).split()
+    for n in range(1, MAX_TITLE_NGRAM + 1):
+        for i in range(len(words) - n + 1):
+            keyword_id = catalog.vocabulary.get(" ".join(words[i:i + n]))
+            if keyword_id is not None:
+                ids.add(keyword_id)
+    return sorted(ids)
+
+
+def tag_job_keywords(jobs: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Pipeline stage: attach ``keyword_ids`` and ``keyword_catalog`` to each job."""
+    try:
+        catalog: Optional[KeywordCatalog] = keyword_catalog()
+    except (FileNotFoundError, RuntimeError) as exc:
+        logger.warning("Jobs will not be tagged with skill keywords: %s", exc)
+        catalog = None
+
+    for job in jobs:
+        if catalog is None:
+            job["keyword_ids"], job["keyword_catalog"] = None, None
+        else:
+            job["keyword_ids"] = job_keyword_ids(catalog, job["title"], job["category"])
+            job["keyword_catalog"] = catalog.version
+        yield job
+
+
+# ---------------------------------------------------------------------------
+# Scoring
+# ---------------------------------------------------------------------------
+@dataclass
+class RecommendationIndex:
+    """CSR matrix of job keyword ids for one scrape generation and catalog."""
+
+    generation: int
+    catalog_version: str
+    job_ids: np.ndarray  # (n_jobs,) int64
+    indptr: np.ndarray  # (n_jobs + 1,) int64
+    indices: np.ndarray  # (nnz,) int32 keyword ids
+    inv_norms: np.ndarray  # (n_jobs,) float32, 1 / sqrt(keywords per job)
+
+    def score(self, user_vector: np.ndarray) -> np.ndarray:
+        """Overlap of every job with a 0/1 keyword vector, length-normalised."""
+        if not len(self.job_ids):
+            return np.zeros(0, dtype=np.float32)
+        # A trailing zero keeps every row start a valid index for reduceat;
+        # rows without keywords get a stray value but an inverse norm of 0.
+        hits = np.append(user_vector[self.indices], np.float32(0))
+        return np.add.reduceat(hits, self.indptr[:-1]) * self.inv_norms
+
+
+def build_index(db: Session, catalog: KeywordCatalog, generation: int) -> RecommendationIndex:
+    """Load every job's keyword ids, recomputing any tagged with an older catalog."""
+    rows = db.execute(
+        select(Job.id, Job.title, Job.category, Job.keyword_ids, Job.keyword_catalog)
+    ).all()
+
+    job_ids = np.empty(len(rows), dtype=np.int64)
+    lengths = np.empty(len(rows), dtype=np.int64)
+    chunks: List[List[int]] = []
+    stale = 0
+    for i, row in enumerate(rows):
+        ids = row.keyword_ids
+        if ids is None or row.keyword_catalog != catalog.version:
+            ids = job_keyword_ids(catalog, row.title, row.category)
+            stale += 1
+        job_ids[i] = row.id
+        lengths[i] = len(ids)
+        chunks.append(ids)
+    if stale:
+        logger.info("Recomputed skill keywords for %d jobs tagged with another catalog.", stale)
+
+    indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=indptr[1:])
+    indices = np.fromiter(
+        (k for ids in chunks for k in ids), dtype=np.int32, count=int(indptr[-1])
+    )
+    with np.errstate(divide="ignore"):
+        inv_norms = np.where(lengths > 0, 1.0 / np.sqrt(lengths), 0.0).astype(np.float32)
+    return RecommendationIndex(generation, catalog.version, job_ids, indptr, indices, inv_norms)
+
+
+_index: Optional[RecommendationIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_index(db: Session, catalog: KeywordCatalog, generation: int) -> RecommendationIndex:
+    """Return the index for this generation and catalog, building it if needed."""
+    global _index
+    index = _index
+    if index is not None and (index.generation, index.catalog_version) == (generation, catalog.version):
+        return index
+    with _index_lock:
+        index = _index
+        if index is None or (index.generation, index.catalog_version) != (generation, catalog.version):
+            index = build_index(db, catalog, generation)
+            _index = index
+    return index
+
+
+def recommend(
+    db: Session,
+    skills: List[str],
+    generation: int,
+    limit: int = 20,
+) -> Tuple[List[Tuple[int, float, List[int]]], List[str]]:
+    """
+    Rank current jobs by overlap with ``skills``.
+
+    Returns ``(ranked, skills_used)`` where ``ranked`` holds up to ``limit``
+    ``(job_id, score, matched keyword ids)`` tuples, best first, and
+    ``skills_used`` lists the input skills found in the catalog.
+    """
+    catalog = keyword_catalog()
+    skill_ids = catalog.lookup(skills)
+    if not skill_ids:
+        return [], []
+
+    index = get_index(db, catalog, generation)
+    user_vector = np.zeros(len(catalog.keywords), dtype=np.float32)
+    user_vector[skill_ids] = 1.0
+
+    scores = index.score(user_vector)
+    candidates = np.flatnonzero(scores > 0)
+    if len(candidates) > limit:
+        # Keep everything scoring at least the limit-th best, so ties at the
+        # cut-off are settled by the job id sort below, not by the partition.
+        candidate_scores = scores[candidates]
+        cutoff = np.partition(candidate_scores, len(candidates) - limit)[len(candidates) - limit]
+        candidates = candidates[candidate_scores >= cutoff]
+    candidates = candidates[np.lexsort((-index.job_ids[candidates], -scores[candidates]))][:limit]
+
+    skill_set = set(skill_ids)
+    ranked = [
+        (
+            int(index.job_ids[i]),
+            round(float(scores[i]), 4),
+            [k for k in index.indices[index.indptr[i]:index.indptr[i + 1]].tolist() if k in skill_set],
+        )
+        for i in candidates
+    ]
+    return ranked, [catalog.keywords[k] for k in skill_ids]
@@ -4,19 +4,38 @@ Job scraper service — FreshersWorld and Internshala.
 Migrated from web_scraping/web_scraping_jobs.py.  All Streamlit references
 have been removed; uses Python logging instead.  Category names now match
 the role names in skills_data.csv.
+
+The scrape is a chain of lazy generator stages:
+
+    fetch pages → parse cards → classify → dedupe → near-duplicate clustering
+    → batched DB writer
+
+Each stage pulls one item at a time from the previous one, so memory stays
+flat regardless of how many pages are crawled and the first batch of rows is
+committed while later pages are still being downloaded.
 """
 
+import itertools
 import logging
 import time
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-import pandas as pd
 import requests
 from bs4 import BeautifulSoup
+from sqlalchemy import delete, func as sa_func, insert, select
 from sqlalchemy.orm import Session
 
-from app.models import Job, ScrapeStatus
+from app.config import settings
+from app.models import Job, ScrapePageMetric, ScrapeStatus, StagedJob
+from app.services import job_snapshot
+from app.services.http_fixtures import ReplayAdapter, create_scrape_session
+from app.services.job_cache import publish_scrape
+from app.services.job_dedupe import cluster_jobs
+from app.services.job_facets import refresh_facet_counts
+from app.services.job_recommender import tag_job_keywords
 
 logger = logging.getLogger(__name__)
 
@@ -66,195 +85,474 @@ def classify_job_category(job_title: str) -> str:
 
 
 # ============================================================================
-# FreshersWorld Scraper
+# Telemetry
+# ============================================================================
+
+@dataclass
+class PageMetrics:
+    """Timings and counters for one fetched listing page."""
+
+    platform: str
+    page: int
+    url: str
+    status_code: Optional[int] = None
+    retries: int = 0
+    latency_ms: float = 0.0
+    bytes: int = 0
+    parse_ms: float = 0.0
+    cards_found: int = 0
+    rows_written: int = 0
+    write_ms: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class ScrapeTelemetry:
+    """Collects ``PageMetrics`` for every page requested during a run."""
+
+    pages: List[PageMetrics] = field(default_factory=list)
+
+    def new_page(self, platform: str, page: int, url: str) -> PageMetrics:
+        metrics = PageMetrics(platform=platform, page=page, url=url)
+        self.pages.append(metrics)
+        return metrics
+
+    def save(self, db: Session, scrape_id: int) -> None:
+        """Persist the collected metrics as children of a ``ScrapeStatus`` row."""
+        if not self.pages:
+            return
+        db.execute(
+            insert(ScrapePageMetric),
+            [{**asdict(m), "scrape_id": scrape_id} for m in self.pages],
+        )
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 2)
+
+
 # ============================================================================
+# Fetch stage
+# ============================================================================
+
+@dataclass
+class FetchedPage:
+    """Raw HTML for one listing page."""
+
+    platform: str
+    page: int
+    url: str
+    html: str
+    metrics: PageMetrics
 
-def scrape_freshersworld_jobs(num_pages: int = 3) -> pd.DataFrame:
+
+def _is_replay(session: requests.Session) -> bool:
+    """True if ``session`` serves recorded fixtures instead of the live sites."""
+    return any(isinstance(adapter, ReplayAdapter) for adapter in session.adapters.values())
+
+
+def _get_with_retries(
+    session: requests.Session,
+    url: str,
+    headers: Dict[str, str],
+    metrics: PageMetrics,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Optional[requests.Response]:
     """
-    Scrape IT job listings from FreshersWorld.com.
+    GET a page, retrying network errors, 429 and 5xx with linear backoff
+    (``SCRAPE_RETRY_BACKOFF_SECONDS`` per attempt; none when replaying).
 
-    Args:
-        num_pages: Number of result pages to scrape.
+    Latency covers all attempts; the response (or None) is from the last one.
+    """
+    response: Optional[requests.Response] = None
+    backoff = 0.0 if _is_replay(session) else settings.SCRAPE_RETRY_BACKOFF_SECONDS
+    start = time.perf_counter()
+    for attempt in range(settings.SCRAPE_MAX_RETRIES + 1):
+        if attempt:
+            metrics.retries += 1
+            if backoff:
+                sleep(attempt * backoff)
+        try:
+            response = session.get(url, headers=headers, timeout=15)
+        except Exception as exc:
+            metrics.error = str(exc)
+            response = None
+            continue
+        metrics.error = None
+        if response.status_code != 429 and response.status_code < 500:
+            break
+    metrics.latency_ms = _elapsed_ms(start)
+    if response is not None:
+        metrics.status_code = response.status_code
+        metrics.bytes = len(response.content)
+    return response
+
+
+class ScrapeCancelled(RuntimeError):
+    """Raised by a ``checkpoint`` to abandon a scrape between pages."""
+
+
+def fetch_pages(
+    session: requests.Session,
+    platform: str,
+    urls: Iterable[str],
+    headers: Dict[str, str],
+    delay: float = 1.0,
+    telemetry: Optional[ScrapeTelemetry] = None,
+    checkpoint: Optional[Callable[[], None]] = None,
+) -> Iterator[FetchedPage]:
+    """
+    Download listing pages one at a time.
 
-    Returns:
-        DataFrame with standardised columns.
+    The next page is only requested once the consumer asks for it, so a
+    downstream stage that stops iterating (e.g. no more cards) also stops
+    the crawl.  Non-200 responses and network errors are logged and skipped.
+    ``checkpoint`` runs before each page; it may raise ``ScrapeCancelled``
+    to stop the scrape.
     """
-    all_jobs: List[Dict[str, Any]] = []
-    base_url = "https://www.freshersworld.com/jobs/category/it-software-job-vacancies"
-
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        ),
-        "Referer": "https://www.freshersworld.com/",
-    }
+    telemetry = telemetry or ScrapeTelemetry()
+    for page, url in enumerate(urls, start=1):
+        if checkpoint is not None:
+            checkpoint()
+        if page > 1 and delay:
+            time.sleep(delay)  # Respectful delay
+
+        metrics = telemetry.new_page(platform, page, url)
+        response = _get_with_retries(session, url, headers, metrics)
+        if response is None:
+            logger.error("Error fetching %s page %d: %s", platform, page, metrics.error)
+            continue
+
+        if response.status_code != 200:
+            logger.warning(
+                "%s page %d returned status %d", platform, page, response.status_code
+            )
+            continue
+
+        yield FetchedPage(
+            platform=platform, page=page, url=url, html=response.text, metrics=metrics
+        )
+
+
+# ============================================================================
+# Parse stage
+# ============================================================================
+
+# Key under which each job dict carries its source page's metrics until it is
+# written; the writer strips it before inserting.
+PAGE_METRICS_KEY = "_page_metrics"
+
+
+def parse_pages(
+    pages: Iterable[FetchedPage],
+    find_cards: Callable[[BeautifulSoup], List[Any]],
+    parse_card: Callable[[Any], Optional[Dict[str, Any]]],
+) -> Iterator[Dict[str, Any]]:
+    """
+    Turn fetched pages into job dicts, stopping at the first page with no cards.
+    """
+    found = 0
+    for fetched in pages:
+        start = time.perf_counter()
+        soup = BeautifulSoup(fetched.html, "html.parser")
+        cards = find_cards(soup)
+        fetched.metrics.cards_found = len(cards)
+        fetched.metrics.parse_ms += _elapsed_ms(start)
+        if not cards:
+            logger.info(
+                "%s: no cards found on page %d — stopping.", fetched.platform, fetched.page
+            )
+            break
+
+        for card in cards:
+            start = time.perf_counter()
+            try:
+                job = parse_card(card)
+            except Exception:
+                job = None
+            fetched.metrics.parse_ms += _elapsed_ms(start)
+            if job is not None:
+                found += 1
+                job[PAGE_METRICS_KEY] = fetched.metrics
+                yield job
+
+        logger.info(
+            "%s page %d scraped (%d jobs so far).", fetched.platform, fetched.page, found
+        )
+
+
+# ============================================================================
+# FreshersWorld Scraper
+# ============================================================================
+
+FW_BASE_URL = "https://www.freshersworld.com/jobs/category/it-software-job-vacancies"
+
+FW_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Referer": "https://www.freshersworld.com/",
+}
 
-    logger.info("Starting FreshersWorld scraper (%d pages)…", num_pages)
 
+def _freshersworld_urls(num_pages: int) -> Iterator[str]:
     for page in range(1, num_pages + 1):
-        try:
-            if page == 1:
-                url = base_url
-            else:
-                offset = (page - 1) * 20
-                url = f"{base_url}?&limit=20&offset={offset}"
-
-            response = requests.get(url, headers=headers, timeout=15)
-            if response.status_code != 200:
-                logger.warning("FW page %d returned status %d", page, response.status_code)
-                continue
-
-            soup = BeautifulSoup(response.text, "html.parser")
-            job_cards = soup.find_all("div", class_="job-container")
-
-            if not job_cards:
-                # Fallback selector
-                job_cards = soup.find_all("div", {"job_id": True})
-
-            if not job_cards:
-                logger.info("FW: no more cards found on page %d — stopping.", page)
-                break
-
-            for card in job_cards:
-                try:
-                    title_elem = card.find("span", class_="wrap-title") or card.find(
-                        "span", class_="seo_title"
-                    )
-                    job_title = title_elem.text.strip() if title_elem else ""
-
-                    company_elem = card.find("h3", class_="latest-jobs-title")
-                    company = company_elem.text.strip() if company_elem else ""
-
-                    location_elem = card.find("span", class_="job-location")
-                    if location_elem:
-                        loc_link = location_elem.find("a")
-                        location = loc_link.text.strip() if loc_link else location_elem.text.strip()
-                    else:
-                        location = "Not specified"
-
-                    # Salary
-                    salary = "Not disclosed"
-                    for span in card.find_all("span", class_="qualifications"):
-                        text = span.text.strip()
-                        if "Monthly" in text or "Yearly" in text or "-" in text:
-                            salary = text
-                            break
-
-                    # Experience
-                    exp_elem = card.find("span", class_="experience")
-                    experience = exp_elem.text.strip() if exp_elem else "Fresher"
-
-                    # Link
-                    link_elem = card.find("a", href=True)
-                    if link_elem and "freshersworld.com/jobs/" in link_elem.get("href", ""):
-                        job_link = link_elem.get("href", "")
-                    else:
-                        job_link = card.get("job_display_url", "")
-
-                    if job_title:
-                        all_jobs.append({
-                            "platform": "FreshersWorld",
-                            "title": job_title,
-                            "company": company,
-                            "location": location,
-                            "category": classify_job_category(job_title),
-                            "salary": salary,
-                            "experience": experience,
-                            "job_link": job_link,
-                        })
-                except Exception:
-                    continue
-
-            logger.info("FW page %d scraped (%d jobs so far).", page, len(all_jobs))
-
-            # Respectful delay
-            if page < num_pages:
-                time.sleep(1)
+        if page == 1:
+            yield FW_BASE_URL
+        else:
+            offset = (page - 1) * 20
+            yield f"{FW_BASE_URL}?&limit=20&offset={offset}"
 
-        except Exception as exc:
-            logger.error("Error scraping FW page %d: %s", page, exc)
-            continue
 
-    return pd.DataFrame(all_jobs)
+def _find_freshersworld_cards(soup: BeautifulSoup) -> List[Any]:
+    job_cards = soup.find_all("div", class_="job-container")
+    if not job_cards:
+        # Fallback selector
+        job_cards = soup.find_all("div", {"job_id": True})
+    return job_cards
+
+
+def _parse_freshersworld_card(card: Any) -> Optional[Dict[str, Any]]:
+    title_elem = card.find("span", class_="wrap-title") or card.find(
+        "span", class_="seo_title"
+    )
+    job_title = title_elem.text.strip() if title_elem else ""
+    if not job_title:
+        return None
+
+    company_elem = card.find("h3", class_="latest-jobs-title")
+    company = company_elem.text.strip() if company_elem else ""
+
+    location_elem = card.find("span", class_="job-location")
+    if location_elem:
+        loc_link = location_elem.find("a")
+        location = loc_link.text.strip() if loc_link else location_elem.text.strip()
+    else:
+        location = "Not specified"
+
+    # Salary
+    salary = "Not disclosed"
+    for span in card.find_all("span", class_="qualifications"):
+        text = span.text.strip()
+        if "Monthly" in text or "Yearly" in text or "-" in text:
+            salary = text
+            break
+
+    # Experience
+    exp_elem = card.find("span", class_="experience")
+    experience = exp_elem.text.strip() if exp_elem else "Fresher"
+
+    # Link
+    link_elem = card.find("a", href=True)
+    if link_elem and "freshersworld.com/jobs/" in link_elem.get("href", ""):
+        job_link = link_elem.get("href", "")
+    else:
+        job_link = card.get("job_display_url", "")
+
+    return {
+        "platform": "FreshersWorld",
+        "title": job_title,
+        "company": company,
+        "location": location,
+        "salary": salary,
+        "experience": experience,
+        "link": job_link,
+    }
+
+
+def scrape_freshersworld_jobs(
+    num_pages: int = 3,
+    session: Optional[requests.Session] = None,
+    telemetry: Optional[ScrapeTelemetry] = None,
+    page_delay: float = 1.0,
+    checkpoint: Optional[Callable[[], None]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily scrape IT job listings from FreshersWorld.com.
+
+    Args:
+        num_pages: Maximum number of result pages to scrape.
+        session: Optional HTTP session to reuse connections across pages.
+        telemetry: Optional collector for per-page metrics.
+        page_delay: Seconds to wait between page requests.
+        checkpoint: Called before each page request (see ``fetch_pages``).
+
+    Yields:
+        Job dicts with standardised keys (not yet classified).
+    """
+    logger.info("Starting FreshersWorld scraper (%d pages)…", num_pages)
+    pages = fetch_pages(
+        session or requests.Session(),
+        "FreshersWorld",
+        _freshersworld_urls(num_pages),
+        FW_HEADERS,
+        delay=page_delay,
+        telemetry=telemetry,
+        checkpoint=checkpoint,
+    )
+    return parse_pages(pages, _find_freshersworld_cards, _parse_freshersworld_card)
 
 
 # ============================================================================
 # Internshala Scraper
 # ============================================================================
 
-def scrape_internshala_jobs(num_pages: int = 5) -> pd.DataFrame:
+INTERNSHALA_HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+
+def _internshala_urls(num_pages: int) -> Iterator[str]:
+    for page in range(1, num_pages + 1):
+        yield f"https://internshala.com/jobs/information-technology-jobs/page-{page}"
+
+
+def _find_internshala_cards(soup: BeautifulSoup) -> List[Any]:
+    return soup.find_all("div", class_="individual_internship")
+
+
+def _parse_internshala_card(card: Any) -> Optional[Dict[str, Any]]:
+    title = card.find("a", class_="job-title-href")
+    company = card.find("p", class_="company-name")
+    location = card.find("div", class_="locations")
+    salary = card.find("span", class_="mobile")
+    experience_element = card.select(".row-1-item span")
+
+    job_title = title.text.strip() if title else ""
+    job_link = ""
+    if title and title.has_attr("href"):
+        job_link = f"https://internshala.com{title['href']}"
+
+    return {
+        "platform": "Internshala",
+        "title": job_title,
+        "company": company.text.strip() if company else "",
+        "location": location.text.strip() if location else "",
+        "salary": salary.text.strip() if salary else "Not disclosed",
+        "experience": (
+            experience_element[-1].text.strip()
+            if experience_element
+            else "Fresher"
+        ),
+        "link": job_link,
+    }
+
+
+def scrape_internshala_jobs(
+    num_pages: int = 5,
+    session: Optional[requests.Session] = None,
+    telemetry: Optional[ScrapeTelemetry] = None,
+    page_delay: float = 1.0,
+    checkpoint: Optional[Callable[[], None]] = None,
+) -> Iterator[Dict[str, Any]]:
     """
-    Scrape IT job listings from Internshala.
+    Lazily scrape IT job listings from Internshala.
 
     Args:
-        num_pages: Number of result pages to scrape.
-
-    Returns:
-        DataFrame with standardised columns.
+        num_pages: Maximum number of result pages to scrape.
+        session: Optional HTTP session to reuse connections across pages.
+        telemetry: Optional collector for per-page metrics.
+        page_delay: Seconds to wait between page requests.
+        checkpoint: Called before each page request (see ``fetch_pages``).
+
+    Yields:
+        Job dicts with standardised keys (not yet classified).
     """
-    all_jobs: List[Dict[str, Any]] = []
     logger.info("Starting Internshala scraper (%d pages)…", num_pages)
+    pages = fetch_pages(
+        session or requests.Session(),
+        "Internshala",
+        _internshala_urls(num_pages),
+        INTERNSHALA_HEADERS,
+        delay=page_delay,
+        telemetry=telemetry,
+        checkpoint=checkpoint,
+    )
+    return parse_pages(pages, _find_internshala_cards, _parse_internshala_card)
 
-    for i in range(1, num_pages + 1):
-        try:
-            url = f"https://internshala.com/jobs/information-technology-jobs/page-{i}"
-            response = requests.get(
-                url, headers={"User-Agent": "Mozilla/5.0"}, timeout=15
-            )
 
-            if response.status_code != 200:
-                logger.warning("Internshala page %d returned status %d", i, response.status_code)
-                continue
-
-            soup = BeautifulSoup(response.text, "html.parser")
-            cards = soup.find_all("div", class_="individual_internship")
-
-            if not cards:
-                logger.info("Internshala: no cards on page %d — stopping.", i)
-                break
-
-            for card in cards:
-                try:
-                    title = card.find("a", class_="job-title-href")
-                    company = card.find("p", class_="company-name")
-                    location = card.find("div", class_="locations")
-                    salary = card.find("span", class_="mobile")
-                    experience_element = card.select(".row-1-item span")
-
-                    job_title = title.text.strip() if title else ""
-                    job_link = ""
-                    if title and title.has_attr("href"):
-                        job_link = f"https://internshala.com{title['href']}"
-
-                    all_jobs.append({
-                        "platform": "Internshala",
-                        "title": job_title,
-                        "company": company.text.strip() if company else "",
-                        "location": location.text.strip() if location else "",
-                        "category": classify_job_category(job_title),
-                        "salary": salary.text.strip() if salary else "Not disclosed",
-                        "experience": (
-                            experience_element[-1].text.strip()
-                            if experience_element
-                            else "Fresher"
-                        ),
-                        "job_link": job_link,
-                    })
-                except Exception:
-                    continue
-
-            logger.info("Internshala page %d scraped (%d jobs so far).", i, len(all_jobs))
-
-            if i < num_pages:
-                time.sleep(1)
+# ============================================================================
+# Classify / dedupe / write stages
+# ============================================================================
 
-        except Exception as exc:
-            logger.error("Error scraping Internshala page %d: %s", i, exc)
+def classify_jobs(jobs: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Attach a ``category`` to each job based on its title."""
+    for job in jobs:
+        job["category"] = classify_job_category(job["title"])
+        yield job
+
+
+def dedupe_jobs(jobs: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Drop exact (title, company) repeats, keeping the first occurrence."""
+    seen: set[Tuple[str, str]] = set()
+    for job in jobs:
+        key = (job["title"], job["company"])
+        if key in seen:
             continue
+        seen.add(key)
+        yield job
+
+
+def write_jobs(
+    db: Session,
+    jobs: Iterable[Dict[str, Any]],
+    batch_size: int = 50,
+) -> Dict[str, int]:
+    """
+    Insert jobs into ``jobs_staging`` in batches, committing after each batch.
+
+    DB time is attributed evenly to the rows of each batch and added to
+    their source page's metrics.
+
+    Returns:
+        Number of rows written per platform.
+    """
+    written: Dict[str, int] = {}
+    batch: List[Dict[str, Any]] = []
+
+    batch_metrics: List[Optional[PageMetrics]] = []
 
-    return pd.DataFrame(all_jobs)
+    def flush() -> None:
+        start = time.perf_counter()
+        db.execute(insert(StagedJob), batch)
+        db.commit()
+        per_row_ms = _elapsed_ms(start) / len(batch)
+        for row, metrics in zip(batch, batch_metrics):
+            written[row["platform"]] = written.get(row["platform"], 0) + 1
+            if metrics is not None:
+                metrics.rows_written += 1
+                metrics.write_ms += per_row_ms
+        batch.clear()
+        batch_metrics.clear()
+
+    for job in jobs:
+        batch_metrics.append(job.pop(PAGE_METRICS_KEY, None))
+        batch.append({**job, "scraped_at": datetime.utcnow()})
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+    return written
+
+
+def _publish_staged_jobs(db: Session) -> None:
+    """
+    Replace the rows in ``jobs`` with the staged run, in the caller's
+    transaction.
+
+    The staged rows are inserted first, in staging order, so they get ids
+    above every earlier run's; then the earlier rows are deleted.
+    """
+    last_old_id: int = db.query(sa_func.max(Job.id)).scalar() or 0
+    columns = [c.name for c in StagedJob.__table__.columns if c.name != "id"]
+    db.execute(
+        insert(Job).from_select(
+            columns,
+            select(*(StagedJob.__table__.c[name] for name in columns)).order_by(StagedJob.id),
+        )
+    )
+    db.execute(delete(Job).where(Job.id <= last_old_id))
+    db.execute(delete(StagedJob))
 
 
 # ============================================================================
@@ -265,18 +563,30 @@ def scrape_and_store_jobs(
     db: Session,
     num_pages_internshala: int = 5,
     num_pages_fw: int = 3,
+    batch_size: int = 50,
+    session: Optional[requests.Session] = None,
+    checkpoint: Optional[Callable[[], None]] = None,
 ) -> ScrapeStatus:
     """
     Scrape both platforms, deduplicate, and persist to the database.
 
-    Creates a ``ScrapeStatus`` record to track progress.  On success the
-    status is updated to ``'completed'``; on failure it is marked
-    ``'failed'`` with the error message.
+    Creates a ``ScrapeStatus`` record to track progress, with one
+    ``ScrapePageMetric`` child row per requested page.  New rows are
+    committed to ``jobs_staging`` in batches as pages arrive and are not
+    visible to readers.  Once the run succeeds, one transaction copies them
+    into ``jobs``, deletes the previous run's rows and rebuilds the facet
+    summary, so ``jobs`` always holds exactly one complete run.  On failure
+    the staged rows are discarded.
 
     Args:
         db: An active SQLAlchemy session.
         num_pages_internshala: Pages to scrape from Internshala.
         num_pages_fw: Pages to scrape from FreshersWorld.
+        batch_size: Rows inserted per commit.
+        session: HTTP session to scrape with.  Defaults to one built from the
+            ``SCRAPE_HTTP_MODE`` setting (live, record or replay).
+        checkpoint: Called before each page request; raising
+            ``ScrapeCancelled`` from it fails the run and discards its rows.
 
     Returns:
         The ``ScrapeStatus`` ORM instance (committed).
@@ -286,71 +596,75 @@ def scrape_and_store_jobs(
         status="running",
     )
     db.add(scrape_status)
+    # Leftovers of a run that died before publishing or cleaning up.
+    db.execute(delete(StagedJob))
     db.commit()
     db.refresh(scrape_status)
 
+    telemetry = ScrapeTelemetry()
+
     try:
-        # 1. Scrape both platforms
-        df_internshala = scrape_internshala_jobs(num_pages=num_pages_internshala)
-        df_fw = scrape_freshersworld_jobs(num_pages=num_pages_fw)
-
-        # 2. Combine
-        frames = []
-        if not df_internshala.empty:
-            frames.append(df_internshala)
-        if not df_fw.empty:
-            frames.append(df_fw)
-
-        if not frames:
-            scrape_status.status = "completed"
-            scrape_status.completed_at = datetime.utcnow()
-            scrape_status.job_count = 0
-            db.commit()
-            logger.warning("Scraping returned 0 jobs from both platforms.")
-            return scrape_status
-
-        df_combined = pd.concat(frames, ignore_index=True)
-
-        # 3. Deduplicate by (title, company)
-        df_combined.drop_duplicates(subset=["title", "company"], keep="first", inplace=True)
-
-        # 4. Clear old jobs and insert new ones
-        db.query(Job).delete()
-
-        jobs_added = 0
-        for _, row in df_combined.iterrows():
-            job = Job(
-                platform=row.get("platform", ""),
-                title=row.get("title", ""),
-                company=row.get("company", ""),
-                location=row.get("location", "Not specified"),
-                category=row.get("category", "Information Technology"),
-                salary=row.get("salary", "Not disclosed"),
-                experience=row.get("experience", "Fresher"),
-                link=row.get("job_link", ""),
-                scraped_at=datetime.utcnow(),
+        # A caller-provided session is left open for the caller to reuse.
+        http_context = nullcontext(session) if session is not None else create_scrape_session()
+        with http_context as http:
+            # Fixtures are local, so there is no site to be polite to.
+            page_delay = 0.0 if _is_replay(http) else 1.0
+            jobs = itertools.chain(
+                scrape_internshala_jobs(
+                    num_pages=num_pages_internshala,
+                    session=http,
+                    telemetry=telemetry,
+                    page_delay=page_delay,
+                    checkpoint=checkpoint,
+                ),
+                scrape_freshersworld_jobs(
+                    num_pages=num_pages_fw,
+                    session=http,
+                    telemetry=telemetry,
+                    page_delay=page_delay,
+                    checkpoint=checkpoint,
+                ),
             )
-            db.add(job)
-            jobs_added += 1
+            written = write_jobs(
+                db,
+                tag_job_keywords(cluster_jobs(dedupe_jobs(classify_jobs(jobs)))),
+                batch_size,
+            )
+
+        jobs_added = sum(written.values())
+        if jobs_added == 0:
+            logger.warning("Scraping returned 0 jobs from both platforms.")
+        else:
+            _publish_staged_jobs(db)
+            refresh_facet_counts(db)
 
-        # 5. Update status
         scrape_status.status = "completed"
         scrape_status.completed_at = datetime.utcnow()
         scrape_status.job_count = jobs_added
+        telemetry.save(db, scrape_status.id)
         db.commit()
+        # An empty run keeps the previous rows, so their count is unchanged.
+        publish_scrape(scrape_status.id, jobs_added if jobs_added else None)
+        job_snapshot.refresh_in_background(scrape_status.id)
 
         logger.info(
             "Scraping completed: %d jobs stored (Internshala=%d, FW=%d).",
             jobs_added,
-            len(df_internshala),
-            len(df_fw),
+            written.get("Internshala", 0),
+            written.get("FreshersWorld", 0),
         )
         return scrape_status
 
     except Exception as exc:
-        logger.exception("Scraping failed")
+        if isinstance(exc, ScrapeCancelled):
+            logger.warning("Scraping stopped: %s", exc)
+        else:
+            logger.exception("Scraping failed")
+        db.rollback()
+        db.execute(delete(StagedJob))
         scrape_status.status = "failed"
         scrape_status.completed_at = datetime.utcnow()
         scrape_status.error_message = str(exc)
+        telemetry.save(db, scrape_status.id)
         db.commit()
         return scrape_status
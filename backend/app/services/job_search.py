@@ -0,0 +1,160 @@
+"""
+SQLite FTS5 full-text index over job listings.
+
+``jobs_fts`` is an external-content FTS5 table mirroring the title, company,
+location and category of every row in ``jobs``.  Triggers keep it in sync
+with inserts, updates and deletes, so scrape writes need no extra work.
+Searches support prefix matching, multi-word queries (all words must match)
+and BM25 relevance ordering.
+
+The plain substring filters (``match=contains`` and ``search_mode=like``)
+use ``ILIKE`` with the wildcards escaped.  ``contains_text`` applies the
+same rule in Python, for the facet rollup and the in-memory read model.
+"""
+
+import logging
+import re
+import string
+from typing import Optional
+
+from sqlalchemy import Column, Integer, MetaData, Table, Text, func, literal_column, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql.elements import ColumnElement
+
+logger = logging.getLogger(__name__)
+
+# Lightweight table handle for building queries; deliberately kept out of
+# Base.metadata so create_all never tries to create it as a normal table.
+jobs_fts = Table(
+    "jobs_fts",
+    MetaData(),
+    Column("rowid", Integer, primary_key=True),
+    Column("title", Text),
+    Column("company", Text),
+    Column("location", Text),
+    Column("category", Text),
+)
+
+# BM25 column weights, in the order the columns are declared below.
+_BM25_WEIGHTS = (10.0, 5.0, 1.0, 2.0)
+
+# Scoring every match of a very broad query ("developer") costs far more than
+# walking the index newest-first, so above this many matches results are
+# ordered by recency instead of relevance.
+RANK_MATCH_LIMIT = 5000
+
+_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+        title, company, location, category,
+        content='jobs', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+        INSERT INTO jobs_fts(rowid, title, company, location, category)
+        VALUES (new.id, new.title, new.company, new.location, new.category);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, category)
+        VALUES ('delete', old.id, old.title, old.company, old.location, old.category);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_au AFTER UPDATE ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, category)
+        VALUES ('delete', old.id, old.title, old.company, old.location, old.category);
+        INSERT INTO jobs_fts(rowid, title, company, location, category)
+        VALUES (new.id, new.title, new.company, new.location, new.category);
+    END
+    """,
+]
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+LIKE_ESCAPE = "\\"
+
+# SQLite's LIKE only folds ASCII letters, so "É" does not match "é".
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def fts_available(engine: Engine) -> bool:
+    """Full-text search is only implemented for SQLite."""
+    return engine.dialect.name == "sqlite"
+
+
+def ensure_search_index(engine: Engine) -> None:
+    """
+    Create the FTS table and sync triggers if missing.
+
+    When the index is created on a database that already has jobs, it is
+    rebuilt from the ``jobs`` table once.
+    """
+    if not fts_available(engine):
+        logger.info("Full-text job search needs SQLite — skipping FTS index.")
+        return
+
+    with engine.begin() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'")
+        ).first()
+        for statement in _FTS_DDL:
+            conn.execute(text(statement))
+        if not exists:
+            conn.execute(text("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')"))
+            logger.info("Built full-text index for existing jobs.")
+
+
+def build_match_query(search: str) -> Optional[str]:
+    """
+    Turn free text into an FTS5 MATCH expression.
+
+    Every word becomes a quoted prefix term and all terms must match, so
+    ``"pyth dev"`` finds "Python Developer".  Returns None if the input has
+    no searchable words.
+    """
+    tokens = _TOKEN_RE.findall(search.lower())
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def fts_order_by(match_count: int):
+    """
+    Return the ORDER BY clause for a full-text search with ``match_count`` hits.
+
+    BM25 relevance (lower is better) for selective queries; for broad ones,
+    descending rowid, which FTS5 can stream straight from its index.  Job ids
+    grow with insertion order, so this is newest-first.
+    """
+    if match_count <= RANK_MATCH_LIMIT:
+        return func.bm25(literal_column("jobs_fts"), *_BM25_WEIGHTS)
+    return jobs_fts.c.rowid.desc()
+
+
+# ============================================================================
+# Substring matching
+# ============================================================================
+
+def fold_case(value: str) -> str:
+    """Lowercase ASCII letters only, as SQLite's ``LIKE`` compares them."""
+    return value.translate(_ASCII_LOWER)
+
+
+def contains_text(value: Optional[str], needle: str) -> bool:
+    """Python twin of ``contains_clause``: case-insensitive literal substring test."""
+    return fold_case(needle) in fold_case(value or "")
+
+
+def contains_clause(column: ColumnElement, needle: str) -> ColumnElement:
+    """``column ILIKE '%needle%'`` with ``%``, ``_`` and the escape character taken literally."""
+    escaped = (
+        needle.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", LIKE_ESCAPE + "%")
+        .replace("_", LIKE_ESCAPE + "_")
+    )
+    return column.ilike(f"%{escaped}%", escape=LIKE_ESCAPE)
@@ -0,0 +1,267 @@
+"""
+In-memory columnar read model of the jobs table.
+
+When ``JOB_READ_MODEL`` is enabled, each worker keeps a snapshot of every job
+row, built once per scrape generation and already sorted newest-first
+(``scraped_at DESC, id DESC``):
+
+* low-cardinality columns (category, platform, experience, company,
+  location, salary) are dictionary-encoded as ``int32`` codes plus a value
+  list;
+* category, platform and experience also get one packed bitmap per distinct
+  value, so a filter is an OR over the matching values' bitmaps and several
+  filters are ANDed together;
+* titles, links and cluster ids stay as plain lists, touched only for the
+  rows of the requested page;
+* case-folded "title, company" pairs are joined into one string, so a
+  substring search is a single regex scan mapped back to rows with a binary
+  search over the row offsets.
+
+Listing requests that the snapshot can answer never open a database
+connection.  Full-text (``search_mode=fts``) searches keep using SQLite,
+since their relevance order comes from the FTS5 index.
+
+A fresh snapshot is built off to the side and swapped in with a single
+reference assignment, so readers always see one complete generation.
+"""
+
+import logging
+import re
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import Job
+from app.services.job_search import contains_text, fold_case
+
+logger = logging.getLogger(__name__)
+
+# Dictionary-encoded columns; the first three also get per-value bitmaps.
+_ENCODED_FIELDS = ("category", "platform", "experience", "company", "location", "salary")
+BITMAP_FIELDS = ("category", "platform", "experience")
+
+
+class JobSnapshot:
+    """Immutable columnar copy of the jobs table for one scrape generation."""
+
+    def __init__(self, generation: int, rows: Sequence[Any]) -> None:
+        self.generation = generation
+        self.size = len(rows)
+
+        self.ids = np.fromiter((r.id for r in rows), dtype=np.int64, count=self.size)
+        self.scraped_at = np.array([r.scraped_at for r in rows], dtype="datetime64[us]")
+        self.titles: List[str] = [r.title for r in rows]
+        self.links: List[str] = [r.link for r in rows]
+        self.cluster_ids: List[Optional[str]] = [r.cluster_id for r in rows]
+
+        self.values: Dict[str, List[str]] = {}
+        self.codes: Dict[str, np.ndarray] = {}
+        for field in _ENCODED_FIELDS:
+            lookup: Dict[str, int] = {}
+            codes = np.fromiter(
+                (lookup.setdefault(getattr(r, field), len(lookup)) for r in rows),
+                dtype=np.int32,
+                count=self.size,
+            )
+            self.values[field] = list(lookup)
+            self.codes[field] = codes
+
+        self.bitmaps: Dict[str, List[np.ndarray]] = {
+            field: [np.packbits(self.codes[field] == code) for code in range(len(self.values[field]))]
+            for field in BITMAP_FIELDS
+        }
+
+        texts = [
+            fold_case(f"{r.title}\x00{self.values['company'][self.codes['company'][i]]}")
+            for i, r in enumerate(rows)
+        ]
+        self._haystack = "\n".join(texts)
+        self._row_starts = np.zeros(self.size, dtype=np.int64)
+        if self.size > 1:
+            np.cumsum([len(t) + 1 for t in texts[:-1]], out=self._row_starts[1:])
+
+        cluster_codes: Dict[str, int] = {}
+        self.cluster_codes = np.fromiter(
+            (-1 if c is None else cluster_codes.setdefault(c, len(cluster_codes)) for c in self.cluster_ids),
+            dtype=np.int64,
+            count=self.size,
+        )
+
+        # First-scraped (lowest id) row of each near-duplicate cluster, for
+        # collapsed listings without filters.
+        first: Dict[str, int] = {}
+        for pos, cluster_id in enumerate(self.cluster_ids):
+            if cluster_id is not None and (
+                cluster_id not in first or self.ids[pos] < self.ids[first[cluster_id]]
+            ):
+                first[cluster_id] = pos
+        representative = np.array([c is None for c in self.cluster_ids], dtype=bool)
+        representative[list(first.values())] = True
+        self.representative = np.packbits(representative)
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+    def _value_mask(self, field: str, wanted: str, match: str) -> np.ndarray:
+        """Packed bitmap of rows whose ``field`` matches ``wanted``."""
+        mask = np.zeros_like(self.representative)
+        for code, value in enumerate(self.values[field]):
+            hit = value == wanted if match == "exact" else contains_text(value, wanted)
+            if hit:
+                mask |= self.bitmaps[field][code]
+        return mask
+
+    def search(
+        self,
+        filters: Dict[str, Optional[str]],
+        match: str = "contains",
+        search: Optional[str] = None,
+        collapse: bool = False,
+    ) -> np.ndarray:
+        """
+        Return the positions of matching rows, in listing order.
+
+        With ``collapse``, each cluster is represented by its first-scraped
+        row among the matching ones.
+        """
+        mask: Optional[np.ndarray] = None
+        for field in BITMAP_FIELDS:
+            wanted = filters.get(field)
+            if wanted:
+                value_mask = self._value_mask(field, wanted, match)
+                mask = value_mask if mask is None else mask & value_mask
+
+        if mask is None and not search:
+            if collapse:
+                return np.flatnonzero(np.unpackbits(self.representative, count=self.size))
+            return np.arange(self.size)
+
+        if mask is None:
+            positions = np.arange(self.size)
+        else:
+            positions = np.flatnonzero(np.unpackbits(mask, count=self.size))
+        if search:
+            positions = positions[self._text_hits(fold_case(search))[positions]]
+        if collapse:
+            positions = positions[self._first_per_cluster(positions)]
+        return positions
+
+    def _first_per_cluster(self, positions: np.ndarray) -> np.ndarray:
+        """Boolean mask over ``positions``: unclustered, or lowest id of its cluster among them."""
+        codes = self.cluster_codes[positions]
+        order = np.lexsort((self.ids[positions], codes))  # by cluster, then id
+        sorted_codes = codes[order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = sorted_codes[1:] != sorted_codes[:-1]
+        keep = codes == -1
+        keep[order[first]] = True
+        return keep
+
+    def _text_hits(self, needle: str) -> np.ndarray:
+        """Boolean row mask: title or company contains ``needle``."""
+        hits = np.zeros(self.size, dtype=bool)
+        offsets = np.fromiter(
+            (m.start() for m in re.finditer(re.escape(needle), self._haystack)),
+            dtype=np.int64,
+        )
+        if len(offsets):
+            hits[np.searchsorted(self._row_starts, offsets, side="right") - 1] = True
+        return hits
+
+    def seek(self, positions: np.ndarray, after: Tuple[datetime, int]) -> np.ndarray:
+        """Drop positions up to and including the ``(scraped_at, id)`` keyset cursor."""
+        cursor_at = np.datetime64(after[0], "us")
+        at = self.scraped_at[positions]
+        # Positions are in listing order, so the kept rows form a suffix.
+        before = (at > cursor_at) | ((at == cursor_at) & (self.ids[positions] >= after[1]))
+        return positions[int(np.count_nonzero(before)):]
+
+    def rows(self, positions: Sequence[int]) -> List[Dict[str, Any]]:
+        """Materialize the given positions as ``JobResponse``-shaped dicts."""
+        values, codes = self.values, self.codes
+        return [
+            {
+                "id": int(self.ids[p]),
+                "platform": values["platform"][codes["platform"][p]],
+                "title": self.titles[p],
+                "company": values["company"][codes["company"][p]],
+                "location": values["location"][codes["location"][p]],
+                "category": values["category"][codes["category"][p]],
+                "salary": values["salary"][codes["salary"][p]],
+                "experience": values["experience"][codes["experience"][p]],
+                "link": self.links[p],
+                "scraped_at": self.scraped_at[p].item(),
+                "cluster_id": self.cluster_ids[p],
+            }
+            for p in positions
+        ]
+
+
+# ---------------------------------------------------------------------------
+# Current snapshot
+# ---------------------------------------------------------------------------
+_snapshot: Optional[JobSnapshot] = None
+_build_lock = threading.Lock()
+
+
+def enabled() -> bool:
+    return settings.JOB_READ_MODEL
+
+
+def build_snapshot(db: Session, generation: int) -> JobSnapshot:
+    """Load every job, newest first, into a new snapshot."""
+    rows = db.execute(
+        select(
+            Job.id, Job.platform, Job.title, Job.company, Job.location, Job.category,
+            Job.salary, Job.experience, Job.link, Job.scraped_at, Job.cluster_id,
+        ).order_by(Job.scraped_at.desc(), Job.id.desc())
+    ).all()
+    return JobSnapshot(generation, rows)
+
+
+def refresh(generation: int, force: bool = False) -> None:
+    """Build the snapshot for ``generation`` and swap it in (no-op if current)."""
+    global _snapshot
+    with _build_lock:
+        if not force and _snapshot is not None and _snapshot.generation >= generation:
+            return
+        with SessionLocal() as db:
+            snapshot = build_snapshot(db, generation)
+        _snapshot = snapshot
+    logger.info("Job read model loaded: %d rows, generation %d.", snapshot.size, generation)
+
+
+def _refresh_quietly(generation: int) -> None:
+    try:
+        refresh(generation)
+    except Exception:
+        logger.exception("Building the job read model failed")
+
+
+def refresh_in_background(generation: int) -> None:
+    """Start building the snapshot for ``generation`` unless a build is running."""
+    if enabled() and not _build_lock.locked():
+        threading.Thread(
+            target=_refresh_quietly, args=(generation,), name="job-read-model", daemon=True
+        ).start()
+
+
+def current(generation: int) -> Optional[JobSnapshot]:
+    """
+    Return the snapshot for ``generation``, or None if the read model is off
+    or the snapshot is stale.  A stale snapshot triggers a background
+    rebuild; callers fall back to SQL until it is swapped in.
+    """
+    if not enabled():
+        return None
+    snapshot = _snapshot
+    if snapshot is not None and snapshot.generation == generation:
+        return snapshot
+    refresh_in_background(generation)
+    return None
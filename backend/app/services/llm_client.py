@@ -0,0 +1,103 @@
+"""
+Shared Groq chat-model clients.
+
+Building a ``ChatGroq`` imports langchain and groq on first use and creates
+new Groq SDK clients, each with its own HTTP connection pool, so a model
+built per request also pays a fresh TCP + TLS handshake on every call.
+
+``chat_model`` instead returns one model per (API key, model, temperature,
+retries), built on first use and reused afterwards; a new API key simply
+gets new models.  All of them send their requests through one pooled
+``httpx.Client``, so connections to the API stay open across requests and
+across keys.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from app.config import settings
+from app.services import metrics
+
+logger = logging.getLogger(__name__)
+
+# Models kept per worker; older ones (usually for replaced keys) are dropped.
+MAX_MODELS = 8
+
+_lock = threading.Lock()
+_models: "OrderedDict[Tuple[str, str, float, int], Any]" = OrderedDict()
+_http_client: Optional[Any] = None
+
+
+def _pooled_http_client() -> Any:
+    """The ``httpx.Client`` shared by every model.  Call with ``_lock`` held."""
+    global _http_client
+    if _http_client is None:
+        import httpx
+
+        _http_client = httpx.Client(
+            timeout=settings.LLM_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=settings.LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_MAX_CONNECTIONS,
+            ),
+        )
+    return _http_client
+
+
+def _build(api_key: str, temperature: float, max_retries: int) -> Any:
+    """A new ``ChatGroq`` on the shared connection pool.  Call with ``_lock`` held."""
+    from langchain_groq import ChatGroq
+
+    model = ChatGroq(
+        model=settings.LLM_MODEL,
+        temperature=temperature,
+        max_retries=max_retries,
+        api_key=api_key,
+        base_url=settings.LLM_API_BASE,
+        timeout=settings.LLM_TIMEOUT_SECONDS,
+        http_client=_pooled_http_client(),
+    )
+    metrics.increment("llm.models_built")
+    return model
+
+
+def chat_model(api_key: str, temperature: float, max_retries: int = 2, cache: bool = True) -> Any:
+    """
+    Return the ``ChatGroq`` for ``api_key`` and the configured ``LLM_MODEL``,
+    building it on first use.
+
+    Pass ``cache=False`` for a key that has not been accepted yet: the model
+    is built fresh and not kept, so rejected keys never take a cache slot
+    from a working one.
+
+    Raises:
+        ImportError: If langchain-groq is not installed.
+    """
+    key = (api_key, settings.LLM_MODEL, temperature, max_retries)
+    with _lock:
+        if not cache:
+            return _build(api_key, temperature, max_retries)
+
+        model = _models.get(key)
+        if model is not None:
+            _models.move_to_end(key)
+            return model
+
+        model = _build(api_key, temperature, max_retries)
+        _models[key] = model
+        while len(_models) > MAX_MODELS:
+            _models.popitem(last=False)
+    logger.info("Built LLM client for %s (temperature %s).", settings.LLM_MODEL, temperature)
+    return model
+
+
+def close() -> None:
+    """Drop every model and close the shared connection pool."""
+    global _http_client
+    with _lock:
+        _models.clear()
+        client, _http_client = _http_client, None
+    if client is not None:
+        client.close()
@@ -0,0 +1,205 @@
+"""
+Brute-force protection for ``POST /api/auth/login``.
+
+Every failed login costs a full PBKDF2 verification, so credential
+stuffing turns straight into CPU load.  Failed attempts are counted in a
+sliding window (``LOGIN_THROTTLE_WINDOW_SECONDS``) per account email and per
+client IP.  A key that reaches its limit is locked out.  Each successive
+lockout of the same key doubles in length, from ``LOGIN_LOCKOUT_SECONDS``
+up to ``LOGIN_LOCKOUT_MAX_SECONDS``.  ``check`` runs before the user lookup
+and before any hashing, so rejected attempts cost a dictionary lookup.
+
+State lives in this worker's memory by default.  With
+``LOGIN_THROTTLE_BACKEND=database`` it is kept in the ``login_throttle``
+table instead, so all workers share one view.  Emails are stored as
+truncated SHA-256 digests.
+
+A successful login clears the email's state; IP state only ages out.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models import LoginThrottleState
+from app.services import metrics
+
+logger = logging.getLogger(__name__)
+
+# Idle keys are swept out once every this many writes.
+_SWEEP_EVERY = 256
+
+
+@dataclass
+class _State:
+    failures: List[float] = field(default_factory=list)
+    strikes: int = 0
+    locked_until: float = 0.0
+
+
+def _email_key(email: str) -> str:
+    return "email:" + hashlib.sha256(email.encode("utf-8")).hexdigest()[:32]
+
+
+def _ip_key(ip: Optional[str]) -> Optional[str]:
+    return f"ip:{ip}" if ip else None
+
+
+def _limit(key: str) -> int:
+    if key.startswith("email:"):
+        return settings.LOGIN_MAX_FAILURES_PER_EMAIL
+    return settings.LOGIN_MAX_FAILURES_PER_IP
+
+
+def _prune(state: _State, now: float) -> None:
+    """Drop failures outside the window; forget strikes after a quiet window."""
+    horizon = now - settings.LOGIN_THROTTLE_WINDOW_SECONDS
+    if state.failures and state.failures[0] <= horizon:
+        state.failures = [t for t in state.failures if t > horizon]
+    if state.strikes and not state.failures and state.locked_until <= horizon:
+        state.strikes = 0
+
+
+def _add_failure(key: str, state: _State, now: float) -> None:
+    _prune(state, now)
+    state.failures.append(now)
+    if len(state.failures) >= _limit(key):
+        state.strikes += 1
+        lockout = min(
+            settings.LOGIN_LOCKOUT_SECONDS * 2 ** (state.strikes - 1),
+            settings.LOGIN_LOCKOUT_MAX_SECONDS,
+        )
+        state.locked_until = now + lockout
+        state.failures = []
+        metrics.increment("login_throttle.lockouts")
+        logger.warning("Login lockout for %s: %.0f s (strike %d).", key.split(":")[0], lockout, state.strikes)
+
+
+def _idle_after() -> float:
+    return max(settings.LOGIN_THROTTLE_WINDOW_SECONDS, settings.LOGIN_LOCKOUT_MAX_SECONDS)
+
+
+# ---------------------------------------------------------------------------
+# Stores
+# ---------------------------------------------------------------------------
+class _MemoryStore:
+    """Per-worker state, least recently updated keys evicted first."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._states: "OrderedDict[str, _State]" = OrderedDict()
+        self._writes = 0
+
+    def load(self, db: Optional[Session], keys: Iterable[str]) -> Dict[str, _State]:
+        with self._lock:
+            return {key: self._states[key] for key in keys if key in self._states}
+
+    def save(self, db: Optional[Session], states: Dict[str, _State], now: float) -> None:
+        with self._lock:
+            self._save(states, now)
+
+    def _save(self, states: Dict[str, _State], now: float) -> None:
+        for key, state in states.items():
+            self._states[key] = state
+            self._states.move_to_end(key)
+        while len(self._states) > settings.LOGIN_THROTTLE_MAX_KEYS:
+            self._states.popitem(last=False)
+        self._writes += 1
+        if self._writes % _SWEEP_EVERY == 0:
+            cutoff = now - _idle_after()
+            for key in [k for k, s in self._states.items() if max(s.locked_until, *s.failures, 0) < cutoff]:
+                del self._states[key]
+
+    def forget(self, db: Optional[Session], key: str) -> None:
+        with self._lock:
+            self._states.pop(key, None)
+
+
+class _DatabaseStore:
+    """State in the ``login_throttle`` table, shared by every worker."""
+
+    def __init__(self) -> None:
+        self._writes = 0
+
+    def load(self, db: Session, keys: Iterable[str]) -> Dict[str, _State]:
+        rows = db.execute(
+            select(LoginThrottleState).where(LoginThrottleState.key.in_(list(keys)))
+        ).scalars()
+        return {
+            row.key: _State(list(row.failures or ()), row.strikes, row.locked_until)
+            for row in rows
+        }
+
+    def save(self, db: Session, states: Dict[str, _State], now: float) -> None:
+        for key, state in states.items():
+            db.merge(LoginThrottleState(
+                key=key,
+                failures=state.failures,
+                strikes=state.strikes,
+                locked_until=state.locked_until,
+                updated_at=now,
+            ))
+        self._writes += 1
+        if self._writes % _SWEEP_EVERY == 0:
+            db.execute(delete(LoginThrottleState).where(
+                LoginThrottleState.updated_at < now - _idle_after()
+            ))
+        db.commit()
+
+    def forget(self, db: Session, key: str) -> None:
+        db.execute(delete(LoginThrottleState).where(LoginThrottleState.key == key))
+        db.commit()
+
+
+_memory_store = _MemoryStore()
+_database_store = _DatabaseStore()
+
+
+def _store():
+    return _database_store if settings.LOGIN_THROTTLE_BACKEND == "database" else _memory_store
+
+
+# ---------------------------------------------------------------------------
+# Public API (``db`` is only used by the database backend)
+# ---------------------------------------------------------------------------
+def check(db: Optional[Session], email: str, ip: Optional[str]) -> Optional[float]:
+    """Return the seconds until ``email`` / ``ip`` may try again, or None if allowed."""
+    if not settings.LOGIN_THROTTLE_ENABLED:
+        return None
+    keys = [k for k in (_email_key(email), _ip_key(ip)) if k]
+    now = time.time()
+    retry_after = None
+    for key, state in _store().load(db, keys).items():
+        if state.locked_until > now:
+            wait = state.locked_until - now
+            retry_after = max(retry_after or 0.0, wait)
+            metrics.increment(f"login_throttle.rejected.{key.split(':')[0]}")
+    return retry_after
+
+
+def record_failure(db: Optional[Session], email: str, ip: Optional[str]) -> None:
+    """Count a failed login against ``email`` and ``ip``."""
+    if not settings.LOGIN_THROTTLE_ENABLED:
+        return
+    keys = [k for k in (_email_key(email), _ip_key(ip)) if k]
+    now = time.time()
+    store = _store()
+    states = store.load(db, keys)
+    for key in keys:
+        _add_failure(key, states.setdefault(key, _State()), now)
+    store.save(db, states, now)
+    metrics.increment("login_throttle.failures")
+
+
+def record_success(db: Optional[Session], email: str) -> None:
+    """Clear the failure history of ``email`` after a successful login."""
+    if settings.LOGIN_THROTTLE_ENABLED:
+        _store().forget(db, _email_key(email))
@@ -0,0 +1,70 @@
+"""
+In-process counters behind ``GET /api/metrics``.
+
+Each worker keeps its own numbers, counted since it started; nothing is
+persisted.  Services record events with ``increment`` and the request
+middleware adds per-route query statistics with ``observe_request``.
+"""
+
+import threading
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict
+
+_lock = threading.Lock()
+_counters: Dict[str, float] = defaultdict(float)
+
+
+@dataclass
+class RouteStats:
+    """Request and database totals for one route."""
+
+    requests: int = 0
+    queries: int = 0
+    db_ms: float = 0.0
+    max_queries: int = 0
+    max_db_ms: float = 0.0
+    repeated_query_requests: int = 0
+
+
+_routes: Dict[str, RouteStats] = defaultdict(RouteStats)
+
+
+def increment(name: str, amount: float = 1) -> None:
+    """Add ``amount`` to the counter ``name``."""
+    with _lock:
+        _counters[name] += amount
+
+
+def observe_request(route: str, queries: int, db_ms: float, repeated: bool) -> None:
+    """Record the queries issued while serving one request to ``route``."""
+    with _lock:
+        stats = _routes[route]
+        stats.requests += 1
+        stats.queries += queries
+        stats.db_ms += db_ms
+        stats.max_queries = max(stats.max_queries, queries)
+        stats.max_db_ms = max(stats.max_db_ms, db_ms)
+        stats.repeated_query_requests += int(repeated)
+
+
+def snapshot() -> Dict[str, Any]:
+    """Current counters and per-route statistics, sorted by total DB time."""
+    with _lock:
+        counters = {name: round(value, 3) for name, value in sorted(_counters.items())}
+        routes = {
+            route: {
+                **{k: round(v, 3) if isinstance(v, float) else v for k, v in asdict(stats).items()},
+                "avg_queries": round(stats.queries / stats.requests, 2),
+                "avg_db_ms": round(stats.db_ms / stats.requests, 3),
+            }
+            for route, stats in sorted(_routes.items(), key=lambda item: -item[1].db_ms)
+        }
+    return {"counters": counters, "routes": routes}
+
+
+def reset() -> None:
+    """Forget everything recorded so far (benchmarks and maintenance scripts)."""
+    with _lock:
+        _counters.clear()
+        _routes.clear()
@@ -0,0 +1,120 @@
+"""
+Per-request SQL instrumentation.
+
+``database.py`` hooks ``before/after_cursor_execute`` on every engine and
+reports each statement here.  While a request is being served, the HTTP
+middleware keeps a ``RequestQueries`` in a context variable; statements
+executed on its behalf — in the handler, its dependencies, a threadpool
+worker or an ``AsyncSession.run_sync`` callback — are added to it.
+
+Besides the per-request totals:
+
+* statements slower than ``SLOW_QUERY_MS`` are logged, with literals and
+  bound parameters redacted;
+* a request that runs the same statement shape ``QUERY_REPEAT_THRESHOLD``
+  or more times is flagged as a likely N+1 (a lazy load or a query issued
+  inside a loop).
+"""
+
+import logging
+import re
+from collections import Counter
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple
+
+from app.config import settings
+from app.services import metrics
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_EXPANDED_IN = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+MAX_LOGGED_STATEMENT = 500
+
+
+@dataclass
+class RequestQueries:
+    """Statements executed while serving one request."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+
+
+_current: ContextVar[Optional[RequestQueries]] = ContextVar("request_queries", default=None)
+
+
+def begin() -> Tuple[RequestQueries, Token]:
+    """Start collecting statements for the current request."""
+    stats = RequestQueries()
+    return stats, _current.set(stats)
+
+
+def end(token: Token) -> None:
+    _current.reset(token)
+
+
+def statement_shape(statement: str) -> str:
+    """
+    ``statement`` on a single line, with string literals replaced by ``'?'``
+    and expanded ``IN (?, ?, …)`` lists collapsed, so statements that differ
+    only in their values compare equal.
+    """
+    shape = _STRING_LITERAL.sub("'?'", statement)
+    shape = _EXPANDED_IN.sub("(?…)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+def _truncate(shape: str) -> str:
+    if len(shape) <= MAX_LOGGED_STATEMENT:
+        return shape
+    return shape[:MAX_LOGGED_STATEMENT] + " …"
+
+
+def _describe_parameters(parameters: Any, executemany: bool) -> str:
+    if executemany:
+        return f"{len(parameters)} parameter sets redacted"
+    return f"{len(parameters or ())} parameters redacted"
+
+
+def record(statement: str, parameters: Any, executemany: bool, elapsed_ms: float) -> None:
+    """Account for one executed statement (called from the engine hooks)."""
+    metrics.increment("db.queries")
+    metrics.increment("db.time_ms", elapsed_ms)
+
+    stats = _current.get()
+    shape = None
+    if stats is not None:
+        shape = statement_shape(statement)
+        stats.count += 1
+        stats.total_ms += elapsed_ms
+        stats.shapes[shape] += 1
+
+    if elapsed_ms >= settings.SLOW_QUERY_MS:
+        metrics.increment("db.slow_queries")
+        logger.warning(
+            "Slow query (%.1f ms, %s): %s",
+            elapsed_ms,
+            _describe_parameters(parameters, executemany),
+            _truncate(shape or statement_shape(statement)),
+        )
+
+
+def repeated_shapes(stats: RequestQueries) -> List[Tuple[str, int]]:
+    """Statement shapes run at least ``QUERY_REPEAT_THRESHOLD`` times, most frequent first."""
+    threshold = settings.QUERY_REPEAT_THRESHOLD
+    if threshold <= 0:
+        return []
+    return [(shape, n) for shape, n in stats.shapes.most_common() if n >= threshold]
+
+
+def report_repeats(stats: RequestQueries, request_line: str) -> bool:
+    """Log likely N+1 patterns for a finished request; True if any were found."""
+    repeated = repeated_shapes(stats)
+    for shape, n in repeated:
+        logger.warning("Repeated query on %s (%d×, likely N+1): %s", request_line, n, _truncate(shape))
+    if repeated:
+        metrics.increment("db.repeated_query_requests")
+    return bool(repeated)
@@ -0,0 +1,276 @@
+"""
+Periodic scrape scheduler.
+
+Every uvicorn worker starts a scheduler task from the application lifespan,
+but all workers share a single ``scrape_lease`` row in the database.  The row
+holds the next scheduled run time and a lease: a worker may only scrape after
+atomically claiming an expired lease whose ``next_run_at`` has passed, so
+exactly one worker scrapes per interval.  Manual refreshes take the same
+lease, so a worker never scrapes while another one is.
+
+The scrape itself runs in a worker thread so the event loop keeps serving
+requests.  Between pages it renews the lease (a slow scrape keeps it; a dead
+worker's lease expires) and checks the worker's stop event, so shutdown does
+not wait for a whole scrape.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import socket
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import Job, ScrapeLease, ScrapeStatus
+from app.services.job_scraper import ScrapeCancelled, scrape_and_store_jobs
+
+logger = logging.getLogger(__name__)
+
+LEASE_NAME = "job_scrape"
+
+# Never poll the lease row more often than this, even if a run is overdue
+# (e.g. another worker is still holding the lease).
+MIN_POLL_SECONDS = 60
+
+# Unique per worker process so a lease can only be released by its holder.
+_HOLDER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+# Set by ``stop_scheduler``; scrapes running in this worker stop at their next page.
+_stop_event = threading.Event()
+
+
+# ============================================================================
+# Lease helpers
+# ============================================================================
+
+def scheduler_enabled() -> bool:
+    """Return True when periodic scraping is configured."""
+    return settings.SCRAPE_INTERVAL_HOURS > 0
+
+
+def next_run_after(now: datetime) -> datetime:
+    """Return ``now`` plus the configured interval, offset by random jitter."""
+    jitter = random.uniform(
+        -settings.SCRAPE_JITTER_MINUTES, settings.SCRAPE_JITTER_MINUTES
+    )
+    delay = timedelta(hours=settings.SCRAPE_INTERVAL_HOURS) + timedelta(minutes=jitter)
+    return now + max(delay, timedelta(minutes=1))
+
+
+def ensure_lease_row(db: Session) -> ScrapeLease:
+    """
+    Return the shared lease row, creating it on first start.
+
+    The first run is scheduled immediately when ``SCRAPE_ON_STARTUP`` is set
+    and the jobs table is empty; otherwise one interval from now.
+    """
+    lease = db.get(ScrapeLease, LEASE_NAME)
+    if lease is not None:
+        return lease
+
+    now = datetime.utcnow()
+    if settings.SCRAPE_ON_STARTUP and db.query(Job.id).first() is None:
+        first_run = now
+    else:
+        first_run = next_run_after(now)
+
+    try:
+        db.add(ScrapeLease(name=LEASE_NAME, next_run_at=first_run))
+        db.commit()
+    except IntegrityError:
+        # Another worker created it first.
+        db.rollback()
+    return db.get(ScrapeLease, LEASE_NAME)
+
+
+def _lease_expiry(now: datetime) -> datetime:
+    return now + timedelta(minutes=settings.SCRAPE_LEASE_TTL_MINUTES)
+
+
+def try_acquire_lease(db: Session, now: datetime, due_only: bool = True) -> bool:
+    """
+    Atomically claim the lease if it is free and (with ``due_only``) a run
+    is due.  Manual refreshes pass ``due_only=False``.
+
+    Returns True if this worker now holds the lease.
+    """
+    conditions = [
+        ScrapeLease.name == LEASE_NAME,
+        or_(ScrapeLease.expires_at.is_(None), ScrapeLease.expires_at < now),
+    ]
+    if due_only:
+        conditions.append(ScrapeLease.next_run_at <= now)
+    result = db.execute(
+        update(ScrapeLease)
+        .where(*conditions)
+        .values(holder=_HOLDER_ID, expires_at=_lease_expiry(now))
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def renew_lease(db: Session, now: datetime) -> bool:
+    """
+    Push back the expiry of the lease held by this worker.
+
+    Returns False if this worker no longer holds it (it expired and another
+    worker claimed it).
+    """
+    result = db.execute(
+        update(ScrapeLease)
+        .where(ScrapeLease.name == LEASE_NAME, ScrapeLease.holder == _HOLDER_ID)
+        .values(expires_at=_lease_expiry(now))
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def release_lease(db: Session, next_run_at: datetime) -> None:
+    """Release the lease held by this worker and record the next run time."""
+    db.execute(
+        update(ScrapeLease)
+        .where(ScrapeLease.name == LEASE_NAME, ScrapeLease.holder == _HOLDER_ID)
+        .values(holder=None, expires_at=None, next_run_at=next_run_at)
+    )
+    db.commit()
+
+
+def fail_orphaned_scrapes(db: Session, now: datetime) -> int:
+    """
+    Mark every ``running`` scrape as failed.  Call only while holding the lease.
+
+    Every scrape runs under the lease and renews it between pages, so once
+    this worker holds the lease no other worker is scraping: a ``running``
+    row left now belongs to a holder that lost the lease (it died or stalled
+    past the TTL).  Returns the number of rows changed.
+    """
+    result = db.execute(
+        update(ScrapeStatus)
+        .where(ScrapeStatus.status == "running")
+        .values(
+            status="failed",
+            completed_at=now,
+            error_message="Abandoned: the scraping worker stopped before finishing.",
+        )
+    )
+    db.commit()
+    if result.rowcount:
+        logger.warning("Marked %d abandoned scrape run(s) as failed.", result.rowcount)
+    return result.rowcount
+
+
+def get_next_scheduled_run(db: Session) -> Optional[datetime]:
+    """Return the next scheduled scrape time, or None if not scheduled."""
+    if not scheduler_enabled():
+        return None
+    lease = db.get(ScrapeLease, LEASE_NAME)
+    return lease.next_run_at if lease else None
+
+
+# ============================================================================
+# Scheduler
+# ============================================================================
+
+def _checkpoint() -> None:
+    """
+    Called by the scrape before each page: stop on shutdown, otherwise
+    renew the lease.
+
+    Raises:
+        ScrapeCancelled: If the worker is stopping or lost the lease.
+    """
+    if _stop_event.is_set():
+        raise ScrapeCancelled("Cancelled: the worker is shutting down.")
+    # Own session: the scrape's session may be in the middle of a batch.
+    with SessionLocal() as db:
+        if not renew_lease(db, datetime.utcnow()):
+            raise ScrapeCancelled("Cancelled: the scrape lease was lost to another worker.")
+
+
+def run_leased_scrape() -> datetime:
+    """
+    Scrape while holding the lease (blocking — call from a worker thread),
+    then release it.  Returns the next scheduled run time.
+    """
+    db = SessionLocal()
+    try:
+        try:
+            fail_orphaned_scrapes(db, datetime.utcnow())
+            scrape_and_store_jobs(db, checkpoint=_checkpoint)
+        finally:
+            next_run = next_run_after(datetime.utcnow())
+            release_lease(db, next_run)
+            logger.info("Next scheduled scrape at %s UTC.", next_run.isoformat())
+        return next_run
+    finally:
+        db.close()
+
+
+def run_scheduled_scrape() -> datetime:
+    """
+    Run one scheduler tick (blocking — call from a worker thread).
+
+    Scrapes if this worker wins the lease, then returns the next time the
+    scheduler should wake up.
+    """
+    db = SessionLocal()
+    try:
+        lease = ensure_lease_row(db)
+        if not try_acquire_lease(db, datetime.utcnow()):
+            db.refresh(lease)
+            return lease.next_run_at
+    finally:
+        db.close()
+
+    logger.info("Scheduler lease acquired by %s — starting scrape.", _HOLDER_ID)
+    return run_leased_scrape()
+
+
+async def _scheduler_loop() -> None:
+    """Wake up at each scheduled time and try to run a scrape."""
+    while True:
+        try:
+            next_run = await asyncio.to_thread(run_scheduled_scrape)
+            delay = (next_run - datetime.utcnow()).total_seconds()
+        except Exception as exc:
+            logger.exception("Scheduled scrape tick failed: %s", exc)
+            delay = 0
+        await asyncio.sleep(max(delay, MIN_POLL_SECONDS))
+
+
+def start_scheduler() -> Optional[asyncio.Task]:
+    """Start the scheduler task on the running event loop, if enabled."""
+    _stop_event.clear()
+    if not scheduler_enabled():
+        logger.info("Periodic scraping disabled (SCRAPE_INTERVAL_HOURS=0).")
+        return None
+    logger.info(
+        "Starting scrape scheduler (every %dh ± %dmin).",
+        settings.SCRAPE_INTERVAL_HOURS,
+        settings.SCRAPE_JITTER_MINUTES,
+    )
+    return asyncio.create_task(_scheduler_loop(), name="scrape-scheduler")
+
+
+async def stop_scheduler(task: Optional[asyncio.Task]) -> None:
+    """
+    Stop scrapes running in this worker at their next page, then cancel the
+    scheduler task and wait for it to exit.
+    """
+    _stop_event.set()
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
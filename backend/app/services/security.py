@@ -1,56 +1,168 @@
 """
 Security utilities for password hashing and JWT token creation.
 Uses hashlib for secure, dependency-free password hashing and pyjwt for JSON Web Tokens.
+
+Stored password hashes record their algorithm and cost, so the target
+(``PASSWORD_HASH_ALGORITHM`` plus its cost settings) can change at any time:
+existing hashes keep verifying, and ``needs_rehash`` tells the login route
+to re-hash a password stored with older parameters.
+
+A PBKDF2 hash takes a noticeable amount of CPU, so ``async`` routes use
+``hash_password_async`` / ``verify_password_async``.  These run it on a
+bounded thread pool, off the event loop; hashlib releases the GIL, so the
+workers hash in parallel.  When ``PASSWORD_HASH_MAX_PENDING`` hashes are
+already running or queued, further calls fail fast with
+``HashingBusyError`` rather than queueing without limit.
 """
 
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 import hashlib
+import hmac
 import logging
 import os
-from typing import Optional
+import threading
+from typing import Any, Callable, Optional, Tuple
 
 import jwt
 
 from app.config import settings
+from app.services import metrics
 
 logger = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# Password hashing
+# ---------------------------------------------------------------------------
+# Stored formats:
+#   pbkdf2_sha256$<iterations>$<salt hex>$<key hex>
+#   scrypt$<n>$<r>$<p>$<salt hex>$<key hex>
+#   <salt hex>:<key hex>       legacy: PBKDF2-SHA256, 100k iterations
+LEGACY_PBKDF2_ITERATIONS = 100_000
+_KEY_BYTES = 32
+
+
+def _pbkdf2(password: str, salt: bytes, iterations: int) -> bytes:
+    return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(
+        password.encode("utf-8"), salt=salt, n=n, r=r, p=p,
+        maxmem=256 * n * r + (1 << 20),  # hashlib's 32 MiB default rejects larger costs
+        dklen=_KEY_BYTES,
+    )
+
+
+def _target_parameters() -> Tuple[str, Tuple[int, ...]]:
+    """The configured algorithm (one of ``PASSWORD_HASH_ALGORITHMS``) and its cost parameters."""
+    if settings.PASSWORD_HASH_ALGORITHM == "scrypt":
+        return "scrypt", (settings.PASSWORD_SCRYPT_N, settings.PASSWORD_SCRYPT_R, settings.PASSWORD_SCRYPT_P)
+    return "pbkdf2_sha256", (settings.PASSWORD_PBKDF2_ITERATIONS,)
+
+
+def _parse_hash(hashed_password: str) -> Tuple[str, Tuple[int, ...], bytes, bytes]:
+    """Split a stored hash into ``(algorithm, parameters, salt, key)``."""
+    if "$" not in hashed_password:
+        salt_hex, key_hex = hashed_password.split(":")
+        return "legacy", (LEGACY_PBKDF2_ITERATIONS,), bytes.fromhex(salt_hex), bytes.fromhex(key_hex)
+    algorithm, *fields = hashed_password.split("$")
+    *params, salt_hex, key_hex = fields
+    return algorithm, tuple(int(v) for v in params), bytes.fromhex(salt_hex), bytes.fromhex(key_hex)
+
+
 def hash_password(password: str) -> str:
-    """Hash a password using PBKDF2 with SHA-256 and a random salt."""
+    """Hash a password with the configured algorithm and cost and a random salt."""
     salt = os.urandom(16)
-    key = hashlib.pbkdf2_hmac(
-        "sha256",
-        password.encode("utf-8"),
-        salt,
-        100000,  # 100k iterations
-    )
+    algorithm, params = _target_parameters()
+    if algorithm == "scrypt":
+        key = _scrypt(password, salt, *params)
+    else:
+        key = _pbkdf2(password, salt, *params)
 
     #salt for unique passwrod for every user 
-    return f"{salt.hex()}:{key.hex()}"
+    return "$".join([algorithm, *map(str, params), salt.hex(), key.hex()])
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plain password against its hashed representation."""
+    """Verify a plain password against its hashed representation (any stored format)."""
     try:
-        if not hashed_password or ":" not in hashed_password:
+        if not hashed_password:
             return False
-        salt_hex, key_hex = hashed_password.split(":")
-        salt = bytes.fromhex(salt_hex)
-        key = bytes.fromhex(key_hex)
-        
-        new_key = hashlib.pbkdf2_hmac(
-            "sha256",
-            plain_password.encode("utf-8"),
-            salt,
-            100000,
-        )
-        return new_key == key
+        algorithm, params, salt, key = _parse_hash(hashed_password)
+        if algorithm == "scrypt":
+            new_key = _scrypt(plain_password, salt, *params)
+        elif algorithm in ("pbkdf2_sha256", "legacy"):
+            new_key = _pbkdf2(plain_password, salt, *params)
+        else:
+            logger.error("Unknown password hash algorithm: %s", algorithm)
+            return False
+        return hmac.compare_digest(new_key, key)
     except Exception as exc:
         logger.error("Password verification error: %s", exc)
         return False
 
 
+def needs_rehash(hashed_password: str) -> bool:
+    """Whether a stored hash uses another algorithm or cost than configured."""
+    try:
+        algorithm, params, _, _ = _parse_hash(hashed_password)
+    except (ValueError, TypeError):
+        return False  # not something a fresh hash of the same password can fix
+    return (algorithm, params) != _target_parameters()
+
+
+# ---------------------------------------------------------------------------
+# Off-loop hashing
+# ---------------------------------------------------------------------------
+class HashingBusyError(RuntimeError):
+    """The hashing pool already holds ``PASSWORD_HASH_MAX_PENDING`` jobs."""
+
+
+_hash_pool: Optional[ThreadPoolExecutor] = None
+_hash_lock = threading.Lock()
+_hash_pending = 0
+
+
+def _release_hash_slot(_: Future) -> None:
+    global _hash_pending
+    with _hash_lock:
+        _hash_pending -= 1
+
+
+async def _run_hashing(fn: Callable[..., Any], *args: Any) -> Any:
+    """Run ``fn(*args)`` on the hashing pool, or raise ``HashingBusyError``."""
+    global _hash_pool, _hash_pending
+    with _hash_lock:
+        if _hash_pending >= settings.PASSWORD_HASH_MAX_PENDING:
+            metrics.increment("password_hash.rejected")
+            raise HashingBusyError("Password hashing queue is full.")
+        if _hash_pool is None:
+            _hash_pool = ThreadPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                thread_name_prefix="password-hash",
+            )
+        _hash_pending += 1
+        future = _hash_pool.submit(fn, *args)
+    # Released when the hash finishes, even if the awaiting request is
+    # cancelled meanwhile.
+    future.add_done_callback(_release_hash_slot)
+    metrics.increment("password_hash.jobs")
+    return await asyncio.wrap_future(future)
+
+
+async def hash_password_async(password: str) -> str:
+    """``hash_password`` on the hashing pool."""
+    return await _run_hashing(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """``verify_password`` on the hashing pool."""
+    return await _run_hashing(verify_password, plain_password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a signed JWT access token containing the provided data."""
     to_encode = data.copy()
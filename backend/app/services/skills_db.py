@@ -5,16 +5,21 @@ Reads the skills CSV and provides helpers to:
   - load keywords for a specific role
   - list all available roles
   - find the best-matching role for a given resume
+  - build a versioned keyword vocabulary shared by all roles
 """
 
+import hashlib
 import logging
-from typing import Any, Dict, List, Optional, Set
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
 from app.config import settings
 from app.services.gap_analyzer import evaluate_resume
-from app.services.resume_parser import extract_skills
+from app.services.resume_parser import extract_skills, preprocess_text
 
 logger = logging.getLogger(__name__)
 
@@ -159,3 +164,85 @@ def find_best_role(
         "suggested_improvements": best_report["suggested_improvements"],
         "all_roles_scores": all_scores,
     }
+
+
+# ---------------------------------------------------------------------------
+# Keyword vocabulary
+# ---------------------------------------------------------------------------
+@dataclass(frozen=True)
+class KeywordCatalog:
+    """
+    Every skill / ATS keyword in the CSV, numbered.
+
+    ``version`` is derived from the CSV contents, so ids stored against an
+    older catalog can be recognised and recomputed after the CSV changes.
+    """
+
+    version: str
+    vocabulary: Dict[str, int]  # normalised keyword -> id
+    keywords: List[str]  # id -> keyword as first spelled in the CSV
+    role_keywords: Dict[str, List[int]]  # lower-cased role -> keyword ids
+
+    def lookup(self, terms: List[str]) -> List[int]:
+        """Return the sorted ids of the terms that are in the vocabulary."""
+        ids = {self.vocabulary.get(preprocess_text(term)) for term in terms}
+        ids.discard(None)
+        return sorted(ids)
+
+
+_catalog_lock = threading.Lock()
+_catalog_cache: Dict[str, Tuple[int, KeywordCatalog]] = {}
+
+
+def keyword_catalog(csv_path: Optional[str] = None) -> KeywordCatalog:
+    """
+    Return the keyword catalog for the skills CSV, rebuilt when the file changes.
+
+    Raises:
+        FileNotFoundError: If the CSV does not exist at the given path.
+    """
+    path = csv_path or settings.SKILLS_CSV_PATH
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Skills database not found at '{path}'. "
+            "Make sure skills_data.csv is placed in the data/ directory."
+        )
+
+    with _catalog_lock:
+        cached = _catalog_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with open(path, "rb") as fh:
+            version = hashlib.sha1(fh.read()).hexdigest()[:12]
+
+        df = _read_csv(path)
+        vocabulary: Dict[str, int] = {}
+        keywords: List[str] = []
+        role_keywords: Dict[str, Set[int]] = {}
+        for role, *columns in zip(df["Role"], df["Skills"], df["ATS Keywords"]):
+            role = str(role).strip().lower()
+            for column in columns:
+                if not isinstance(column, str):
+                    continue
+                for keyword in column.split(","):
+                    keyword = keyword.strip()
+                    key = preprocess_text(keyword)
+                    if not key:
+                        continue
+                    if key not in vocabulary:
+                        vocabulary[key] = len(keywords)
+                        keywords.append(keyword)
+                    role_keywords.setdefault(role, set()).add(vocabulary[key])
+
+        catalog = KeywordCatalog(
+            version=version,
+            vocabulary=vocabulary,
+            keywords=keywords,
+            role_keywords={role: sorted(ids) for role, ids in role_keywords.items()},
+        )
+        _catalog_cache[path] = (mtime, catalog)
+        logger.info("Loaded keyword catalog %s: %d keywords.", version, len(keywords))
+        return catalog
@@ -0,0 +1,246 @@
+"""
+Per-worker cache of verified bearer tokens → user snapshots.
+
+``get_current_user`` runs on every authenticated request.  Without a cache
+that means decoding the JWT, then ``SELECT … FROM users WHERE email = ?``,
+then a second query for the profile.  A hit here needs no database round
+trip and no signature check: the token was verified when it was cached, and
+its ``exp`` claim is checked on every hit.
+
+Entries live for at most ``USER_CACHE_TTL_SECONDS`` and the cache holds at
+most ``USER_CACHE_SIZE`` tokens, evicting the least recently used.  Entries
+hold immutable ``UserSnapshot``s rather than ORM objects, so they can be
+shared across sessions and threads.
+
+Invalidation:
+
+* ORM flushes that update or delete a ``User`` or ``UserProfile`` drop that
+  user's entries.  This covers profile edits, role changes and account
+  deletion.  The entries are dropped again after commit, so a concurrent
+  request cannot re-cache rows that were read before the commit.
+* Statements that bypass the ORM unit of work (bulk ``update()`` /
+  ``delete()``) must call ``invalidate_user`` themselves.
+* A load that overlaps any invalidation is not cached.
+
+Invalidation only reaches the worker that made the change.  With several
+uvicorn workers, another worker keeps serving its cached snapshot until the
+entry expires: a profile edit, a role change or an account deletion can
+take up to ``USER_CACHE_TTL_SECONDS`` to show on every worker, and a
+demoted or deleted account keeps its old access for that long.  The default
+TTL is therefore short: it still absorbs bursts of requests on one token
+(a page load fires several) while bounding the staleness.  Set it to 0
+where no staleness is acceptable.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models import User, UserProfile
+from app.services import metrics
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Snapshots
+# ---------------------------------------------------------------------------
+@dataclass(frozen=True)
+class ProfileSnapshot:
+    """Read-only copy of a ``UserProfile`` row."""
+
+    user_id: int
+    target_role: Optional[str]
+    location: Optional[str]
+    description: Optional[str]
+    github: Optional[str]
+    linkedin: Optional[str]
+    portfolio: Optional[str]
+    match_score: Optional[float]
+    resume_analysed: Optional[int]
+    skill_matrix: Tuple[str, ...]
+
+    @classmethod
+    def from_profile(cls, profile: UserProfile) -> "ProfileSnapshot":
+        return cls(
+            user_id=profile.user_id,
+            target_role=profile.target_role,
+            location=profile.location,
+            description=profile.description,
+            github=profile.github,
+            linkedin=profile.linkedin,
+            portfolio=profile.portfolio,
+            match_score=profile.match_score,
+            resume_analysed=profile.resume_analysed,
+            skill_matrix=tuple(profile.skill_matrix or ()),
+        )
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """Read-only copy of a ``User`` row with its profile."""
+
+    id: int
+    email: str
+    full_name: str
+    created_at: Any
+    role: str
+    profile: Optional[ProfileSnapshot]
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserSnapshot":
+        """Copy ``user``; its profile must already be loaded."""
+        return cls(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            created_at=user.created_at,
+            role=user.role,
+            profile=ProfileSnapshot.from_profile(user.profile) if user.profile else None,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+_lock = threading.Lock()
+# token -> (expires_at epoch seconds, snapshot)
+_entries: "OrderedDict[str, Tuple[float, UserSnapshot]]" = OrderedDict()
+_tokens_by_user: Dict[int, Set[str]] = {}
+_invalidations = 0
+_hits = 0
+_misses = 0
+
+
+def get(token: str) -> Optional[UserSnapshot]:
+    """Return the cached user for ``token``, or None on a miss or expiry."""
+    global _hits, _misses
+    now = time.time()
+    with _lock:
+        entry = _entries.get(token)
+        if entry is not None and entry[0] > now:
+            _entries.move_to_end(token)
+            _hits += 1
+            hit = True
+        else:
+            if entry is not None:
+                _discard(token)
+            _misses += 1
+            hit = False
+    metrics.increment("user_cache.hits" if hit else "user_cache.misses")
+    return entry[1] if hit else None
+
+
+def begin_load() -> int:
+    """Call before reading a user from the database; pass the result to ``put``."""
+    with _lock:
+        return _invalidations
+
+
+def put(token: str, token_exp: Optional[float], user: UserSnapshot, load_marker: int) -> None:
+    """
+    Cache ``user`` for ``token`` until the TTL or the token's ``exp``,
+    whichever comes first.  Skipped if any invalidation happened since
+    ``begin_load`` returned ``load_marker``.
+    """
+    if settings.USER_CACHE_TTL_SECONDS <= 0 or settings.USER_CACHE_SIZE <= 0:
+        return
+    expires_at = time.time() + settings.USER_CACHE_TTL_SECONDS
+    if token_exp is not None:
+        expires_at = min(expires_at, float(token_exp))
+    with _lock:
+        if load_marker != _invalidations:
+            return
+        _discard(token)
+        _entries[token] = (expires_at, user)
+        _tokens_by_user.setdefault(user.id, set()).add(token)
+        while len(_entries) > settings.USER_CACHE_SIZE:
+            _discard(next(iter(_entries)))
+            metrics.increment("user_cache.evictions")
+
+
+def _discard(token: str) -> None:
+    """Remove one entry (caller holds the lock)."""
+    entry = _entries.pop(token, None)
+    if entry is None:
+        return
+    tokens = _tokens_by_user.get(entry[1].id)
+    if tokens is not None:
+        tokens.discard(token)
+        if not tokens:
+            del _tokens_by_user[entry[1].id]
+
+
+def invalidate_user(user_id: int) -> None:
+    """Drop every cached token of ``user_id``."""
+    global _invalidations
+    with _lock:
+        _invalidations += 1
+        for token in list(_tokens_by_user.get(user_id, ())):
+            _discard(token)
+    metrics.increment("user_cache.invalidations")
+
+
+def clear() -> None:
+    global _invalidations
+    with _lock:
+        _invalidations += 1
+        _entries.clear()
+        _tokens_by_user.clear()
+
+
+def stats() -> Dict[str, Any]:
+    """Size and hit rate of this worker's cache since startup."""
+    with _lock:
+        lookups = _hits + _misses
+        return {
+            "size": len(_entries),
+            "hits": _hits,
+            "misses": _misses,
+            "hit_rate": round(_hits / lookups, 4) if lookups else None,
+        }
+
+
+# ---------------------------------------------------------------------------
+# ORM invalidation
+# ---------------------------------------------------------------------------
+_PENDING_KEY = "user_cache_invalidate"
+
+
+def _affected_user_id(obj: Any) -> Optional[int]:
+    if isinstance(obj, User):
+        return obj.id
+    if isinstance(obj, UserProfile):
+        return obj.user_id
+    return None
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_flushed(session: Session, flush_context: Any) -> None:
+    user_ids = {
+        user_id
+        for obj in (*session.dirty, *session.deleted)
+        if (user_id := _affected_user_id(obj)) is not None
+    }
+    if user_ids:
+        session.info.setdefault(_PENDING_KEY, set()).update(user_ids)
+        for user_id in user_ids:
+            invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,187 @@
+"""
+Normalised skill storage behind ``UserProfile.skill_matrix``.
+
+The profile keeps its JSON ``skill_matrix`` for display.  Every write of it
+is mirrored into ``skills`` (one row per distinct skill) and ``user_skills``
+(one row per user and skill), so cohort questions — how many users list
+Docker, which Frontend Developers lack React — are indexed SQL aggregates
+instead of a Python pass over every profile.
+
+Skill names are matched after ``preprocess_text`` normalisation, the same
+normalisation the skills CSV keyword catalog uses.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, exists, func as sa_func, select
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import Insert
+
+from app.models import Skill, UserProfile, UserSkill
+from app.services.resume_parser import preprocess_text
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_BATCH_SIZE = 500
+
+
+def _insert_ignoring_duplicates(db: Session, model: type, key: List[str]) -> Insert:
+    """``INSERT`` into ``model`` that skips rows clashing on ``key``, for the session's database."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        return sqlite.insert(model).on_conflict_do_nothing(index_elements=key)
+    if dialect == "postgresql":
+        return postgresql.insert(model).on_conflict_do_nothing(index_elements=key)
+    if dialect in ("mysql", "mariadb"):
+        return mysql.insert(model).prefix_with("IGNORE")
+    raise NotImplementedError(f"Skill storage does not support the {dialect} dialect.")
+
+
+def normalise_skills(skills: Iterable[str]) -> Dict[str, str]:
+    """Map normalised name -> first spelling, dropping blanks and duplicates."""
+    names: Dict[str, str] = {}
+    for skill in skills:
+        name = preprocess_text(skill)
+        if name and name not in names:
+            names[name] = skill.strip()
+    return names
+
+
+def skill_ids(db: Session, names: Dict[str, str], create: bool = True) -> Dict[str, int]:
+    """
+    Return ``{normalised name: skill id}`` for ``names``, inserting unknown
+    skills when ``create`` is set (otherwise they are left out).
+    """
+    if not names:
+        return {}
+    if create:
+        db.execute(
+            _insert_ignoring_duplicates(db, Skill, ["name"]),
+            [{"name": n, "display_name": d} for n, d in names.items()],
+        )
+    rows = db.execute(select(Skill.name, Skill.id).where(Skill.name.in_(list(names))))
+    return dict(rows.all())
+
+
+def sync_user_skills(db: Session, user_id: int, skills: Iterable[str]) -> None:
+    """Make ``user_skills`` for ``user_id`` match ``skills``.  The caller commits."""
+    ids = set(skill_ids(db, normalise_skills(skills)).values())
+    db.execute(
+        delete(UserSkill).where(UserSkill.user_id == user_id, UserSkill.skill_id.not_in(ids))
+    )
+    if ids:
+        db.execute(
+            _insert_ignoring_duplicates(db, UserSkill, ["user_id", "skill_id"]),
+            [{"user_id": user_id, "skill_id": skill_id} for skill_id in sorted(ids)],
+        )
+
+
+def backfill_user_skills(db: Session) -> int:
+    """
+    Populate ``user_skills`` from existing profiles if it is still empty
+    (databases created before the table existed).  Returns the number of
+    profiles copied.
+    """
+    if db.execute(select(UserSkill.user_id).limit(1)).first() is not None:
+        return 0
+    copied = 0
+    profiles = db.execute(
+        select(UserProfile.user_id, UserProfile.skill_matrix)
+        .execution_options(yield_per=BACKFILL_BATCH_SIZE)
+    )
+    for batch in profiles.partitions():
+        names: Dict[str, str] = {}
+        pairs = []
+        for user_id, skill_matrix in batch:
+            normalised = normalise_skills(skill_matrix or ())
+            for name, display in normalised.items():
+                names.setdefault(name, display)
+                pairs.append((user_id, name))
+            copied += bool(normalised)
+        if pairs:
+            ids = skill_ids(db, names)
+            db.execute(
+                _insert_ignoring_duplicates(db, UserSkill, ["user_id", "skill_id"]),
+                [{"user_id": user_id, "skill_id": ids[name]} for user_id, name in pairs],
+            )
+    db.commit()
+    if copied:
+        logger.info("Backfilled user_skills from %d profiles.", copied)
+    return copied
+
+
+def skill_user_counts(db: Session, limit: int, prefix: str = "") -> List[tuple]:
+    """``(display_name, users)`` for the most common skills, optionally by name prefix."""
+    query = (
+        select(Skill.display_name, sa_func.count(UserSkill.user_id).label("users"))
+        .join(UserSkill, UserSkill.skill_id == Skill.id)
+        .group_by(Skill.id)
+        .order_by(sa_func.count(UserSkill.user_id).desc(), Skill.name)
+        .limit(limit)
+    )
+    name_prefix = preprocess_text(prefix)
+    if name_prefix:
+        query = query.where(Skill.name >= name_prefix, Skill.name < name_prefix + "\uffff")
+    return db.execute(query).all()
+
+
+def cohort_size(db: Session, has: Iterable[str], lacks: Iterable[str]) -> Tuple[int, List[str]]:
+    """
+    Count users whose profile lists every skill in ``has`` and none in
+    ``lacks``.  Also returns the requested ``has`` skills that no user lists
+    (which make the count 0).
+    """
+    has_names, lacks_names = normalise_skills(has), normalise_skills(lacks)
+    has_ids = skill_ids(db, has_names, create=False)
+    lacks_ids = list(skill_ids(db, lacks_names, create=False).values())
+    unknown = [display for name, display in has_names.items() if name not in has_ids]
+    if unknown:
+        return 0, unknown
+
+    if has_ids:
+        users = (
+            select(UserSkill.user_id)
+            .where(UserSkill.skill_id.in_(list(has_ids.values())))
+            .group_by(UserSkill.user_id)
+            .having(sa_func.count() == len(has_ids))
+        ).subquery()
+        user_id = users.c.user_id
+    else:
+        users = select(UserProfile.user_id).subquery()
+        user_id = users.c.user_id
+
+    query = select(sa_func.count()).select_from(users)
+    if lacks_ids:
+        query = query.where(~exists().where(
+            UserSkill.user_id == user_id, UserSkill.skill_id.in_(lacks_ids)
+        ))
+    return db.execute(query).scalar_one(), []
+
+
+def role_skill_gaps(
+    db: Session, required: Dict[str, str], target_role: Optional[str]
+) -> Tuple[int, List[Tuple[str, int, int]]]:
+    """
+    For each required skill (normalised name -> display name), count the
+    users in the cohort who have it and who lack it.
+
+    The cohort is every profile whose ``target_role`` equals ``target_role``
+    (case-insensitive), or every profile when it is None.  Returns
+    ``(cohort size, [(skill, have, missing)])`` sorted by most missing.
+    """
+    cohort = select(UserProfile.user_id)
+    if target_role is not None:
+        cohort = cohort.where(sa_func.lower(UserProfile.target_role) == target_role.lower())
+    size = db.execute(select(sa_func.count()).select_from(cohort.subquery())).scalar_one()
+
+    counts = dict(db.execute(
+        select(Skill.name, sa_func.count(UserSkill.user_id))
+        .join(UserSkill, UserSkill.skill_id == Skill.id)
+        .where(Skill.name.in_(list(required)), UserSkill.user_id.in_(cohort))
+        .group_by(Skill.id)
+    ).all())
+    gaps = [(display, counts.get(name, 0), size - counts.get(name, 0)) for name, display in required.items()]
+    gaps.sort(key=lambda gap: (-gap[2], gap[0].lower()))
+    return size, gaps
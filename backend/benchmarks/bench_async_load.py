@@ -0,0 +1,172 @@
+"""
+Concurrent load test: async database access vs sync-in-async route handlers.
+
+Seeds a throwaway SQLite database, starts the app under uvicorn in a
+subprocess, then drives it over HTTP with N concurrent clients.  Each client alternates a heavy listing request (a
+substring search no cache can answer, so every request scans the table)
+with a light ``/jobs/status`` request.
+
+Two variants of the same two endpoints are compared:
+
+* ``async`` — the real ``/api/jobs`` and ``/api/jobs/status``, which use
+  the aiosqlite ``AsyncSession``;
+* ``sync-in-async`` — copies mounted by this script that call the same
+  query code with a synchronous ``Session`` from inside ``async def``
+  (how the routes worked before), blocking the event loop while SQLite runs.
+
+Reports throughput and the latency of the light requests, which is where a
+blocked event loop shows up.
+
+    python benchmarks/bench_async_load.py --rows 100000 --concurrency 1 8 32
+
+Run from the ``backend`` directory.
+"""
+
+import argparse
+import asyncio
+import itertools
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# The server subprocess inherits the scratch database path from the parent.
+_DB_FILE = Path(os.environ.get("BENCH_ASYNC_LOAD_DB") or Path(tempfile.mkdtemp()) / "bench_async_load.db")
+os.environ["BENCH_ASYNC_LOAD_DB"] = str(_DB_FILE)
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_FILE}"
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+from fastapi import Request  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.database import SessionLocal, create_tables  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import ScrapeStatus  # noqa: E402
+from app.routes.jobs import _sql_listing  # noqa: E402
+from app.services import job_cache  # noqa: E402
+
+from bench_jobs_listing import seed  # noqa: E402
+
+_unique = itertools.count()
+
+
+# ---------------------------------------------------------------------------
+# Sync-in-async reference endpoints
+# ---------------------------------------------------------------------------
+@app.get("/bench/sync-in-async/jobs", include_in_schema=False)
+async def sync_in_async_jobs(request: Request, search: str) -> dict:
+    with SessionLocal() as db:
+        generation = job_cache.current_generation(db)
+        result = _sql_listing(
+            db, None, None, search, "contains", None, "contains", False,
+            generation, False, None, True, 1, 20,
+        )
+    return {"total": result["total"]}
+
+
+@app.get("/bench/sync-in-async/status", include_in_schema=False)
+async def sync_in_async_status() -> dict:
+    with SessionLocal() as db:
+        latest = db.query(ScrapeStatus).order_by(ScrapeStatus.id.desc()).first()
+    return {"status": latest.status if latest else "never_run"}
+
+
+VARIANTS = {
+    "async": ("/api/jobs", "/api/jobs/status"),
+    "sync-in-async": ("/bench/sync-in-async/jobs", "/bench/sync-in-async/status"),
+}
+
+
+async def run_variant(
+    base_url: str, variant: str, concurrency: int, duration: float
+) -> tuple[float, list[float]]:
+    """Run the mixed workload; return (requests/sec, light-request latencies in ms)."""
+    heavy_path, light_path = VARIANTS[variant]
+    light_ms: list[float] = []
+    done = 0
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+        deadline = time.perf_counter() + duration
+
+        async def worker() -> None:
+            nonlocal done
+            while time.perf_counter() < deadline:
+                # A search term no row contains: a full scan on every request.
+                response = await client.get(heavy_path, params={"search": f"zq{next(_unique)}x"})
+                response.raise_for_status()
+                start = time.perf_counter()
+                response = await client.get(light_path)
+                light_ms.append((time.perf_counter() - start) * 1000)
+                response.raise_for_status()
+                done += 2
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return done / elapsed, light_ms
+
+
+def serve(port: int) -> None:
+    """Subprocess entry point: serve the app (plus reference routes) on ``port``."""
+    settings.JOB_RESPONSE_CACHE_SIZE = 0
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def wait_until_up(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            httpx.get(f"{base_url}/", timeout=1).raise_for_status()
+            return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise RuntimeError("benchmark server did not start")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per measurement")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)  # silence per-request logs
+    if args.serve:
+        serve(args.port)
+        return
+
+    create_tables()
+    seed(args.rows)
+    print(f"{args.rows:,} rows, {args.duration:.0f}s per measurement")
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    server = subprocess.Popen(
+        [sys.executable, __file__, "--serve", "--port", str(args.port)],
+        env=dict(os.environ, SCRAPE_INTERVAL_HOURS="0"),  # no scheduled scrapes mid-benchmark
+    )
+    try:
+        wait_until_up(base_url)
+        for concurrency in args.concurrency:
+            for variant in VARIANTS:
+                rps, light_ms = asyncio.run(run_variant(base_url, variant, concurrency, args.duration))
+                p95 = statistics.quantiles(light_ms, n=20)[-1] if len(light_ms) > 1 else light_ms[0]
+                print(
+                    f"  c={concurrency:<3d} {variant:<14s} {rps:8.1f} req/s   "
+                    f"status p50={statistics.median(light_ms):8.2f} ms  p95={p95:8.2f} ms"
+                )
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
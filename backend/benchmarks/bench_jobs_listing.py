@@ -0,0 +1,164 @@
+"""
+Latency benchmark for GET /api/jobs at large table sizes.
+
+Seeds a throwaway SQLite database with synthetic jobs and times typical
+listing requests through the FastAPI app (filters, exact vs contains
+matching, deep offset vs cursor pages), reporting p50 / p95 latency per case.
+
+    python benchmarks/bench_jobs_listing.py --rows 100000 1000000
+    python benchmarks/bench_jobs_listing.py --rows 100000 --without-indexes
+    python benchmarks/bench_jobs_listing.py --rows 100000 --response-cache
+    python benchmarks/bench_jobs_listing.py --rows 100000 --read-model
+
+Run from the ``backend`` directory.
+"""
+
+import argparse
+import logging
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+_DB_FILE = Path(tempfile.mkdtemp()) / "bench_jobs.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_FILE}"
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import func, insert, text  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.database import SessionLocal, create_tables, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Job  # noqa: E402
+from app.routes.jobs import _encode_cursor  # noqa: E402
+from app.services import job_cache, job_snapshot  # noqa: E402
+
+CATEGORIES = [
+    "Data Analyst", "Data Scientist", "Data Engineer", "Machine Learning Engineer",
+    "AI Engineer", "Web Developer", "Full Stack Developer", "Backend Developer",
+    "Frontend Developer", "Android Developer", "iOS Developer", "Software Development",
+    "DevOps Engineer", "Cybersecurity Analyst", "UI/UX Designer", "Software Tester",
+    "Database", "Scrum Master", "Business Analyst", "Digital Marketer",
+    "Information Technology",
+]
+PLATFORMS = ["Internshala", "FreshersWorld"]
+EXPERIENCE = ["Fresher", "0-1 years", "1-2 years", "0-2 years", "2-3 years", "3-5 years"]
+
+CASES = {
+    "page 1, no filter": {},
+    "page 200, no filter": {"page": 200},
+    "category contains": {"category": "Data"},
+    "category exact": {"category": "Data Analyst", "match": "exact"},
+    "category+experience exact": {"category": "Backend Developer", "experience": "Fresher", "match": "exact"},
+    "platform exact": {"platform": "Internshala", "match": "exact"},
+    "search contains": {"search": "python"},
+    "search fts": {"search": "python", "search_mode": "fts"},
+    "search fts, rare 2 words": {"search": "cloud 99", "search_mode": "fts"},
+    "cursor page 1, no total": {"pagination": "cursor", "include_total": False},
+    # "cursor page 200" is filled in per table size by deep_cursor_params().
+}
+
+
+def seed(target_rows: int, batch: int = 50_000) -> None:
+    """Insert synthetic jobs until the table holds ``target_rows`` rows."""
+    rng = random.Random(42)
+    with SessionLocal() as db:
+        have = db.query(func.count(Job.id)).scalar() or 0
+        start = datetime(2026, 1, 1)
+        while have < target_rows:
+            n = min(batch, target_rows - have)
+            rows = []
+            for i in range(have, have + n):
+                category = rng.choice(CATEGORIES)
+                rows.append({
+                    "platform": rng.choice(PLATFORMS),
+                    "title": f"{rng.choice(['Python', 'Java', 'React', 'SQL', 'Cloud'])} {category} {i}",
+                    "company": f"Company {rng.randrange(5000)}",
+                    "location": rng.choice(["Bangalore", "Delhi", "Pune", "Remote"]),
+                    "category": category,
+                    "salary": "Not disclosed",
+                    "experience": rng.choice(EXPERIENCE),
+                    "link": f"https://example.com/jobs/{i}",
+                    "scraped_at": start + timedelta(seconds=i),
+                })
+            db.execute(insert(Job), rows)
+            db.commit()
+            have += n
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+
+
+def drop_listing_indexes() -> None:
+    """Drop the listing access-path indexes to measure the unindexed baseline."""
+    with engine.begin() as conn:
+        for index in Job.__table__.indexes:
+            if index.name.startswith("ix_jobs_") and index.name not in ("ix_jobs_id", "ix_jobs_cluster_id"):
+                conn.execute(text(f'DROP INDEX IF EXISTS "{index.name}"'))
+
+
+def deep_cursor_params(page: int = 200, per_page: int = 20) -> dict:
+    """Cursor-mode params landing on the same rows as offset page ``page``."""
+    with SessionLocal() as db:
+        anchor = (
+            db.query(Job)
+            .order_by(Job.scraped_at.desc(), Job.id.desc())
+            .offset((page - 1) * per_page - 1)
+            .first()
+        )
+        return {"pagination": "cursor", "cursor": _encode_cursor(anchor.scraped_at, anchor.id), "include_total": False}
+
+
+def time_case(client: TestClient, params: dict, repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get("/api/jobs", params=params)
+        timings.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=20, help="Requests per case")
+    parser.add_argument("--without-indexes", action="store_true", help="Drop listing indexes first")
+    parser.add_argument(
+        "--response-cache", action="store_true",
+        help="Keep the rendered-response cache on (repeat requests become cache hits)",
+    )
+    parser.add_argument("--read-model", action="store_true", help="Serve from the in-memory read model")
+    args = parser.parse_args()
+
+    if not args.response_cache:
+        settings.JOB_RESPONSE_CACHE_SIZE = 0
+
+    logging.getLogger().setLevel(logging.WARNING)  # silence per-request logs
+    create_tables()
+    if args.without_indexes:
+        drop_listing_indexes()
+
+    client = TestClient(app)
+    for rows in sorted(args.rows):
+        t0 = time.perf_counter()
+        seed(rows)
+        print(f"\n== {rows:,} rows (seeded in {time.perf_counter() - t0:.1f}s) ==")
+        if args.read_model:
+            settings.JOB_READ_MODEL = True
+            t0 = time.perf_counter()
+            job_snapshot.refresh(job_cache.current_generation(), force=True)
+            print(f"   read model built in {time.perf_counter() - t0:.1f}s")
+        cases = dict(CASES, **{"cursor page 200": deep_cursor_params()})
+        for name, params in cases.items():
+            timings = time_case(client, params, args.repeat)
+            p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0]
+            print(f"  {name:<28s} p50={statistics.median(timings):8.2f} ms   p95={p95:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Warm-path latency of ``POST /api/analyze/feedback``: shared LLM client vs one
+client per request.
+
+Starts two subprocesses: a stub Groq-compatible chat-completions API and the
+app under uvicorn, with ``LLM_API_BASE`` pointing at the stub.  Then sends
+sequential feedback requests to
+
+* ``shared`` — the real ``/api/analyze/feedback``, which reuses the cached
+  ``ChatGroq`` and its pooled HTTP connections (``llm_client``);
+* ``per-request`` — a copy mounted by this script that builds a new
+  ``ChatGroq`` for every call (how the route worked before), so every call
+  creates new SDK clients and opens a new connection.
+
+The stub answers immediately (plus ``--llm-latency-ms``), so the difference
+is client setup and connection cost.  Against the real API over HTTPS the
+per-request variant also pays a TLS handshake on every call.
+
+    python benchmarks/bench_llm_client.py --requests 200
+
+Run from the ``backend`` directory.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{Path(tempfile.mkdtemp()) / 'bench_llm_client.db'}")
+os.environ.setdefault("GROQ_API_KEY", "bench-key")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from app.config import get_api_key, settings  # noqa: E402
+from app.schema import FeedbackRequest, FeedbackResponse  # noqa: E402
+
+BODY = {
+    "resume_text": "Frontend developer with React, TypeScript, HTML and CSS experience.",
+    "role": "Frontend Developer",
+    "missing_skills": ["Redux", "Jest"],
+}
+
+
+# ---------------------------------------------------------------------------
+# Stub chat-completions API
+# ---------------------------------------------------------------------------
+def stub_app(latency_ms: float) -> FastAPI:
+    stub = FastAPI()
+
+    @stub.post("/openai/v1/chat/completions")
+    async def completions(body: dict) -> dict:
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        return {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion",
+            "created": 0,
+            "model": body.get("model", ""),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": "Looks good."},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        }
+
+    return stub
+
+
+# ---------------------------------------------------------------------------
+# App with the per-request reference endpoint
+# ---------------------------------------------------------------------------
+def serve(port: int) -> None:
+    from app.main import app
+
+    @app.post("/bench/per-request/feedback", include_in_schema=False)
+    async def per_request_feedback(body: FeedbackRequest) -> FeedbackResponse:
+        from langchain_groq import ChatGroq
+
+        llm = ChatGroq(
+            model=settings.LLM_MODEL,
+            temperature=0.2,
+            max_retries=2,
+            api_key=get_api_key(),
+            base_url=settings.LLM_API_BASE,
+        )
+        response = llm.invoke(f"{body.resume_text}\n{body.role}\n{body.missing_skills}")
+        return FeedbackResponse(feedback=response.content.strip())
+
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+VARIANTS = {
+    "shared": "/api/analyze/feedback",
+    "per-request": "/bench/per-request/feedback",
+}
+
+
+def measure(base_url: str, path: str, requests: int) -> list[float]:
+    """Send ``requests`` sequential feedback calls; return latencies in ms."""
+    latencies: list[float] = []
+    with httpx.Client(base_url=base_url, timeout=60) as client:
+        client.post(path, json=BODY).raise_for_status()  # warm-up
+        for _ in range(requests):
+            start = time.perf_counter()
+            response = client.post(path, json=BODY)
+            latencies.append((time.perf_counter() - start) * 1000)
+            response.raise_for_status()
+    return latencies
+
+
+def wait_until_up(url: str, timeout: float = 30.0) -> None:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            httpx.get(url, timeout=1)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise RuntimeError(f"{url} did not start")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="Simulated model time per call")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--stub-port", type=int, default=8767)
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--stub", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)  # silence per-request logs
+    if args.stub:
+        uvicorn.run(stub_app(args.llm_latency_ms), host="127.0.0.1", port=args.stub_port, log_level="warning")
+        return
+    if args.serve:
+        serve(args.port)
+        return
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    stub_url = f"http://127.0.0.1:{args.stub_port}"
+    env = dict(os.environ, LLM_API_BASE=stub_url, SCRAPE_INTERVAL_HOURS="0", SCRAPE_ON_STARTUP="false")
+    stub = subprocess.Popen(
+        [sys.executable, __file__, "--stub", "--stub-port", str(args.stub_port),
+         "--llm-latency-ms", str(args.llm_latency_ms)],
+        env=env,
+    )
+    server = subprocess.Popen([sys.executable, __file__, "--serve", "--port", str(args.port)], env=env)
+    try:
+        wait_until_up(stub_url)
+        wait_until_up(base_url)
+        print(f"{args.requests} sequential requests per variant, stub latency {args.llm_latency_ms:.0f} ms")
+        for variant, path in VARIANTS.items():
+            latencies = measure(base_url, path, args.requests)
+            p95 = statistics.quantiles(latencies, n=20)[-1]
+            print(f"  {variant:<12s} p50={statistics.median(latencies):7.2f} ms  p95={p95:7.2f} ms")
+    finally:
+        server.terminate()
+        stub.terminate()
+        server.wait()
+        stub.wait()
+
+
+if __name__ == "__main__":
+    main()
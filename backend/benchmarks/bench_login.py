@@ -0,0 +1,173 @@
+"""
+Login throughput benchmark: PBKDF2 on the event loop vs the hashing pool.
+
+Seeds one user in a throwaway SQLite database, starts the app under uvicorn
+in a subprocess, then has N concurrent clients log in repeatedly while a
+probe client requests the health check (``GET /``) in a loop.
+
+Two variants of login are compared:
+
+* ``pool`` — the real ``POST /api/auth/login``, which verifies the password
+  on the bounded hashing thread pool;
+* ``on-loop`` — a copy mounted by this script that calls
+  ``verify_password`` inline (how the route worked before), blocking the
+  event loop for every hash.
+
+Reports logins per second, login latency, 503s from admission control, and
+the latency of the probe requests, which is where a blocked event loop
+shows up.
+
+    python benchmarks/bench_login.py --concurrency 1 8 32
+
+Run from the ``backend`` directory.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# The server subprocess inherits the scratch database path from the parent.
+_DB_FILE = Path(os.environ.get("BENCH_LOGIN_DB") or Path(tempfile.mkdtemp()) / "bench_login.db")
+os.environ["BENCH_LOGIN_DB"] = str(_DB_FILE)
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_FILE}"
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+from fastapi import Depends, HTTPException  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+
+from app.database import SessionLocal, create_tables, get_async_db  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import User  # noqa: E402
+from app.schema import UserLogin  # noqa: E402
+from app.services.security import create_access_token, hash_password, verify_password  # noqa: E402
+
+EMAIL = "bench@example.com"
+PASSWORD = "bench-password"
+
+
+# ---------------------------------------------------------------------------
+# On-loop reference endpoint
+# ---------------------------------------------------------------------------
+@app.post("/bench/on-loop/login", include_in_schema=False)
+async def on_loop_login(body: UserLogin, db: AsyncSession = Depends(get_async_db)) -> dict:
+    user = (await db.execute(select(User).where(User.email == body.email))).scalar_one_or_none()
+    if not user or not verify_password(body.password, user.hashed_password):
+        raise HTTPException(status_code=401, detail="Invalid email or password.")
+    return {"access_token": create_access_token(data={"sub": user.email})}
+
+
+VARIANTS = {
+    "pool": "/api/auth/login",
+    "on-loop": "/bench/on-loop/login",
+}
+
+
+async def run_variant(base_url: str, variant: str, concurrency: int, duration: float) -> dict:
+    """Run the login workload with a concurrent probe; return raw measurements."""
+    login_ms: list[float] = []
+    probe_ms: list[float] = []
+    rejected = 0
+
+    limits = httpx.Limits(max_connections=concurrency + 1)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+        deadline = time.perf_counter() + duration
+
+        async def login_worker() -> None:
+            nonlocal rejected
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                response = await client.post(VARIANTS[variant], json={"email": EMAIL, "password": PASSWORD})
+                if response.status_code == 503:
+                    rejected += 1
+                    continue
+                response.raise_for_status()
+                login_ms.append((time.perf_counter() - start) * 1000)
+
+        async def probe() -> None:
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                (await client.get("/")).raise_for_status()
+                probe_ms.append((time.perf_counter() - start) * 1000)
+                await asyncio.sleep(0.01)
+
+        start = time.perf_counter()
+        await asyncio.gather(probe(), *(login_worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return {"elapsed": elapsed, "login_ms": login_ms, "probe_ms": probe_ms, "rejected": rejected}
+
+
+def p95(values: list[float]) -> float:
+    return statistics.quantiles(values, n=20)[-1] if len(values) > 1 else values[0]
+
+
+def serve(port: int) -> None:
+    """Subprocess entry point: serve the app (plus the reference route) on ``port``."""
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def wait_until_up(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            httpx.get(f"{base_url}/", timeout=1).raise_for_status()
+            return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise RuntimeError("benchmark server did not start")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per measurement")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)  # silence per-request logs
+    if args.serve:
+        serve(args.port)
+        return
+
+    create_tables()
+    with SessionLocal() as db:
+        if not db.query(User).filter(User.email == EMAIL).first():
+            db.add(User(email=EMAIL, hashed_password=hash_password(PASSWORD), full_name="Bench"))
+            db.commit()
+    print(f"{os.cpu_count()} CPUs, {args.duration:.0f}s per measurement")
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    server = subprocess.Popen(
+        [sys.executable, __file__, "--serve", "--port", str(args.port)],
+        # No scheduled scrapes mid-benchmark; on-loop hashing would also make
+        # every query look slow.
+        env=dict(os.environ, SCRAPE_INTERVAL_HOURS="0", SLOW_QUERY_MS="1e9"),
+    )
+    try:
+        wait_until_up(base_url)
+        for concurrency in args.concurrency:
+            for variant in VARIANTS:
+                r = asyncio.run(run_variant(base_url, variant, concurrency, args.duration))
+                print(
+                    f"  c={concurrency:<3d} {variant:<8s} {len(r['login_ms']) / r['elapsed']:7.1f} logins/s  "
+                    f"login p50={statistics.median(r['login_ms']):8.1f} ms   "
+                    f"probe p50={statistics.median(r['probe_ms']):7.1f} ms  p95={p95(r['probe_ms']):7.1f} ms   "
+                    f"503s={r['rejected']}"
+                )
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Latency benchmark for GET /api/jobs/recommended.
+
+Seeds a throwaway SQLite database with synthetic jobs tagged with skill
+keywords (as the scraper would) and a user whose profile lists a few
+skills, then times recommendation requests, reporting p50 / p95.  The first
+request of each size also builds the in-memory keyword index.
+
+    python benchmarks/bench_recommend.py --rows 10000 100000
+
+Run from the ``backend`` directory.
+"""
+
+import argparse
+import logging
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+_DB_FILE = Path(tempfile.mkdtemp()) / "bench_recommend.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_FILE}"
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import func, insert  # noqa: E402
+
+from app.database import SessionLocal, create_tables  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Job, ScrapeStatus, User, UserProfile  # noqa: E402
+from app.services import job_cache  # noqa: E402
+from app.services.job_recommender import job_keyword_ids  # noqa: E402
+from app.services.job_scraper import classify_job_category  # noqa: E402
+from app.services.security import create_access_token, hash_password  # noqa: E402
+from app.services.skills_db import keyword_catalog  # noqa: E402
+
+TITLES = [
+    "Python Developer", "Data Analyst - SQL & Power BI", "React Frontend Developer",
+    "Java Spring Boot Engineer", "DevOps Engineer (Docker, Kubernetes)", "QA Automation - Selenium",
+    "Android Developer Kotlin", "Machine Learning Engineer", "Digital Marketing Executive - SEO",
+    "Business Analyst", "Full Stack Developer Node.js", "Cloud Support Engineer AWS",
+]
+USER_SKILLS = ["Python", "SQL", "Pandas", "Power BI", "Excel", "Machine Learning", "Docker"]
+
+
+def seed(target_rows: int, batch: int = 20_000) -> None:
+    """Insert keyword-tagged synthetic jobs until the table holds ``target_rows``."""
+    rng = random.Random(7)
+    catalog = keyword_catalog()
+    with SessionLocal() as db:
+        have = db.query(func.count(Job.id)).scalar() or 0
+        start = datetime(2026, 1, 1)
+        while have < target_rows:
+            rows = []
+            for i in range(have, have + min(batch, target_rows - have)):
+                title = f"{rng.choice(TITLES)} {i}"
+                category = classify_job_category(title)
+                rows.append({
+                    "platform": "Internshala", "title": title, "company": f"Company {i % 900}",
+                    "location": "Remote", "category": category, "salary": "Not disclosed",
+                    "experience": "Fresher", "link": f"https://example.com/jobs/{i}",
+                    "scraped_at": start + timedelta(seconds=i),
+                    "keyword_ids": job_keyword_ids(catalog, title, category),
+                    "keyword_catalog": catalog.version,
+                })
+            db.execute(insert(Job), rows)
+            db.commit()
+            have += len(rows)
+
+
+def publish_generation() -> None:
+    """Record a completed scrape so the keyword index is rebuilt for the new rows."""
+    with SessionLocal() as db:
+        status = ScrapeStatus(started_at=datetime.utcnow(), completed_at=datetime.utcnow(), status="completed")
+        db.add(status)
+        db.commit()
+        job_cache.publish_scrape(status.id, None)
+
+
+def create_user() -> str:
+    """Create the benchmark user and return a bearer token for it."""
+    with SessionLocal() as db:
+        user = User(email="bench@example.com", hashed_password=hash_password("bench"), full_name="Bench")
+        user.profile = UserProfile(skill_matrix=USER_SKILLS)
+        db.add(user)
+        db.commit()
+    return create_access_token({"sub": "bench@example.com"})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=30, help="Requests per size")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)  # silence per-request logs
+    create_tables()
+    headers = {"Authorization": f"Bearer {create_user()}"}
+    client = TestClient(app)
+
+    for rows in sorted(args.rows):
+        seed(rows)
+        publish_generation()
+
+        start = time.perf_counter()
+        client.get("/api/jobs/recommended", headers=headers).raise_for_status()
+        cold = (time.perf_counter() - start) * 1000
+
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            response = client.get("/api/jobs/recommended", headers=headers)
+            timings.append((time.perf_counter() - start) * 1000)
+            response.raise_for_status()
+        p95 = statistics.quantiles(timings, n=20)[-1]
+        print(
+            f"{rows:>9,} jobs: cold={cold:8.1f} ms   "
+            f"p50={statistics.median(timings):7.2f} ms   p95={p95:7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
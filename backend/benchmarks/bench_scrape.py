@@ -0,0 +1,160 @@
+"""
+End-to-end scraper benchmark against recorded HTTP fixtures.
+
+Runs ``scrape_and_store_jobs`` in replay mode against a throwaway SQLite
+database and reports pages/sec and rows/sec.
+
+Record fixtures once from the live sites (needs network):
+
+    python benchmarks/bench_scrape.py --record
+
+or generate synthetic listing pages that mimic both boards' markup:
+
+    python benchmarks/bench_scrape.py --synthetic 50
+
+then benchmark offline:
+
+    python benchmarks/bench_scrape.py --runs 5 --latency-ms 20 --error-rate 0.05
+
+Run from the ``backend`` directory.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Point the app at a scratch database before anything imports app.database.
+_DB_FILE = Path(tempfile.mkdtemp()) / "bench_scrape.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_FILE}"
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.config import settings  # noqa: E402
+from app.database import SessionLocal, create_tables  # noqa: E402
+from app.models import ScrapePageMetric  # noqa: E402
+from app.services import job_scraper  # noqa: E402
+from app.services.http_fixtures import create_scrape_session, fixture_key  # noqa: E402
+
+
+def _write_fixture(fixture_dir: Path, url: str, html: str) -> None:
+    """Store one synthetic 200 response in the recorded-fixture format."""
+    key = fixture_key("GET", url)
+    (fixture_dir / f"{key}.body").write_bytes(html.encode("utf-8"))
+    (fixture_dir / f"{key}.json").write_text(
+        json.dumps({
+            "method": "GET",
+            "url": url,
+            "status_code": 200,
+            "reason": "OK",
+            "encoding": "utf-8",
+            "headers": {"Content-Type": "text/html; charset=utf-8"},
+        }),
+        encoding="utf-8",
+    )
+
+
+def generate_synthetic_fixtures(fixture_dir: Path, pages: int, cards: int = 20) -> None:
+    """Write ``pages`` listing pages per board, ``cards`` jobs each."""
+    fixture_dir.mkdir(parents=True, exist_ok=True)
+    titles = ["Python Developer", "Data Analyst", "React Developer", "QA Engineer",
+              "DevOps Engineer", "Android Developer", "Business Analyst"]
+
+    for i, url in enumerate(job_scraper._internshala_urls(pages), start=1):
+        html = "".join(
+            f'<div class="individual_internship">'
+            f'<a class="job-title-href" href="/job/detail/{i}-{c}">{titles[c % len(titles)]} {i}-{c}</a>'
+            f'<p class="company-name">Company {c}</p>'
+            f'<div class="locations">Bangalore</div><span class="mobile">3-5 LPA</span>'
+            f'<div class="row-1-item"><span>0-1 years</span></div></div>'
+            for c in range(cards)
+        )
+        _write_fixture(fixture_dir, url, f"<html><body>{html}</body></html>")
+
+    for i, url in enumerate(job_scraper._freshersworld_urls(pages), start=1):
+        html = "".join(
+            f'<div class="job-container" job_id="{i}{c}">'
+            f'<span class="wrap-title">{titles[c % len(titles)]} FW {i}-{c}</span>'
+            f'<h3 class="latest-jobs-title">FW Company {c}</h3>'
+            f'<span class="job-location"><a>Pune</a></span>'
+            f'<a href="https://www.freshersworld.com/jobs/{i}-{c}">view</a></div>'
+            for c in range(cards)
+        )
+        _write_fixture(fixture_dir, url, f"<html><body>{html}</body></html>")
+
+    print(f"Wrote {pages * 2} synthetic pages to {fixture_dir}")
+
+
+def run_once(args: argparse.Namespace, seed: int) -> tuple[float, int, int]:
+    """Run one replayed scrape; return (seconds, pages fetched, rows written)."""
+    session = create_scrape_session(
+        mode="replay",
+        fixture_dir=args.fixtures,
+        latency_ms=args.latency_ms,
+        error_rate=args.error_rate,
+        seed=seed,
+    )
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        status = job_scraper.scrape_and_store_jobs(
+            db,
+            num_pages_internshala=args.pages,
+            num_pages_fw=args.pages,
+            session=session,
+        )
+        elapsed = time.perf_counter() - start
+        pages = db.query(ScrapePageMetric).filter(ScrapePageMetric.scrape_id == status.id).count()
+        return elapsed, pages, status.job_count
+    finally:
+        db.close()
+        session.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", default=settings.SCRAPE_FIXTURE_DIR, help="Fixture directory")
+    parser.add_argument("--pages", type=int, default=50, help="Max pages per board")
+    parser.add_argument("--runs", type=int, default=3, help="Benchmark repetitions")
+    parser.add_argument("--latency-ms", type=int, default=0, help="Injected latency per request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Injected failure fraction")
+    parser.add_argument("--record", action="store_true", help="Record fixtures from the live sites")
+    parser.add_argument("--synthetic", type=int, metavar="PAGES", help="Generate synthetic fixtures")
+    args = parser.parse_args()
+
+    create_tables()
+
+    if args.synthetic:
+        generate_synthetic_fixtures(Path(args.fixtures), args.synthetic)
+        return
+
+    if args.record:
+        session = create_scrape_session(mode="record", fixture_dir=args.fixtures)
+        db = SessionLocal()
+        try:
+            status = job_scraper.scrape_and_store_jobs(
+                db, num_pages_internshala=args.pages, num_pages_fw=args.pages, session=session
+            )
+            print(f"Recorded run {status.id}: {status.status}, {status.job_count} jobs -> {args.fixtures}")
+        finally:
+            db.close()
+            session.close()
+        return
+
+    results = [run_once(args, seed) for seed in range(args.runs)]
+    for n, (elapsed, pages, rows) in enumerate(results, start=1):
+        print(
+            f"run {n}: {elapsed:7.3f}s  pages={pages:<5d} rows={rows:<6d} "
+            f"pages/s={pages / elapsed:8.1f}  rows/s={rows / elapsed:9.1f}"
+        )
+    print(
+        f"median: pages/s={statistics.median(p / e for e, p, _ in results):8.1f}  "
+        f"rows/s={statistics.median(r / e for e, _, r in results):9.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Response serialization benchmark for list endpoints: per-row Pydantic
+models vs plain column tuples rendered with orjson.
+
+Seeds a throwaway SQLite database and times, through the FastAPI app:
+
+* job pages of 100 and 10,000 items — ``before`` builds a ``JobResponse``
+  per ORM row inside a ``JobListResponse`` returned via ``response_model``
+  (how ``/api/jobs`` used to work); ``after`` is the tuple + orjson path
+  used by ``/api/jobs`` now (``_sql_listing``);
+* the admin user listing with 100 and 10,000 users — ``before`` returns ORM
+  objects for FastAPI to validate one by one; ``after`` is the real
+  ``/api/auth/get_all_users``.
+
+Totals are not counted in either variant, so only fetch + serialization
+is compared.
+
+    python benchmarks/bench_serialization.py
+
+Run from the ``backend`` directory.
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_DB_FILE = Path(tempfile.mkdtemp()) / "bench_serialization.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_FILE}"
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi import Depends, Response  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import func, insert  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.database import SessionLocal, create_tables, get_db  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Job, User  # noqa: E402
+from app.routes.jobs import _sql_listing  # noqa: E402
+from app.schema import JobListResponse, JobResponse, UserResponse  # noqa: E402
+from app.services import fast_json  # noqa: E402
+from app.services.security import create_access_token  # noqa: E402
+
+from bench_jobs_listing import seed as seed_jobs  # noqa: E402
+
+SIZES = (100, 10_000)
+
+
+# ---------------------------------------------------------------------------
+# Reference ("before") and large-page ("after") routes
+# ---------------------------------------------------------------------------
+@app.get("/bench/before/jobs", response_model=JobListResponse, include_in_schema=False)
+def before_jobs(limit: int, db: Session = Depends(get_db)) -> JobListResponse:
+    jobs = db.query(Job).order_by(Job.scraped_at.desc(), Job.id.desc()).limit(limit).all()
+    return JobListResponse(
+        jobs=[JobResponse.model_validate(j) for j in jobs],
+        total=None, page=1, per_page=limit, total_pages=None,
+    )
+
+
+@app.get("/bench/after/jobs", include_in_schema=False)
+def after_jobs(limit: int, db: Session = Depends(get_db)) -> Response:
+    payload = _sql_listing(
+        db, None, None, None, "contains", None, "contains", False,
+        0, False, None, False, 1, limit,
+    )
+    return Response(fast_json.dumps(payload), media_type="application/json")
+
+
+@app.get("/bench/before/users", response_model=list[UserResponse], include_in_schema=False)
+def before_users(db: Session = Depends(get_db)) -> list:
+    return list(db.query(User).filter(User.role == "user"))
+
+
+def seed_users(target: int) -> None:
+    with SessionLocal() as db:
+        have = db.query(func.count(User.id)).filter(User.role == "user").scalar()
+        db.execute(insert(User), [
+            {"email": f"user{i}@example.com", "hashed_password": "x", "full_name": f"User {i}", "role": "user"}
+            for i in range(have, target)
+        ])
+        if not db.query(User).filter(User.role == "admin").first():
+            db.add(User(email="admin@example.com", hashed_password="x", full_name="Admin", role="admin"))
+        db.commit()
+
+
+def time_get(client: TestClient, path: str, repeat: int, **kwargs) -> float:
+    """Median milliseconds for ``repeat`` GETs of ``path``."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get(path, **kwargs)
+        timings.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    return statistics.median(timings)
+
+
+def report(name: str, before: float, after: float) -> None:
+    print(f"  {name:<22s} before={before:9.2f} ms   after={after:9.2f} ms   x{before / after:5.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20, help="Requests per case")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)  # silence per-request logs
+    create_tables()
+    seed_jobs(max(SIZES))
+    client = TestClient(app)
+    admin = {"Authorization": f"Bearer {create_access_token({'sub': 'admin@example.com'})}"}
+
+    print("job pages (median):")
+    for size in SIZES:
+        before = time_get(client, "/bench/before/jobs", args.repeat, params={"limit": size})
+        after = time_get(client, "/bench/after/jobs", args.repeat, params={"limit": size})
+        report(f"{size:,} items", before, after)
+
+    print("admin user listing (median):")
+    for size in SIZES:
+        seed_users(size)
+        before = time_get(client, "/bench/before/users", args.repeat)
+        after = time_get(client, "/api/auth/get_all_users", args.repeat, headers=admin)
+        report(f"{size:,} users", before, after)
+
+
+if __name__ == "__main__":
+    main()
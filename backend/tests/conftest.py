@@ -0,0 +1,122 @@
+"""
+Shared fixtures for the backend test suite.
+
+The app is pointed at a scratch SQLite file with the scrape scheduler off
+before anything imports ``app``.  Every test starts with empty tables and
+empty per-process caches.
+
+Run from the ``backend`` directory:
+
+    python -m pytest -q
+"""
+
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+_DB_FILE = Path(tempfile.mkdtemp()) / "test.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_FILE}"
+os.environ["SCRAPE_INTERVAL_HOURS"] = "0"
+os.environ["SCRAPE_ON_STARTUP"] = "false"
+os.environ["JOB_GENERATION_POLL_SECONDS"] = "0"
+os.environ.pop("GROQ_API_KEY", None)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+import app.models  # noqa: E402,F401  (registers every table)
+from app.database import Base, SessionLocal, create_tables, engine  # noqa: E402
+from app.models import Job  # noqa: E402
+from app.services import (  # noqa: E402
+    job_cache,
+    job_recommender,
+    job_snapshot,
+    login_throttle,
+    user_cache,
+)
+
+
+def _reset_process_state() -> None:
+    user_cache.clear()
+    job_recommender._index = None
+    job_snapshot._snapshot = None
+    login_throttle._memory_store = login_throttle._MemoryStore()
+    with job_cache._lock:
+        job_cache._sync(0)
+        job_cache._generation_checked_at = float("-inf")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _tables():
+    create_tables()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _clean_state():
+    _reset_process_state()
+    yield
+    with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+    _reset_process_state()
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client():
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def make_job(db):
+    """Insert a job; fields default to a plain Internshala listing."""
+    counter = iter(range(1, 1_000_000))
+
+    def _make(**fields) -> Job:
+        n = next(counter)
+        values = {
+            "platform": "Internshala",
+            "title": f"Developer {n}",
+            "company": f"Company {n}",
+            "category": "Software Development",
+            "experience": "Fresher",
+            "link": f"https://example.com/jobs/{n}",
+            "scraped_at": datetime(2024, 1, 1) + timedelta(minutes=n),
+        }
+        values.update(fields)
+        job = Job(**values)
+        db.add(job)
+        db.commit()
+        return job
+
+    return _make
+
+
+@pytest.fixture
+def signup(client):
+    """Create an account; returns its ``Authorization`` headers."""
+
+    def _signup(email: str = "user@example.com", password: str = "secret-pw") -> dict:
+        response = client.post(
+            "/api/auth/signup",
+            json={"email": email, "password": password, "full_name": "Test User"},
+        )
+        assert response.status_code == 200, response.text
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    return _signup
@@ -0,0 +1,105 @@
+"""Login throttling, versioned password hashes and their settings."""
+
+import os
+
+import pytest
+from pydantic import ValidationError
+
+from app.config import Settings, settings
+from app.models import User
+from app.services import metrics
+from app.services.security import _pbkdf2, hash_password, needs_rehash, verify_password
+
+
+def _login(client, email="user@example.com", password="secret-pw"):
+    return client.post("/api/auth/login", json={"email": email, "password": password})
+
+
+def _hash_jobs() -> float:
+    return metrics.snapshot()["counters"].get("password_hash.jobs", 0)
+
+
+# ---------------------------------------------------------------------------
+# Throttling
+# ---------------------------------------------------------------------------
+def test_repeated_failures_lock_out_the_email_before_hashing(client, signup):
+    signup()
+    for _ in range(settings.LOGIN_MAX_FAILURES_PER_EMAIL):
+        assert _login(client, password="wrong").status_code == 401
+
+    hashed_before = _hash_jobs()
+    locked = _login(client)  # even the right password
+
+    assert locked.status_code == 429
+    assert int(locked.headers["Retry-After"]) > 0
+    assert _hash_jobs() == hashed_before
+
+
+def test_lockout_is_per_email(client, signup):
+    signup("a@example.com")
+    signup("b@example.com")
+    for _ in range(settings.LOGIN_MAX_FAILURES_PER_EMAIL):
+        _login(client, "a@example.com", "wrong")
+
+    assert _login(client, "a@example.com").status_code == 429
+    assert _login(client, "b@example.com").status_code == 200
+
+
+def test_success_clears_earlier_failures(client, signup):
+    signup()
+    for _ in range(settings.LOGIN_MAX_FAILURES_PER_EMAIL - 1):
+        _login(client, password="wrong")
+    assert _login(client).status_code == 200
+
+    assert _login(client, password="wrong").status_code == 401
+    assert _login(client).status_code == 200
+
+
+# ---------------------------------------------------------------------------
+# Password hashes
+# ---------------------------------------------------------------------------
+def test_every_stored_format_verifies():
+    salt = os.urandom(16)
+    legacy = f"{salt.hex()}:{_pbkdf2('pw', salt, 100_000).hex()}"
+
+    assert verify_password("pw", legacy)
+    assert verify_password("pw", hash_password("pw"))
+    assert not verify_password("other", legacy)
+    assert needs_rehash(legacy)
+    assert not needs_rehash(hash_password("pw"))
+
+
+def test_login_upgrades_an_outdated_hash(client, signup, db):
+    signup()
+    user = db.query(User).one()
+    salt = os.urandom(16)
+    user.hashed_password = f"{salt.hex()}:{_pbkdf2('secret-pw', salt, 100_000).hex()}"
+    db.commit()
+
+    assert _login(client).status_code == 200
+
+    db.expire_all()
+    upgraded = db.query(User).one().hashed_password
+    assert upgraded.startswith("pbkdf2_sha256$")
+    assert not needs_rehash(upgraded)
+    assert _login(client).status_code == 200
+
+
+def test_changing_the_target_cost_rehashes_on_login(client, signup, db, monkeypatch):
+    signup()
+    monkeypatch.setattr(settings, "PASSWORD_HASH_ALGORITHM", "scrypt")
+    monkeypatch.setattr(settings, "PASSWORD_SCRYPT_N", 2 ** 10)
+
+    assert _login(client).status_code == 200
+
+    assert db.query(User).one().hashed_password.startswith("scrypt$1024$")
+
+
+@pytest.mark.parametrize("field, value", [
+    ("PASSWORD_HASH_ALGORITHM", "bcrypt"),
+    ("PASSWORD_SCRYPT_N", 1),
+    ("PASSWORD_SCRYPT_N", 1000),
+])
+def test_invalid_hash_settings_are_rejected(field, value):
+    with pytest.raises(ValidationError):
+        Settings(**{field: value})
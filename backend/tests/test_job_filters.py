@@ -0,0 +1,59 @@
+"""Substring filters agree between SQL, the facet rollup and the read model."""
+
+import pytest
+
+from app.models import Job, JobFacetCount
+from app.routes.jobs import _filtered_jobs_query
+from app.services.job_facets import grouped_rows, rollup
+from app.services.job_snapshot import build_snapshot
+
+TITLES = ["100% Remote Dev", "Data_Analyst", "Dataxanalyst", "Ünïcode Dev", "ünïcode dev", "C:\\Tools"]
+NEEDLES = ["%", "_", "Data_", "100%", "ü", "Ü", "ÜNÏCODE", "dev", "\\", "c:\\t"]
+
+
+@pytest.fixture
+def jobs(db, make_job):
+    for title in TITLES:
+        make_job(title=title, category=title, company="Acme")
+    return build_snapshot(db, generation=1)
+
+
+def _sql_ids(db, **kwargs):
+    params = dict(category=None, experience=None, search=None, search_mode="like",
+                  platform=None, match="contains", collapse=False)
+    params.update(kwargs)
+    query, _ = _filtered_jobs_query(db, **params)
+    return {job.id for job in query}
+
+
+@pytest.mark.parametrize("needle", NEEDLES)
+def test_text_search_matches_sql(db, jobs, needle):
+    positions = jobs.search({}, search=needle)
+    assert {int(i) for i in jobs.ids[positions]} == _sql_ids(db, search=needle)
+
+
+@pytest.mark.parametrize("needle", NEEDLES)
+def test_contains_filter_matches_sql(db, jobs, needle):
+    expected = _sql_ids(db, category=needle)
+    positions = jobs.search({"category": needle})
+    assert {int(i) for i in jobs.ids[positions]} == expected
+
+    total, _ = rollup(grouped_rows(db.query(Job)), {"category": needle})
+    assert total == len(expected)
+
+
+def test_wildcards_are_literal(db, jobs):
+    assert len(_sql_ids(db, search="Data_")) == 1
+    assert len(_sql_ids(db, search="%")) == 1
+
+
+def test_facets_read_path_does_not_write_summary(db, make_job, client):
+    make_job(platform="Internshala")
+    make_job(platform="FreshersWorld")
+    make_job(platform="FreshersWorld")
+
+    body = client.get("/api/jobs/facets").json()
+
+    assert body["total"] == 3
+    assert {"value": "FreshersWorld", "count": 2} in body["platform"]
+    assert db.query(JobFacetCount).count() == 0
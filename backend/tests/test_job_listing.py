@@ -0,0 +1,92 @@
+"""GET /api/jobs: cursor pagination, ETag caching and the in-memory read model."""
+
+import pytest
+
+from app.config import settings
+from app.models import ScrapeStatus
+from app.services import job_snapshot
+from app.services.job_cache import publish_scrape
+
+
+@pytest.fixture
+def listing(db, make_job):
+    """Eleven jobs over two platforms, published as scrape generation 1."""
+    jobs = [
+        make_job(platform="FreshersWorld" if i % 3 == 0 else "Internshala",
+                 title=f"{'Python' if i % 2 else 'Java'} Developer {i}",
+                 cluster_id="c1" if i in (4, 7) else None)
+        for i in range(11)
+    ]
+    db.add(ScrapeStatus(id=1, status="completed", job_count=len(jobs)))
+    db.commit()
+    publish_scrape(1, len(jobs))
+    return jobs
+
+
+def _newest_first(jobs):
+    return [job.id for job in sorted(jobs, key=lambda j: (j.scraped_at, j.id), reverse=True)]
+
+
+def test_cursor_pages_cover_every_job_once(client, listing):
+    seen, cursor = [], None
+    while True:
+        params = {"pagination": "cursor", "per_page": 4}
+        if cursor:
+            params["cursor"] = cursor
+        body = client.get("/api/jobs", params=params).json()
+        seen += [job["id"] for job in body["jobs"]]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == _newest_first(listing)
+
+
+def test_malformed_cursor_is_rejected(client, listing):
+    assert client.get("/api/jobs", params={"cursor": "not-a-cursor"}).status_code == 400
+
+
+def test_etag_revalidation_skips_the_database(client, listing, monkeypatch):
+    monkeypatch.setattr(settings, "JOB_GENERATION_POLL_SECONDS", 60.0)
+    publish_scrape(1, len(listing))
+    first = client.get("/api/jobs", params={"per_page": 5})
+    etag = first.headers["ETag"]
+
+    again = client.get("/api/jobs", params={"per_page": 5}, headers={"If-None-Match": etag})
+
+    assert again.status_code == 304
+    assert again.headers["X-DB-Queries"] == "0"
+
+
+def test_new_scrape_changes_the_etag(client, db, listing):
+    etag = client.get("/api/jobs").headers["ETag"]
+    db.add(ScrapeStatus(id=2, status="completed", job_count=len(listing)))
+    db.commit()
+    publish_scrape(2, len(listing))
+
+    response = client.get("/api/jobs", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.parametrize("params", [
+    {},
+    {"platform": "fresh"},
+    {"platform": "Internshala", "match": "exact"},
+    {"search": "python"},
+    {"search": "java", "collapse": "true"},
+    {"collapse": "true", "per_page": 3, "page": 2},
+    {"pagination": "cursor", "per_page": 3},
+])
+def test_read_model_matches_sql(client, listing, monkeypatch, params):
+    monkeypatch.setattr(settings, "JOB_RESPONSE_CACHE_SIZE", 0)
+    params = {**params, "include_total": "true"}
+    from_sql = client.get("/api/jobs", params=params).json()
+
+    monkeypatch.setattr(settings, "JOB_READ_MODEL", True)
+    job_snapshot.refresh(1)
+    response = client.get("/api/jobs", params=params)
+
+    assert response.headers["X-DB-Queries"] == "1"  # the generation check only
+    assert response.json() == from_sql
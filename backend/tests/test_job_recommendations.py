@@ -0,0 +1,25 @@
+"""GET /api/jobs/recommended."""
+
+
+def test_ties_at_the_limit_prefer_newest_jobs(client, signup, make_job):
+    ids = [make_job(title="Python Developer", category="Software Development").id for _ in range(6)]
+    headers = signup()
+    client.post("/api/user_profile/skill_set/update", json={"skill_matrix": ["Python"]}, headers=headers)
+
+    body = client.get("/api/jobs/recommended?limit=3", headers=headers).json()
+
+    assert [job["id"] for job in body["jobs"]] == sorted(ids, reverse=True)[:3]
+    assert body["skills_used"] == ["Python"]
+
+
+def test_jobs_without_links_are_returned(client, signup, make_job):
+    job = make_job(title="Python Developer", link="")
+    headers = signup()
+    client.post("/api/user_profile/skill_set/update", json={"skill_matrix": ["Python"]}, headers=headers)
+
+    response = client.get("/api/jobs/recommended", headers=headers)
+
+    assert response.status_code == 200
+    [row] = response.json()["jobs"]
+    assert row["id"] == job.id and row["link"] == ""
+    assert row["matched_skills"] and row["score"] > 0
@@ -0,0 +1,51 @@
+"""Profile reads and partial updates."""
+
+import pytest
+
+
+def test_profile_page_costs_one_query(client, signup):
+    headers = signup()
+    client.get("/api/user_profile", headers=headers)  # warms the user cache
+
+    response = client.get("/api/user_profile", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["email"] == "user@example.com"
+    assert int(response.headers["X-DB-Queries"]) <= 1
+
+
+def test_patch_changes_only_the_fields_sent(client, signup):
+    headers = signup()
+
+    response = client.patch(
+        "/api/user_profile",
+        json={"location": "Pune", "skill_matrix": ["Python", "SQL"]},
+        headers=headers,
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["location"] == "Pune"
+    assert body["skill_matrix"] == ["Python", "SQL"]
+    assert body["full_name"] == "Test User"
+    assert client.get("/api/user_profile", headers=headers).json()["location"] == "Pune"
+
+
+@pytest.mark.parametrize("field", ["full_name", "target_role", "location", "github", "skill_matrix"])
+def test_patch_rejects_explicit_nulls(client, signup, field):
+    headers = signup()
+
+    response = client.patch("/api/user_profile", json={field: None}, headers=headers)
+
+    assert response.status_code == 422
+    assert client.get("/api/user_profile", headers=headers).status_code == 200
+
+
+def test_info_update_rejects_explicit_nulls(client, signup):
+    headers = signup()
+
+    response = client.post(
+        "/api/user_profile/personalInfo/update", json={"description": None}, headers=headers
+    )
+
+    assert response.status_code == 422
@@ -0,0 +1,107 @@
+"""Scrape lease: one scraper at a time, renewed while it runs, stoppable."""
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+import requests
+
+from app.database import SessionLocal
+from app.models import ScrapeLease, ScrapeStatus
+from app.services import scrape_scheduler
+from app.services.job_scraper import ScrapeCancelled, scrape_and_store_jobs
+from app.services.scrape_scheduler import (
+    LEASE_NAME,
+    ensure_lease_row,
+    fail_orphaned_scrapes,
+    renew_lease,
+    try_acquire_lease,
+)
+
+
+@pytest.fixture
+def lease(db):
+    row = ensure_lease_row(db)
+    row.next_run_at = datetime.utcnow() - timedelta(minutes=1)
+    db.commit()
+    return row
+
+
+def test_only_one_worker_wins_the_lease(lease):
+    barrier = threading.Barrier(8)
+    results = []
+
+    def claim():
+        with SessionLocal() as session:
+            barrier.wait()
+            results.append(try_acquire_lease(session, datetime.utcnow()))
+
+    threads = [threading.Thread(target=claim) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(results) == [False] * 7 + [True]
+
+
+def test_lease_is_not_claimed_before_the_next_run(db, lease):
+    lease.next_run_at = datetime.utcnow() + timedelta(hours=1)
+    db.commit()
+
+    assert not try_acquire_lease(db, datetime.utcnow())
+    assert try_acquire_lease(db, datetime.utcnow(), due_only=False)
+
+
+def test_renewal_extends_the_lease_until_it_is_lost(db, lease):
+    now = datetime.utcnow()
+    assert try_acquire_lease(db, now)
+    first_expiry = db.get(ScrapeLease, LEASE_NAME).expires_at
+
+    assert renew_lease(db, now + timedelta(minutes=30))
+    db.expire_all()
+    assert db.get(ScrapeLease, LEASE_NAME).expires_at > first_expiry
+
+    db.get(ScrapeLease, LEASE_NAME).holder = "another-worker"
+    db.commit()
+    assert not renew_lease(db, now)
+    with pytest.raises(ScrapeCancelled):
+        scrape_scheduler._checkpoint()
+
+
+def test_checkpoint_stops_on_shutdown(db, lease):
+    assert try_acquire_lease(db, datetime.utcnow())
+    scrape_scheduler._stop_event.set()
+    try:
+        with pytest.raises(ScrapeCancelled):
+            scrape_scheduler._checkpoint()
+    finally:
+        scrape_scheduler._stop_event.clear()
+
+
+def test_cancelled_scrape_is_marked_failed(db):
+    def cancel():
+        raise ScrapeCancelled("stopping")
+
+    with requests.Session() as http:
+        status = scrape_and_store_jobs(db, session=http, checkpoint=cancel)
+
+    assert status.status == "failed"
+    assert status.error_message == "stopping"
+
+
+def test_new_lease_holder_fails_orphaned_runs(db):
+    db.add(ScrapeStatus(status="running"))
+    db.add(ScrapeStatus(status="completed"))
+    db.commit()
+
+    assert fail_orphaned_scrapes(db, datetime.utcnow()) == 1
+    assert [s.status for s in db.query(ScrapeStatus).order_by(ScrapeStatus.id)] == ["failed", "completed"]
+
+
+def test_refresh_is_rejected_while_the_lease_is_held(client, db, lease):
+    lease.holder = "another-worker"
+    lease.expires_at = datetime.utcnow() + timedelta(hours=1)
+    db.commit()
+
+    assert client.post("/api/jobs/refresh").status_code == 409